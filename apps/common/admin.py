@@ -0,0 +1,10 @@
+from django.contrib import admin
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ['id', 'command', 'status', 'attempts', 'created_at', 'started_at', 'finished_at']
+    list_filter = ['status', 'command']
+    search_fields = ['command']
+    readonly_fields = ['attempts', 'started_at', 'finished_at', 'output', 'error_message', 'created_at', 'modified_at']
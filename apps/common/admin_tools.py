@@ -1,10 +1,16 @@
 from django.contrib import admin, messages
 from django.apps import apps
-from django.core.management import call_command, get_commands, load_command_class
+from django.core.management import get_commands, load_command_class
 from django.http import HttpResponseRedirect
 from django.template.response import TemplateResponse
 from django.urls import reverse
 
+from .models import Job
+from .services import JobQueueService
+
+# The worker consumes the queue, so it can't be queued itself
+NON_QUEUEABLE_COMMANDS = {"run_job_worker"}
+
 
 def _discover_project_commands():
     project_app_names = {
@@ -18,7 +24,7 @@ def _discover_project_commands():
     for command_name, app_label in sorted(command_registry.items()):
         if app_label not in project_app_names:
             continue
-        if command_name.startswith("_"):
+        if command_name.startswith("_") or command_name in NON_QUEUEABLE_COMMANDS:
             continue
 
         description = ""
@@ -47,12 +53,11 @@ def commands_page(request):
         command_name = request.POST.get("command")
 
         if command_name in discovered_command_names:
-            try:
-                call_command(command_name)
-            except Exception as exc:
-                messages.error(request, f"Failed to run '{command_name}': {exc}")
-            else:
-                messages.success(request, f"Command '{command_name}' executed successfully.")
+            job = JobQueueService.enqueue(command_name)
+            messages.success(
+                request,
+                f"Command '{command_name}' queued as job #{job.pk}; it runs when a job worker picks it up.",
+            )
         else:
             messages.warning(request, "Unknown command requested.")
 
@@ -62,5 +67,6 @@ def commands_page(request):
         **admin.site.each_context(request),
         "title": "Commands",
         "commands": discovered_commands,
+        "recent_jobs": Job.objects.order_by("-created_at")[:20],
     }
     return TemplateResponse(request, "admin/tools/commands.html", context)
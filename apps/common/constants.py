@@ -8,3 +8,10 @@ class LanguageCodeTypes(models.TextChoices):
     CROATIAN = "hr"
     GERMAN = "de"
     SPANISH = "es"
+
+
+class JobStatus(models.TextChoices):
+    QUEUED = "queued", "Queued"
+    RUNNING = "running", "Running"
+    SUCCEEDED = "succeeded", "Succeeded"
+    FAILED = "failed", "Failed"
@@ -0,0 +1,58 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.common.constants import JobStatus
+from apps.common.services import JobQueueService
+
+
+class Command(BaseCommand):
+    help = "Run queued jobs (e.g. PDF pipeline runs) from the database job queue."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Run the jobs currently queued and exit instead of polling.',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=5.0,
+            help='Seconds to wait between polls when the queue is empty (default: 5).',
+        )
+        parser.add_argument(
+            '--max-jobs',
+            type=int,
+            default=None,
+            help='Exit after running this many jobs.',
+        )
+
+    def handle(self, *args, **options):
+        poll_interval = options['poll_interval']
+        max_jobs = options['max_jobs']
+
+        if poll_interval <= 0:
+            raise CommandError('--poll-interval must be positive.')
+        if max_jobs is not None and max_jobs < 1:
+            raise CommandError('--max-jobs must be a positive integer.')
+
+        processed = 0
+        while max_jobs is None or processed < max_jobs:
+            job = JobQueueService.claim_next()
+            if job is None:
+                if options['once']:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            self.stdout.write(f"Running job {job.pk}: {job.command}")
+            JobQueueService.run_job(job)
+            processed += 1
+
+            if job.status == JobStatus.SUCCEEDED:
+                self.stdout.write(self.style.SUCCESS(f"Job {job.pk} succeeded."))
+            else:
+                self.stdout.write(self.style.ERROR(f"Job {job.pk} failed: {job.error_message}"))
+
+        self.stdout.write(f"Processed {processed} job(s).")
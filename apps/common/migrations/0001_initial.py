@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('modified_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(editable=False, null=True)),
+                ('command', models.CharField(max_length=100)),
+                ('arguments', models.JSONField(blank=True, default=dict, help_text='Keyword options passed to call_command')),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('succeeded', 'Succeeded'), ('failed', 'Failed')], db_index=True, default='queued', max_length=20)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('output', models.TextField(blank=True)),
+                ('error_message', models.TextField(blank=True)),
+            ],
+            options={
+                'db_table': 'common_job',
+                'ordering': ['created_at'],
+            },
+        ),
+    ]
@@ -1,5 +1,7 @@
 from django.db import models
 
+from .constants import JobStatus
+
 
 class BaseModel(models.Model):
     """Base Class from which all classes must inherit."""
@@ -10,3 +12,26 @@ class BaseModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class Job(BaseModel):
+    """A management command queued for execution by the run_job_worker command."""
+
+    command = models.CharField(max_length=100)
+    arguments = models.JSONField(default=dict, blank=True, help_text="Keyword options passed to call_command")
+    status = models.CharField(max_length=20, choices=JobStatus.choices, default=JobStatus.QUEUED, db_index=True)
+    attempts = models.PositiveIntegerField(default=0)
+    started_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(
+        null=True, blank=True, help_text="Last time the worker running the job reported it alive"
+    )
+    finished_at = models.DateTimeField(null=True, blank=True)
+    output = models.TextField(blank=True)
+    error_message = models.TextField(blank=True)
+
+    class Meta:
+        db_table = "common_job"
+        ordering = ["created_at"]
+
+    def __str__(self):
+        return f"{self.command} #{self.pk} - {self.status}"
@@ -0,0 +1,155 @@
+import io
+import logging
+import threading
+from datetime import timedelta
+from typing import Any, Optional, Tuple
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import DatabaseError, connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .constants import JobStatus
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueueService:
+    """Table-backed job queue: enqueue management commands and run them in a worker."""
+
+    @staticmethod
+    def enqueue(command: str, **arguments: Any) -> Job:
+        """
+        Queue a management command for the worker.
+
+        Args:
+            command: Management command name
+            **arguments: Keyword options passed to call_command
+
+        Returns:
+            The queued Job
+        """
+        return Job.objects.create(command=command, arguments=arguments)
+
+    @staticmethod
+    def recover_stale() -> Tuple[int, int]:
+        """
+        Requeue or fail jobs left running by a worker that stopped.
+
+        A running job whose worker has not bumped its heartbeat for
+        settings.JOB_STALE_AFTER_SECONDS is queued again, unless it has
+        already been claimed JOB_MAX_ATTEMPTS times; then it is marked failed.
+        Jobs that run long but keep their heartbeat fresh are left alone.
+
+        Returns:
+            Tuple of (requeued, failed) job counts
+        """
+        stale_after = timedelta(seconds=getattr(settings, 'JOB_STALE_AFTER_SECONDS', 3600))
+        max_attempts = getattr(settings, 'JOB_MAX_ATTEMPTS', 3)
+        now = timezone.now()
+        cutoff = now - stale_after
+        requeued = failed = 0
+
+        with transaction.atomic():
+            stale_jobs = (
+                Job.objects
+                .select_for_update(skip_locked=True)
+                .filter(status=JobStatus.RUNNING)
+                .filter(Q(heartbeat_at__lt=cutoff) | Q(heartbeat_at__isnull=True, started_at__lt=cutoff))
+            )
+            for job in stale_jobs:
+                if job.attempts < max_attempts:
+                    logger.warning('Requeueing stale job %s (%s) after attempt %s', job.pk, job.command, job.attempts)
+                    job.status = JobStatus.QUEUED
+                    job.started_at = job.heartbeat_at = None
+                    job.save(update_fields=['status', 'started_at', 'heartbeat_at', 'modified_at'])
+                    requeued += 1
+                else:
+                    logger.error('Job %s (%s) stalled on its last attempt', job.pk, job.command)
+                    job.status = JobStatus.FAILED
+                    job.error_message = f'Worker stopped responding; gave up after {job.attempts} attempt(s).'
+                    job.finished_at = now
+                    job.save(update_fields=['status', 'error_message', 'finished_at', 'modified_at'])
+                    failed += 1
+        return requeued, failed
+
+    @staticmethod
+    def claim_next() -> Optional[Job]:
+        """
+        Lock the oldest queued job and mark it running.
+
+        Rows locked by other workers are skipped, so several workers can poll
+        the same table without running a job twice. Stale running jobs are
+        recovered first (see recover_stale).
+
+        Returns:
+            The claimed Job, or None if the queue is empty
+        """
+        JobQueueService.recover_stale()
+        with transaction.atomic():
+            job = (
+                Job.objects
+                .select_for_update(skip_locked=True)
+                .filter(status=JobStatus.QUEUED)
+                .order_by('created_at', 'pk')
+                .first()
+            )
+            if job is None:
+                return None
+
+            job.status = JobStatus.RUNNING
+            job.attempts += 1
+            job.started_at = job.heartbeat_at = timezone.now()
+            job.save(update_fields=['status', 'attempts', 'started_at', 'heartbeat_at', 'modified_at'])
+        return job
+
+    @staticmethod
+    def run_job(job: Job) -> Job:
+        """
+        Run a claimed job and store its output and final status.
+
+        Command failures are recorded on the job, not raised. While the
+        command runs, a background thread bumps the job's heartbeat every
+        settings.JOB_HEARTBEAT_INTERVAL_SECONDS so recover_stale does not
+        hand it to another worker.
+        """
+        interval = getattr(settings, 'JOB_HEARTBEAT_INTERVAL_SECONDS', 60)
+        stop_heartbeat = threading.Event()
+        heartbeat = threading.Thread(
+            target=_send_heartbeats, args=(job.pk, stop_heartbeat, interval), name=f'job-{job.pk}-heartbeat', daemon=True
+        )
+        heartbeat.start()
+
+        stdout = io.StringIO()
+        try:
+            call_command(job.command, stdout=stdout, **job.arguments)
+        except Exception as exc:
+            logger.exception('Job %s (%s) failed', job.pk, job.command)
+            job.status = JobStatus.FAILED
+            job.error_message = str(exc)
+        else:
+            job.status = JobStatus.SUCCEEDED
+            job.error_message = ''
+        finally:
+            stop_heartbeat.set()
+            heartbeat.join()
+
+        job.output = stdout.getvalue()
+        job.finished_at = timezone.now()
+        job.save(update_fields=['status', 'error_message', 'output', 'finished_at', 'modified_at'])
+        return job
+
+
+def _send_heartbeats(job_pk: int, stop: threading.Event, interval: float) -> None:
+    """Bump heartbeat_at of a running job every interval seconds until stop is set."""
+    try:
+        while not stop.wait(interval):
+            try:
+                Job.objects.filter(pk=job_pk, status=JobStatus.RUNNING).update(heartbeat_at=timezone.now())
+            except DatabaseError:
+                logger.exception('Could not record the heartbeat of job %s', job_pk)
+    finally:
+        # The thread has its own connection; don't leave it open
+        connection.close()
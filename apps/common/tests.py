@@ -0,0 +1,107 @@
+import pytest
+
+from .constants import JobStatus
+from .models import Job
+from .services import JobQueueService
+
+
+@pytest.mark.django_db
+def test_claim_next_takes_oldest_queued_job():
+    first = JobQueueService.enqueue('check')
+    JobQueueService.enqueue('check')
+    Job.objects.create(command='check', status=JobStatus.SUCCEEDED)
+
+    job = JobQueueService.claim_next()
+
+    assert job.pk == first.pk
+    assert job.status == JobStatus.RUNNING
+    assert job.attempts == 1
+    assert job.started_at is not None
+
+
+@pytest.mark.django_db
+def test_claim_next_returns_none_for_empty_queue():
+    assert JobQueueService.claim_next() is None
+
+
+@pytest.mark.django_db
+def test_run_job_records_success_and_failure():
+    succeeded = JobQueueService.run_job(JobQueueService.enqueue('check'))
+    failed = JobQueueService.run_job(JobQueueService.enqueue('does_not_exist'))
+
+    succeeded.refresh_from_db()
+    failed.refresh_from_db()
+    assert succeeded.status == JobStatus.SUCCEEDED
+    assert 'no issues' in succeeded.output
+    assert succeeded.finished_at is not None
+    assert failed.status == JobStatus.FAILED
+    assert 'does_not_exist' in failed.error_message
+
+
+@pytest.mark.django_db
+def test_stale_running_jobs_are_requeued_until_attempts_run_out(settings):
+    from datetime import timedelta
+    from django.utils import timezone
+
+    settings.JOB_STALE_AFTER_SECONDS = 60
+    settings.JOB_MAX_ATTEMPTS = 2
+    long_ago = timezone.now() - timedelta(minutes=5)
+    retried = Job.objects.create(command='check', status=JobStatus.RUNNING, attempts=1, started_at=long_ago)
+    exhausted = Job.objects.create(command='check', status=JobStatus.RUNNING, attempts=2, started_at=long_ago)
+    running = Job.objects.create(command='check', status=JobStatus.RUNNING, attempts=1, started_at=timezone.now())
+
+    job = JobQueueService.claim_next()
+
+    assert job.pk == retried.pk
+    assert job.attempts == 2
+    exhausted.refresh_from_db()
+    running.refresh_from_db()
+    assert exhausted.status == JobStatus.FAILED
+    assert 'after 2 attempt' in exhausted.error_message
+    assert exhausted.finished_at is not None
+    assert running.status == JobStatus.RUNNING
+
+
+@pytest.mark.django_db
+def test_long_running_job_with_fresh_heartbeat_is_not_recovered(settings):
+    from datetime import timedelta
+    from django.utils import timezone
+
+    settings.JOB_STALE_AFTER_SECONDS = 60
+    now = timezone.now()
+    job = Job.objects.create(
+        command='check', status=JobStatus.RUNNING, attempts=1, started_at=now - timedelta(hours=3), heartbeat_at=now
+    )
+
+    assert JobQueueService.recover_stale() == (0, 0)
+    job.refresh_from_db()
+    assert job.status == JobStatus.RUNNING
+
+
+@pytest.mark.django_db(transaction=True)
+def test_run_job_heartbeat_keeps_long_job_from_being_stolen(settings, monkeypatch):
+    import time
+    from django.db import DEFAULT_DB_ALIAS, connection, connections
+    from apps.common import services
+
+    # The heartbeat thread opens its own connection; point it at the test database
+    monkeypatch.setitem(connections.settings, DEFAULT_DB_ALIAS, connection.settings_dict)
+    settings.JOB_HEARTBEAT_INTERVAL_SECONDS = 0.05
+    settings.JOB_STALE_AFTER_SECONDS = 0.5
+    JobQueueService.enqueue('check')
+    job = JobQueueService.claim_next()
+    stolen = []
+
+    def long_command(*args, **kwargs):
+        # Outlive JOB_STALE_AFTER_SECONDS, then poll as a second worker would
+        time.sleep(1)
+        stolen.append(JobQueueService.claim_next())
+
+    monkeypatch.setattr(services, 'call_command', long_command)
+    JobQueueService.run_job(job)
+
+    job.refresh_from_db()
+    assert stolen == [None]
+    assert job.status == JobStatus.SUCCEEDED
+    assert job.attempts == 1
+    assert job.heartbeat_at > job.started_at
@@ -1,7 +1,30 @@
+import re
+
 import django_filters
-from django.db.models import Q
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, TrigramSimilarity
+from django.db import connections
+from django.db.models import F, Func, Q, TextField, Value
+from django.db.models.functions import Lower
+from rest_framework import filters
+from rest_framework.settings import api_settings
+
+from apps.locations.models import Location
+
+from .models import Branch, Company
+
+# Text search configuration and unaccent wrapper created by the company search migration
+SEARCH_CONFIG = "companies_search"
+
+
+class Unaccent(Func):
+    """Strip diacritics (č, ć, đ, š, ž) with the immutable wrapper the trigram indexes are built on."""
+    function = "companies_unaccent"
+    output_field = TextField()
+
+
+def normalized(expression):
+    return Unaccent(Lower(expression))
 
-from .models import Company
 
 class CompanyFilter(django_filters.FilterSet):
     country = django_filters.CharFilter(field_name="branches__location__country__country_code", lookup_expr="icontains")
@@ -17,20 +40,81 @@ class CompanyFilter(django_filters.FilterSet):
 
     def filter_by_location(self, queryset, name, value):
         """
-        Custom filter to search by location. It filters by name and any parent location recursively.
+        Custom filter to search by location. It matches branches in any location
+        whose name matches, or in any location below one, by its stored path.
         """
-        return queryset.filter(
-            Q(branches__location__name__icontains=value) |
-            Q(branches__location__parent__name__icontains=value) |
-            Q(branches__location__parent__parent__name__icontains=value) |
-            Q(branches__location__parent__parent__parent__name__icontains=value) |
-            Q(branches__location__parent__parent__parent__parent__name__icontains=value) |
-            Q(branches__location__parent__parent__parent__parent__parent__name__icontains=value)
-        )
+        paths = sorted(Location.objects.filter(name__icontains=value).values_list("path", flat=True))
+        if not paths:
+            return queryset.none()
+
+        # A path under another matched path is already covered by it
+        roots = []
+        for path in paths:
+            if not roots or not path.startswith(roots[-1]):
+                roots.append(path)
+
+        condition = Q()
+        for path in roots:
+            condition |= Q(branches__location__path__startswith=path)
+        return queryset.filter(condition)
 
     def filter_queryset(self, queryset):
         """
         Override filter_queryset to ensure distinct results when filtering by country.
         """
         queryset = super().filter_queryset(queryset)
-        return queryset.distinct()
\ No newline at end of file
+        return queryset.distinct()
+
+
+class CompanySearchFilter(filters.SearchFilter):
+    """
+    Search companies by display name, legal name, OIB and branch names.
+
+    On PostgreSQL, matches use the full-text and trigram indexes and ignore
+    diacritics, and results are ranked by relevance unless an ordering is
+    requested. Other databases fall back to icontains over search_fields.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        if connections[queryset.db].vendor != "postgresql":
+            return super().filter_queryset(request, queryset, view)
+
+        words = [word for term in self.get_search_terms(request) for word in re.findall(r"\w+", term)]
+        if not words:
+            return queryset
+
+        # Every word matches as a prefix, so results follow the search box as the user types
+        query = SearchQuery(" & ".join(f"{word}:*" for word in words), config=SEARCH_CONFIG, search_type="raw")
+        term = normalized(Value(" ".join(words)))
+        search_aliases = {
+            "search_document": SearchVector("display_name", "legal_name", "legal_id", config=SEARCH_CONFIG),
+            "search_name": normalized("display_name"),
+            "search_legal_name": normalized("legal_name"),
+        }
+
+        # A union keeps each side on its own index, where an OR across the branch join would not
+        matches = (
+            Company.objects.alias(**search_aliases)
+            .filter(
+                Q(search_document=query)
+                | Q(search_name__contains=term)
+                | Q(search_name__trigram_similar=term)
+                | Q(search_legal_name__contains=term)
+            )
+            .values("pk")
+            .union(
+                Branch.objects.alias(search_name=normalized("name"))
+                .filter(Q(search_name__contains=term) | Q(search_name__trigram_similar=term))
+                .values("company_id")
+            )
+        )
+
+        queryset = (
+            queryset.alias(**search_aliases)
+            .filter(pk__in=matches)
+            .annotate(search_rank=SearchRank(F("search_document"), query) + TrigramSimilarity("search_name", term))
+        )
+
+        if request.query_params.get(api_settings.ORDERING_PARAM):
+            return queryset
+        return queryset.order_by("-search_rank", *queryset.query.order_by)
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from apps.companies.models import Company
+
+
+class Command(BaseCommand):
+    help = "Recompute every company's rating histogram, review count and average rating from its reviews."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--company-id',
+            type=int,
+            action='append',
+            dest='company_ids',
+            help='Only rebuild this company (repeatable).',
+        )
+
+    def handle(self, *args, **options):
+        rebuilt = Company.rebuild_ratings(company_ids=options['company_ids'])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt ratings of {rebuilt} reviewed company(ies)."))
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:17
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def fill_rating_histograms(apps, schema_editor):
+    Company = apps.get_model('companies', 'Company')
+    fields = {rating: f'rating_{rating}_count' for rating in range(1, 6)}
+    histograms = (
+        Company.objects.filter(reviews__isnull=False)
+        .values('pk')
+        .annotate(**{
+            field: Count('reviews', filter=Q(reviews__rating=rating))
+            for rating, field in fields.items()
+        })
+    )
+    companies = [Company(pk=row.pop('pk'), **row) for row in histograms]
+    Company.objects.bulk_update(companies, list(fields.values()), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0012_alter_company_category_alter_company_description'),
+        ('reviews', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='rating_1_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='rating_2_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='rating_3_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='rating_4_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='rating_5_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_rating_histograms, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:18
+
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def fill_reviews_rating_sum(apps, schema_editor):
+    Company = apps.get_model('companies', 'Company')
+    sums = Company.objects.filter(reviews__isnull=False).values('pk').annotate(reviews_rating_sum=Sum('reviews__rating'))
+    companies = [Company(pk=row['pk'], reviews_rating_sum=row['reviews_rating_sum']) for row in sums]
+    Company.objects.bulk_update(companies, ['reviews_rating_sum'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0013_company_rating_histogram'),
+        ('reviews', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='reviews_rating_sum',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_reviews_rating_sum, migrations.RunPython.noop),
+    ]
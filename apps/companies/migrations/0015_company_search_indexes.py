@@ -0,0 +1,65 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:24
+
+from django.contrib.postgres.operations import TrigramExtension, UnaccentExtension
+from django.db import migrations
+
+# unaccent() is only STABLE, so indexes use an IMMUTABLE wrapper around it
+CREATE_SEARCH_OBJECTS = [
+    """
+    CREATE OR REPLACE FUNCTION companies_unaccent(text) RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+    AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+    """,
+    "CREATE TEXT SEARCH CONFIGURATION companies_search (COPY = pg_catalog.simple)",
+    """
+    ALTER TEXT SEARCH CONFIGURATION companies_search
+    ALTER MAPPING FOR hword, hword_part, word WITH public.unaccent, simple
+    """,
+    """
+    CREATE INDEX company_search_document_idx ON companies_company USING gin (
+        to_tsvector(
+            'companies_search'::regconfig,
+            COALESCE(display_name, '') || ' ' || COALESCE(legal_name, '') || ' ' || COALESCE(legal_id, '')
+        )
+    )
+    """,
+    "CREATE INDEX company_display_name_trgm_idx ON companies_company USING gin (companies_unaccent(lower(display_name)) gin_trgm_ops)",
+    "CREATE INDEX company_legal_name_trgm_idx ON companies_company USING gin (companies_unaccent(lower(legal_name)) gin_trgm_ops)",
+    "CREATE INDEX branch_name_trgm_idx ON companies_branch USING gin (companies_unaccent(lower(name)) gin_trgm_ops)",
+]
+
+DROP_SEARCH_OBJECTS = [
+    "DROP INDEX IF EXISTS branch_name_trgm_idx",
+    "DROP INDEX IF EXISTS company_legal_name_trgm_idx",
+    "DROP INDEX IF EXISTS company_display_name_trgm_idx",
+    "DROP INDEX IF EXISTS company_search_document_idx",
+    "DROP TEXT SEARCH CONFIGURATION IF EXISTS companies_search",
+    "DROP FUNCTION IF EXISTS companies_unaccent(text)",
+]
+
+
+def create_search_objects(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for statement in CREATE_SEARCH_OBJECTS:
+        schema_editor.execute(statement)
+
+
+def drop_search_objects(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for statement in DROP_SEARCH_OBJECTS:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0014_company_reviews_rating_sum'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        UnaccentExtension(),
+        migrations.RunPython(create_search_objects, drop_search_objects),
+    ]
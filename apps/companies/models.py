@@ -1,7 +1,9 @@
 from random import random
 
 from cloudinary.models import CloudinaryField
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Avg, Case, Count, F, FloatField, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Cast, Coalesce
 from django.contrib.auth import get_user_model
 from django.contrib.auth.validators import UnicodeUsernameValidator
 from django.core.exceptions import ValidationError
@@ -16,6 +18,18 @@ from .utils import clean_display_name
 
 User = get_user_model()
 
+# Company column counting the reviews with each star rating
+RATING_COUNT_FIELDS = {
+    1: "rating_1_count",
+    2: "rating_2_count",
+    3: "rating_3_count",
+    4: "rating_4_count",
+    5: "rating_5_count",
+}
+
+# Company columns derived from its reviews
+RATING_FIELDS = ["reviews_rating", "reviews_count", "reviews_rating_sum", *RATING_COUNT_FIELDS.values()]
+
 
 class Company(BaseModel):
 
@@ -34,6 +48,13 @@ class Company(BaseModel):
     # locations = models.ManyToManyField("locations.Location", through="Branch", related_name="companies", blank=True)
     reviews_rating = models.FloatField(default=0, editable=False)
     reviews_count = models.IntegerField(default=0, editable=False)
+    # Running sum of review ratings and rating histogram, kept up to date by the review signals
+    reviews_rating_sum = models.IntegerField(default=0, editable=False)
+    rating_1_count = models.PositiveIntegerField(default=0, editable=False)
+    rating_2_count = models.PositiveIntegerField(default=0, editable=False)
+    rating_3_count = models.PositiveIntegerField(default=0, editable=False)
+    rating_4_count = models.PositiveIntegerField(default=0, editable=False)
+    rating_5_count = models.PositiveIntegerField(default=0, editable=False)
     blacklisted_at = models.DateTimeField(null=True, blank=True)
     last_blacklisted_at = models.DateTimeField(null=True, blank=True)
     is_certified = models.BooleanField(default=False)
@@ -42,45 +63,104 @@ class Company(BaseModel):
         verbose_name_plural = "Companies"
 
     def save(self, *args, **kwargs):
+        self.populate_names()
+        super().save(*args, **kwargs)
+
+    def populate_names(self):
+        """Derive display_name and id_name the way save() does, for bulk inserts."""
         # Clean the display_name by removing common suffixes and descriptors
         if self.display_name:
             self.display_name = clean_display_name(self.display_name)
         if not self.id_name:
             self.id_name = slugify(self.display_name + str(int(random()*10**12)))
-        super().save(*args, **kwargs)
 
     def update_rating(self):
-        reviews = self.reviews.all()
-        total_reviews = reviews.count()
+        """Recompute this company's rating columns from its reviews and reload them."""
+        type(self).rebuild_ratings(company_ids=[self.pk])
+        self.refresh_from_db(fields=RATING_FIELDS)
 
-        if total_reviews > 0:
-            self.reviews_rating = sum(review.rating for review in reviews) / total_reviews
-            self.reviews_count = total_reviews
-        else:
-            self.reviews_rating = 0
-            self.reviews_count = 0
+    @classmethod
+    def apply_review_change(cls, company_id, removed_rating=None, added_rating=None):
+        """
+        Apply one review's change to the company's rating columns in a single UPDATE.
+
+        Pass removed_rating for a deleted review, added_rating for a new one,
+        or both when a review's rating changes. Count, running sum, average
+        and histogram are computed from the stored values by the database,
+        so concurrent reviews of the same company cannot overwrite each other.
+        """
+        if removed_rating == added_rating:
+            return
+        count_delta = (added_rating is not None) - (removed_rating is not None)
+        sum_delta = (added_rating or 0) - (removed_rating or 0)
+
+        rating_sum = F("reviews_rating_sum") + sum_delta
+        reviews_count = F("reviews_count") + count_delta
+        changes = {
+            "reviews_count": reviews_count,
+            "reviews_rating_sum": rating_sum,
+            "reviews_rating": Case(
+                When(reviews_count__gt=-count_delta, then=Cast(rating_sum, FloatField()) / reviews_count),
+                default=Value(0.0),
+                output_field=FloatField(),
+            ),
+            "modified_at": timezone.now(),
+        }
+        if removed_rating in RATING_COUNT_FIELDS:
+            field = RATING_COUNT_FIELDS[removed_rating]
+            changes[field] = F(field) - 1
+        if added_rating in RATING_COUNT_FIELDS:
+            field = RATING_COUNT_FIELDS[added_rating]
+            changes[field] = F(field) + 1
 
-        self.save()
+        cls.objects.filter(pk=company_id).update(**changes)
+
+    @classmethod
+    def rebuild_ratings(cls, company_ids=None):
+        """
+        Recompute the rating columns (histogram, count, sum and average) of
+        all (or the given) companies from their reviews.
+
+        The reviews are aggregated by correlated subqueries of the UPDATE that
+        writes them, so no review can land between reading and writing; a
+        concurrent review's own UPDATE waits for the row lock and applies on top.
+
+        Returns:
+            Number of companies with at least one review
+        """
+        queryset = cls.objects.all()
+        if company_ids is not None:
+            queryset = queryset.filter(pk__in=company_ids)
+
+        reviews = (
+            cls._meta.get_field("reviews").related_model.objects
+            .filter(company=OuterRef("pk"))
+            .order_by()
+            .values("company")
+        )
+
+        def aggregate(expression, default):
+            return Coalesce(
+                Subquery(reviews.annotate(value=expression).values("value"), output_field=default.output_field),
+                default,
+            )
+
+        with transaction.atomic():
+            queryset.update(
+                reviews_rating=aggregate(Avg("rating"), Value(0.0, output_field=FloatField())),
+                reviews_count=aggregate(Count("pk"), Value(0, output_field=models.IntegerField())),
+                reviews_rating_sum=aggregate(Sum("rating"), Value(0, output_field=models.IntegerField())),
+                **{
+                    field: aggregate(Count("pk", filter=Q(rating=rating)), Value(0, output_field=models.IntegerField()))
+                    for rating, field in RATING_COUNT_FIELDS.items()
+                },
+                modified_at=timezone.now(),
+            )
+            return queryset.filter(reviews_count__gt=0).count()
 
     @property
     def rating_summary(self):
-        reviews = self.reviews
-        result = {
-            1: 0,
-            2: 0,
-            3: 0,
-            4: 0,
-            5: 0,
-            # "count": self.reviews.count(),
-            # "media": None,
-        }
-        # total = 0
-        for review in reviews.all():
-            # total += review.rating
-            result[review.rating] += 1
-        # if self.reviews.count():
-        #     result["media"] = total/self.reviews.count()
-        return result
+        return {rating: getattr(self, field) for rating, field in RATING_COUNT_FIELDS.items()}
 
     def __str__(self):
         return self.display_name
@@ -107,7 +107,8 @@ class CompanySerializer(serializers.ModelSerializer):
         return None
 
     def get_primary_location(self, obj):
-        branch = obj.branches.filter(is_primary=True).first()
+        # Read from the (prefetched) branches instead of filtering in the database
+        branch = next((branch for branch in obj.branches.all() if branch.is_primary), None)
         return str(branch.location) if branch else None
 
     # def get_admins(self, obj):
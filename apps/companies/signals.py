@@ -2,8 +2,48 @@ from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from apps.reviews.models import Review
 
+from .models import RATING_FIELDS, Company
+
+
+def _refresh_loaded_company(review):
+    """Reload the rating columns of the review's cached company, if any."""
+    if Review.company.is_cached(review):
+        try:
+            review.company.refresh_from_db(fields=RATING_FIELDS)
+        except Company.DoesNotExist:
+            # The review was deleted along with its company
+            pass
+
 
 @receiver(post_save, sender=Review)
+def update_company_rating(sender, instance, created, **kwargs):
+    loaded_company_id = getattr(instance, "_loaded_company_id", None)
+    loaded_rating = getattr(instance, "_loaded_rating", None)
+
+    if created:
+        Company.apply_review_change(instance.company_id, added_rating=instance.rating)
+    elif loaded_company_id is None:
+        # Updated without being loaded from the database: the old rating is unknown
+        Company.rebuild_ratings(company_ids=[instance.company_id])
+    elif loaded_company_id != instance.company_id:
+        Company.apply_review_change(loaded_company_id, removed_rating=loaded_rating)
+        Company.apply_review_change(instance.company_id, added_rating=instance.rating)
+    else:
+        Company.apply_review_change(
+            instance.company_id,
+            removed_rating=loaded_rating,
+            added_rating=instance.rating,
+        )
+
+    instance._loaded_rating = instance.rating
+    instance._loaded_company_id = instance.company_id
+    _refresh_loaded_company(instance)
+
+
 @receiver(post_delete, sender=Review)
-def update_company_rating(sender, instance, **kwargs):
-    instance.company.update_rating()
\ No newline at end of file
+def remove_company_rating(sender, instance, **kwargs):
+    Company.apply_review_change(
+        getattr(instance, "_loaded_company_id", None) or instance.company_id,
+        removed_rating=getattr(instance, "_loaded_rating", instance.rating),
+    )
+    _refresh_loaded_company(instance)
@@ -6,7 +6,7 @@ from .utils import clean_display_name
 from apps.reviews.models import Review
 from apps.users.models import CustomUser
 from apps.locations.constants import BusinessRegionTypes, RegionTypes, SubRegionTypes
-from apps.locations.models import Country, Location
+from apps.locations.models import Address, Country, Location
 from django.core.exceptions import ValidationError
 
 
@@ -183,3 +183,176 @@ def test_clean_display_name_case_insensitive():
     """Test that separator matching is case-insensitive."""
     result = clean_display_name("Company Name D.O.O. something")
     assert result == "Company Name"
+
+
+def _create_companies_with_branches(count, reviewer):
+    country = Country.objects.create(
+        name="Croatia",
+        country_code="HR",
+        region=RegionTypes.EUROPE,
+        subregion=SubRegionTypes.SOUTHERN_EUROPE,
+        business_region=BusinessRegionTypes.EMEA,
+    )
+    county = Location.objects.create(name="Grad Zagreb", country=country)
+    city = Location.objects.create(name="Zagreb", country=country, parent=county)
+    district = Location.objects.create(name="Trnje", country=country, parent=city)
+
+    for i in range(count):
+        company = Company.objects.create(display_name=f"Company {i}", category=CategoryTypes.OTHER)
+        address = Address.objects.create(
+            street="Ilica",
+            number=str(i),
+            postal_code="10000",
+            location=district,
+            latitude=45.8,
+            longitude=15.9,
+        )
+        Branch.objects.create(company=company, location=district, address=address, name="HQ", is_primary=True)
+        Branch.objects.create(company=company, location=city, name="Office")
+        Review.objects.create(rating=4, comment="", company=company, reviewer=reviewer)
+
+
+@pytest.mark.django_db
+def test_company_list_query_count_is_independent_of_page_size(dummy_user):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from rest_framework.test import APIClient
+
+    _create_companies_with_branches(12, dummy_user)
+    client = APIClient()
+
+    query_counts = []
+    for page_size in (2, 12):
+        with CaptureQueriesContext(connection) as context:
+            response = client.get("/companies/", {"page_size": page_size})
+        assert response.status_code == 200
+        assert len(response.json()["results"]) == page_size
+        query_counts.append(len(context.captured_queries))
+
+    assert query_counts[0] == query_counts[1]
+    company = response.json()["results"][0]
+    assert company["primary_location"] == "Trnje, Zagreb, Grad Zagreb, Croatia"
+    assert company["branches"][0]["address"].endswith(", 10000, Trnje, Zagreb, Grad Zagreb, Croatia")
+    assert company["rating_summary"] == {"1": 0, "2": 0, "3": 0, "4": 1, "5": 0}
+
+
+@pytest.mark.django_db
+def test_company_location_filter_matches_ancestors(dummy_user):
+    from rest_framework.test import APIClient
+
+    _create_companies_with_branches(2, dummy_user)
+    split = Location.objects.create(name="Split", country=Country.objects.get(country_code="HR"))
+    company = Company.objects.create(display_name="Coastal Company", category=CategoryTypes.OTHER)
+    Branch.objects.create(company=company, location=split, name="HQ", is_primary=True)
+    client = APIClient()
+
+    def names(location):
+        response = client.get("/companies/", {"location": location})
+        assert response.status_code == 200
+        return sorted(company["display_name"] for company in response.json()["results"])
+
+    assert names("grad zagreb") == ["Company 0", "Company 1"]
+    assert names("Trnje") == ["Company 0", "Company 1"]
+    assert names("Split") == ["Coastal Company"]
+    assert names("Osijek") == []
+
+
+@pytest.mark.django_db
+def test_company_search_falls_back_to_icontains(dummy_user):
+    from rest_framework.test import APIClient
+
+    _create_companies_with_branches(2, dummy_user)
+    company = Company.objects.create(display_name="Pekara Mlinar", category=CategoryTypes.OTHER)
+    Branch.objects.create(company=company, location=Location.objects.get(name="Zagreb"), name="Skladište Sesvete")
+    client = APIClient()
+
+    def names(search):
+        response = client.get("/companies/", {"search": search})
+        assert response.status_code == 200
+        return sorted(company["display_name"] for company in response.json()["results"])
+
+    assert names("mlinar") == ["Pekara Mlinar"]
+    assert names("sesvete") == ["Pekara Mlinar"]
+    assert names("company") == ["Company 0", "Company 1"]
+
+
+@pytest.mark.django_db
+def test_rating_histogram_follows_review_updates_and_deletes(dummy_company, dummy_user, dummy_user2, django_assert_max_num_queries):
+    review = Review.objects.create(rating=5, comment="", company=dummy_company, reviewer=dummy_user)
+    Review.objects.create(rating=2, comment="", company=dummy_company, reviewer=dummy_user2)
+
+    review = Review.objects.get(pk=review.pk)
+    review.rating = 3
+    review.save()
+    company = Company.objects.get(pk=dummy_company.pk)
+    with django_assert_max_num_queries(0):
+        assert company.rating_summary == {1: 0, 2: 1, 3: 1, 4: 0, 5: 0}
+
+    review.delete()
+    company.refresh_from_db()
+    assert company.rating_summary == {1: 0, 2: 1, 3: 0, 4: 0, 5: 0}
+
+
+@pytest.mark.django_db
+def test_rebuild_company_ratings_command(dummy_company, dummy_user, dummy_user2):
+    from io import StringIO
+    from django.core.management import call_command
+
+    Review.objects.create(rating=5, comment="", company=dummy_company, reviewer=dummy_user)
+    Review.objects.create(rating=2, comment="", company=dummy_company, reviewer=dummy_user2)
+    Company.objects.update(rating_5_count=7, rating_1_count=3, reviews_count=0, reviews_rating=0)
+
+    call_command("rebuild_company_ratings", stdout=StringIO())
+
+    dummy_company.refresh_from_db()
+    assert dummy_company.rating_summary == {1: 0, 2: 1, 3: 0, 4: 0, 5: 1}
+    assert dummy_company.reviews_count == 2
+    assert dummy_company.reviews_rating == 3.5
+
+
+@pytest.mark.django_db
+def test_rebuild_ratings_resets_unreviewed_companies_and_touches_modified_at(dummy_company, dummy_user):
+    Review.objects.create(rating=4, comment="", company=dummy_company, reviewer=dummy_user)
+    unreviewed = Company.objects.create(display_name="Unreviewed", category="Other")
+    Company.objects.filter(pk=unreviewed.pk).update(reviews_count=3, rating_5_count=3, reviews_rating=5)
+    before = Company.objects.get(pk=dummy_company.pk).modified_at
+
+    assert Company.rebuild_ratings() == 1
+
+    dummy_company.refresh_from_db()
+    unreviewed.refresh_from_db()
+    assert dummy_company.rating_summary == {1: 0, 2: 0, 3: 0, 4: 1, 5: 0}
+    assert (dummy_company.reviews_count, dummy_company.reviews_rating_sum, dummy_company.reviews_rating) == (1, 4, 4)
+    assert dummy_company.modified_at > before
+    assert unreviewed.rating_summary == {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
+    assert (unreviewed.reviews_count, unreviewed.reviews_rating) == (0, 0)
+
+
+@pytest.mark.django_db
+def test_review_changes_update_rating_in_one_statement(dummy_company, dummy_user, dummy_user2, django_assert_num_queries):
+    Review.objects.create(rating=5, comment="", company=dummy_company, reviewer=dummy_user)
+    # A stale copy of the company must not overwrite the first review's counts
+    stale_company = Company.objects.get(pk=dummy_company.pk)
+    Company.objects.filter(pk=dummy_company.pk).update(display_name="Renamed")
+    review = Review(rating=2, comment="", company=stale_company, reviewer=dummy_user2)
+
+    # INSERT, one UPDATE of the rating columns, and the reload of the cached company
+    with django_assert_num_queries(3):
+        review.save()
+
+    assert (stale_company.reviews_count, stale_company.reviews_rating_sum) == (2, 7)
+    assert stale_company.reviews_rating == 3.5
+    assert Company.objects.get(pk=dummy_company.pk).display_name == "Renamed"
+
+    review.rating = 4
+    review.save()
+    Review.objects.filter(reviewer=dummy_user).delete()
+
+    dummy_company.refresh_from_db()
+    assert (dummy_company.reviews_count, dummy_company.reviews_rating_sum) == (1, 4)
+    assert dummy_company.reviews_rating == 4
+    assert dummy_company.rating_summary == {1: 0, 2: 0, 3: 0, 4: 1, 5: 0}
+
+    review.delete()
+    dummy_company.refresh_from_db()
+    assert (dummy_company.reviews_count, dummy_company.reviews_rating) == (0, 0)
@@ -1,4 +1,4 @@
-from django.db.models import Q
+from django.db.models import Prefetch, Q
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
 from rest_framework import permissions
@@ -12,8 +12,8 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
-from .filters import CompanyFilter
-from .models import Company, CompanyAdmin
+from .filters import CompanyFilter, CompanySearchFilter
+from .models import Branch, Company, CompanyAdmin
 from .permissions import IsCompanyAdmin, IsSuperAdmin
 from .serializers import CompanySerializer, CompanyManageSerializer
 
@@ -37,7 +37,8 @@ class CompanyViewSet(ModelViewSet):
     queryset = Company.objects.all()
     serializer_class = CompanySerializer
     pagination_class = CompanyPagination
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    # Search runs after ordering so it can rank results ahead of the default ordering
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, CompanySearchFilter]
     filterset_class = CompanyFilter
     search_fields = ["display_name", "branches__name"]
 
@@ -45,6 +46,14 @@ class CompanyViewSet(ModelViewSet):
     ordering = ["-reviews_rating"]
     http_method_names = ["head", "options", "get", "patch"]
 
+    def get_queryset(self):
+        """
+        Prefetch everything CompanySerializer renders, so a page costs the
+        same number of queries whatever its size.
+        """
+        branches = Branch.objects.select_related("location", "address__location")
+        return super().get_queryset().prefetch_related(Prefetch("branches", queryset=branches))
+
     @action(detail=False, methods=["get"], url_path="me")
     def my_companies(self, request, *args, **kwargs):
         """
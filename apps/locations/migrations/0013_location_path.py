@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:21
+
+from collections import defaultdict
+
+from django.db import migrations, models
+
+
+def fill_location_paths(apps, schema_editor):
+    Location = apps.get_model('locations', 'Location')
+    locations = list(Location.objects.select_related('country'))
+    children = defaultdict(list)
+    for location in locations:
+        children[location.parent_id].append(location)
+
+    known = {None: ('/', [])}
+    level = children[None]
+    while level:
+        for location in level:
+            parent_path, parent_names = known[location.parent_id]
+            names = [location.name, *parent_names]
+            location.path = f'{parent_path}{location.pk}/'
+            location.display_path = ', '.join(filter(None, [*names, location.country.name]))
+            known[location.pk] = (location.path, names)
+        level = [child for location in level for child in children[location.pk]]
+
+    Location.objects.bulk_update(locations, ['path', 'display_path'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('locations', '0012_alter_country_country_code'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='location',
+            name='display_path',
+            field=models.CharField(blank=True, editable=False, max_length=1000),
+        ),
+        migrations.AddField(
+            model_name='location',
+            name='path',
+            field=models.CharField(blank=True, editable=False, help_text='Ids from the root ancestor down to this location, as /<id>/<id>/', max_length=500),
+        ),
+        migrations.AddIndex(
+            model_name='location',
+            index=models.Index(fields=['path'], name='location_path_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.RunPython(fill_location_paths, migrations.RunPython.noop),
+    ]
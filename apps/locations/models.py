@@ -1,4 +1,5 @@
 import uuid
+from collections import defaultdict
 
 from django.core.exceptions import ValidationError
 from django.db import models
@@ -23,6 +24,12 @@ class Country(BaseModel):
     def __str__(self):
         return f"{self.name} ({self.country_code})"
 
+    def save(self, *args, **kwargs):
+        previous_name = Country.objects.filter(pk=self.pk).values_list("name", flat=True).first() if self.pk else None
+        super().save(*args, **kwargs)
+        if previous_name is not None and previous_name != self.name:
+            Location.rebuild_paths(Location.objects.filter(country=self))
+
 
 # class Location(BaseModel):
 #     """Location model to store the location of a company or user"""
@@ -48,6 +55,10 @@ class Country(BaseModel):
     #         self.country.name
     #     ]))
 
+# Separates and encloses the ids in Location.path
+PATH_SEPARATOR = "/"
+
+
 class Location(BaseModel):
     """ Location model to store the location of a company or user """
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -63,7 +74,22 @@ class Location(BaseModel):
         related_name="subdivisions"
     )
 
+    path = models.CharField(
+        max_length=500,
+        blank=True,
+        editable=False,
+        help_text="Ids from the root ancestor down to this location, as /<id>/<id>/",
+    )
+    display_path = models.CharField(max_length=1000, blank=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["path"], name="location_path_idx", opclasses=["varchar_pattern_ops"]),
+        ]
+
     def __str__(self):
+        if self.display_path:
+            return self.display_path
         parts = [self.name] if self.name else []
         parent = self.parent
         while parent:
@@ -72,6 +98,92 @@ class Location(BaseModel):
         parts.append(self.country.name)
         return ", ".join(filter(None, parts))
 
+    def save(self, *args, **kwargs):
+        previous_path, previous_display_path = self.path, self.display_path
+        self.path, names = self._path_and_names()
+        self.display_path = build_display_path(names, self.country.name)
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "path", "display_path"}
+        super().save(*args, **kwargs)
+
+        if previous_path and (previous_path, previous_display_path) != (self.path, self.display_path):
+            self.refresh_descendant_paths(previous_path, names)
+
+    def _path_and_names(self):
+        """Return the path of this location and its names, nearest first, from the parent's stored path."""
+        if not self.parent_id:
+            parent_path = PATH_SEPARATOR
+        elif self.parent.path:
+            parent_path = self.parent.path
+        else:
+            # The parent's path was never stored (e.g. created with bulk_create)
+            parent_path, _ = self.parent._path_and_names()
+        ancestor_ids = [pk for pk in parent_path.split(PATH_SEPARATOR) if pk]
+        ancestor_names = {
+            str(pk): name for pk, name in Location.objects.filter(pk__in=ancestor_ids).values_list("pk", "name")
+        }
+        names = [self.name, *(ancestor_names.get(pk) for pk in reversed(ancestor_ids))]
+        return f"{parent_path}{self.pk}{PATH_SEPARATOR}", names
+
+    def refresh_descendant_paths(self, previous_path, names):
+        """Rewrite the stored paths of the locations that were under previous_path."""
+        descendants = sorted(
+            Location.objects.filter(path__startswith=previous_path).exclude(pk=self.pk).select_related("country"),
+            key=lambda location: location.path.count(PATH_SEPARATOR),
+        )
+        assign_paths(descendants, {self.pk: (self.path, names)})
+        Location.objects.bulk_update(descendants, ["path", "display_path"])
+
+    @classmethod
+    def rebuild_paths(cls, queryset=None):
+        """
+        Recompute the stored path of every location, or only of those in queryset.
+
+        Parents outside queryset keep their path; it is only read to build
+        their children's paths.
+        """
+        queryset = cls.objects.all() if queryset is None else queryset
+        locations = list(queryset.select_related("country"))
+        children = defaultdict(list)
+        for location in locations:
+            children[location.parent_id].append(location)
+
+        known = {None: (PATH_SEPARATOR, [])}
+        outside_parent_ids = set(children) - {location.pk for location in locations} - {None}
+        for parent in cls.objects.filter(pk__in=outside_parent_ids).select_related("parent"):
+            known[parent.pk] = parent._path_and_names()
+
+        ordered = []
+        level = [location for parent_id in known for location in children[parent_id]]
+        while level:
+            ordered.extend(level)
+            level = [child for location in level for child in children[location.pk]]
+
+        assign_paths(ordered, known)
+        cls.objects.bulk_update(ordered, ["path", "display_path"])
+
+
+def build_display_path(names, country_name):
+    """Join location names, nearest first, and the country name for display."""
+    return ", ".join(filter(None, [*names, country_name]))
+
+
+def assign_paths(locations, known):
+    """
+    Set path and display_path on locations, given in top-down order.
+
+    known maps the pk of each parent outside locations to its (path, names).
+    """
+    for location in locations:
+        parent_path, parent_names = known[location.parent_id]
+        names = [location.name, *parent_names]
+        location.path = f"{parent_path}{location.pk}{PATH_SEPARATOR}"
+        location.display_path = build_display_path(names, location.country.name)
+        known[location.pk] = (location.path, names)
+
+
 class Address(BaseModel):
     name = models.CharField(max_length=100, null=True, blank=True)
     address_type = models.CharField(max_length=100, choices=AddressTypes.choices, default=AddressTypes.BUSINESS)
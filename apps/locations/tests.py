@@ -24,3 +24,84 @@ def test_location_str_with_parent():
 	)
 
 	assert str(child) == "Munich, Bavaria, Germany"
+
+
+@pytest.mark.django_db
+def test_location_paths_follow_rename_and_move(django_assert_num_queries):
+	country = Country.objects.create(
+		name="Croatia",
+		country_code="HR",
+		region=RegionTypes.EUROPE,
+		subregion=SubRegionTypes.SOUTHERN_EUROPE,
+		business_region=BusinessRegionTypes.EMEA,
+	)
+	county = Location.objects.create(name="Grad Zagreb", country=country)
+	city = Location.objects.create(name="Zagreb", country=country, parent=county)
+	district = Location.objects.create(name="Trnje", country=country, parent=city)
+
+	assert district.path == f"/{county.pk}/{city.pk}/{district.pk}/"
+	district = Location.objects.get(pk=district.pk)
+	with django_assert_num_queries(0):
+		assert str(district) == "Trnje, Zagreb, Grad Zagreb, Croatia"
+
+	city.name = "City of Zagreb"
+	city.save()
+	district.refresh_from_db()
+	assert str(district) == "Trnje, City of Zagreb, Grad Zagreb, Croatia"
+
+	region = Location.objects.create(name="Central Croatia", country=country)
+	city.parent = region
+	city.save()
+	district.refresh_from_db()
+	assert district.path == f"/{region.pk}/{city.pk}/{district.pk}/"
+	assert str(district) == "Trnje, City of Zagreb, Central Croatia, Croatia"
+
+	country.name = "Hrvatska"
+	country.save()
+	district.refresh_from_db()
+	assert str(district) == "Trnje, City of Zagreb, Central Croatia, Hrvatska"
+
+
+@pytest.mark.django_db
+def test_country_rename_only_rebuilds_its_own_locations():
+	def create_country(name, code):
+		return Country.objects.create(
+			name=name,
+			country_code=code,
+			region=RegionTypes.EUROPE,
+			subregion=SubRegionTypes.SOUTHERN_EUROPE,
+			business_region=BusinessRegionTypes.EMEA,
+		)
+
+	croatia = create_country("Croatia", "HR")
+	slovenia = create_country("Slovenia", "SI")
+	zagreb = Location.objects.create(name="Zagreb", country=croatia)
+	ljubljana = Location.objects.create(name="Ljubljana", country=slovenia)
+	# Stale on purpose: a rebuild of every location would rewrite it
+	Location.objects.filter(pk=ljubljana.pk).update(display_path="stale")
+
+	croatia.name = "Hrvatska"
+	croatia.save()
+
+	zagreb.refresh_from_db()
+	ljubljana.refresh_from_db()
+	assert zagreb.display_path == "Zagreb, Hrvatska"
+	assert ljubljana.display_path == "stale"
+
+
+@pytest.mark.django_db
+def test_child_of_bulk_created_location_gets_full_path():
+	country = Country.objects.create(
+		name="Croatia",
+		country_code="HR",
+		region=RegionTypes.EUROPE,
+		subregion=SubRegionTypes.SOUTHERN_EUROPE,
+		business_region=BusinessRegionTypes.EMEA,
+	)
+	county = Location.objects.create(name="Splitsko-dalmatinska", country=country)
+	[city] = Location.objects.bulk_create([Location(name="Split", country=country, parent=county)])
+	district = Location.objects.create(name="Varoš", country=country, parent=city)
+
+	assert district.path == f"/{county.pk}/{city.pk}/{district.pk}/"
+	assert str(district) == "Varoš, Split, Splitsko-dalmatinska, Croatia"
+	assert set(Location.objects.filter(path__startswith=f"/{county.pk}/")) == {county, district}
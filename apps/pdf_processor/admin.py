@@ -4,10 +4,10 @@ from .models import PDFDocument, ExtractedData
 
 @admin.register(PDFDocument)
 class PDFDocumentAdmin(admin.ModelAdmin):
-    list_display = ['id', 'original_filename', 'status', 'created_at', 'modified_at']
+    list_display = ['id', 'original_filename', 'source', 'status', 'checkpoint', 'created_at', 'modified_at']
     # list_filter = ['status', 'created_at']
     search_fields = ['original_filename']
-    readonly_fields = ['original_filename', 'scraped_url', 'source_url', 'created_at', 'modified_at']
+    readonly_fields = ['original_filename', 'scraped_url', 'source_url', 'stage_progress', 'checkpoint', 'created_at', 'modified_at']
 
 
 @admin.register(ExtractedData)
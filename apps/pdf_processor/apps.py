@@ -5,3 +5,6 @@ class PdfProcessorConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.pdf_processor'
     verbose_name = 'PDF Processor'
+
+    def ready(self):
+        import apps.pdf_processor.signals
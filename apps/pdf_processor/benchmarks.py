@@ -0,0 +1,284 @@
+"""
+Synthetic inputs and micro-benchmarks for the PDF processing pipeline.
+
+Run the row cleaning benchmark with:
+
+    python -m apps.pdf_processor.benchmarks --rows 10000
+
+The stage benchmarks (extraction, parsing and sync against the local
+database) use the generators below and run with:
+
+    python manage.py benchmark_pdf_pipeline --output results.json
+"""
+import argparse
+import json
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .cleaning import CompanyTableCleaner, HEADER_KEYWORDS, merge_continuation_rows
+
+
+def make_synthetic_table(rows: int, rows_per_page: int = 40, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Build page tables shaped like pdfplumber output for the ministry list.
+
+    Besides regular company rows, the table contains the irregular rows seen
+    in real documents: repeated header rows, wrapped continuation rows
+    (first cell None, also across page boundaries), short rows, rows without
+    an OIB, too short names and padded whitespace.
+
+    Returns:
+        List of {'page_number', 'rows'} dicts, as produced by PDFExtractor
+    """
+    rng = random.Random(seed)
+    tables = []
+    page_rows: List[List[Optional[str]]] = []
+
+    for number in range(1, rows + 1):
+        kind = rng.random()
+        if kind < 0.02:
+            row = ['R.BR.', 'NAZIV POSLODAVCA', 'OIB', 'ADRESA']
+        elif kind < 0.06:
+            row = [None, 'd.o.o.', None, 'kat 2']
+        elif kind < 0.08:
+            row = [f'{number}.', f'TVRTKA {number}', None, '']
+        elif kind < 0.09:
+            row = [f'{number}.', f'TVRTKA {number}', '', 'Ulica bb']
+        elif kind < 0.10:
+            row = [f'{number}.', 'AB', str(10000000000 + number), 'Ulica bb']
+        else:
+            row = [
+                f'{number}.',
+                f'  TVRTKA   {number}\nd.o.o. ',
+                str(10000000000 + number),
+                f'Ulica {number},  {rng.randint(10000, 53000)} Grad',
+            ]
+        page_rows.append(row)
+
+        if len(page_rows) == rows_per_page:
+            tables.append({'page_number': len(tables) + 1, 'rows': page_rows})
+            page_rows = []
+
+    if page_rows:
+        tables.append({'page_number': len(tables) + 1, 'rows': page_rows})
+    return tables
+
+
+MINISTRY_COLUMNS = [40, 80, 300, 400, 560]
+
+
+def build_ministry_pdf(
+    pages: int,
+    rows_per_page: int = 40,
+    page_columns: Optional[List[List[int]]] = None,
+    page_vertical_rulings: Optional[List[bool]] = None,
+) -> bytes:
+    """
+    Build a ministry-style PDF: a title row, a header row and data rows per page.
+
+    The table is drawn with ruling lines like the published lists, so
+    pdfplumber detects it with the default table settings. Company numbers
+    continue across pages (row n is 'TVRTKA n d.o.o.' with OIB 10000000000 + n).
+
+    Args:
+        page_columns: x positions of the column rulings, one list per page;
+            pages beyond the list keep the last one. Defaults to
+            MINISTRY_COLUMNS on every page.
+        page_vertical_rulings: Whether each page draws its column rulings;
+            pages beyond the list keep the last value. Row rulings are always
+            drawn. Defaults to True on every page.
+
+    Returns:
+        The PDF file content
+    """
+    page_columns = page_columns or [MINISTRY_COLUMNS]
+    page_vertical_rulings = page_vertical_rulings or [True]
+    row_height = 16
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        None,
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>',
+    ]
+    page_ids = []
+    counter = 0
+    for page_index in range(pages):
+        columns = page_columns[min(page_index, len(page_columns) - 1)]
+        rows = [['Popis poslodavaca', '', '', ''], ['R.BR.', 'NAZIV POSLODAVCA', 'OIB', 'ADRESA']]
+        for _ in range(rows_per_page):
+            counter += 1
+            rows.append([f'{counter}.', f'TVRTKA {counter} d.o.o.', f'{10000000000 + counter}', f'Ulica {counter}'])
+        top, bottom = 800, 800 - len(rows) * row_height
+        ops = ['0.5 w']
+        ops += [f'{columns[0]} {top - i * row_height} m {columns[-1]} {top - i * row_height} l S' for i in range(len(rows) + 1)]
+        if page_vertical_rulings[min(page_index, len(page_vertical_rulings) - 1)]:
+            ops += [f'{x} {top} m {x} {bottom} l S' for x in columns]
+        for i, row in enumerate(rows):
+            y = top - (i + 1) * row_height + 4
+            ops += [f'BT /F1 8 Tf {x + 2} {y} Td ({cell}) Tj ET' for x, cell in zip(columns, row) if cell]
+        content = '\n'.join(ops).encode('latin-1')
+        objects.append(
+            f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] '
+            f'/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects) + 2} 0 R >>'.encode()
+        )
+        page_ids.append(len(objects))
+        objects.append(b'<< /Length %d >>\nstream\n' % len(content) + content + b'\nendstream')
+    kids = ' '.join(f'{page_id} 0 R' for page_id in page_ids)
+    objects[1] = f'<< /Type /Pages /Kids [{kids}] /Count {pages} >>'.encode()
+
+    output = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for object_id, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b'%d 0 obj\n' % object_id + body + b'\nendobj\n'
+    xref_offset = len(output)
+    output += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    output += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    output += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref_offset)
+    return bytes(output)
+
+
+def make_company_fixture(rows: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Build parsed company rows, as stored in ExtractedData.raw_data['companies'].
+
+    Names and OIBs are unique, so a sync into an empty table creates every
+    row and a second sync matches every row.
+    """
+    rng = random.Random(seed)
+    return [
+        {
+            'index': f'{number}.',
+            'legal_name': f'TVRTKA {number} d.o.o.',
+            'legal_id': str(10000000000 + number),
+            'address': f'Ulica {number}, {rng.randint(10000, 53000)} Grad',
+            'page_number': (number - 1) // 40 + 1,
+        }
+        for number in range(1, rows + 1)
+    ]
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Compare two stage benchmark reports entry by entry.
+
+    Entries are matched by (benchmark, size); entries missing from either
+    report are skipped.
+
+    Returns:
+        List of dicts with the benchmark, size, both rows_per_second values
+        and their ratio (above 1 means the current run is faster)
+    """
+    baseline_entries = {(entry['benchmark'], entry['size']): entry for entry in baseline.get('results', [])}
+    comparison = []
+    for entry in current.get('results', []):
+        previous = baseline_entries.get((entry['benchmark'], entry['size']))
+        if previous is None:
+            continue
+        before, after = previous.get('rows_per_second'), entry.get('rows_per_second')
+        comparison.append({
+            'benchmark': entry['benchmark'],
+            'size': entry['size'],
+            'baseline_rows_per_second': before,
+            'rows_per_second': after,
+            'ratio': round(after / before, 2) if before and after else None,
+        })
+    return comparison
+
+
+def legacy_clean_rows(rows) -> Tuple[List[Dict[str, Any]], List[Optional[str]]]:
+    """
+    The former row-at-a-time cleaning loop, kept as the benchmark baseline
+    and as the reference the column-oriented cleaner must match.
+    """
+    companies = []
+    reasons = []
+
+    for page_number, row_values in rows:
+        row_values = list(filter(None, row_values))
+
+        if len(row_values) < 4:
+            reasons.append('less_than_4_cols')
+            continue
+
+        is_header = False
+        for cell in row_values:
+            cell_str = str(cell).lower().strip() if cell else ''
+            if any(keyword in cell_str for keyword in HEADER_KEYWORDS):
+                is_header = True
+                break
+
+        if is_header:
+            reasons.append('is_header')
+            continue
+
+        cleaned_values = [' '.join(str(v).strip().split()) for v in row_values[:4]]
+        index, legal_name, company_id, address = cleaned_values
+
+        if not legal_name:
+            reasons.append('no_legal_name')
+            continue
+        if not company_id:
+            reasons.append('no_legal_id')
+            continue
+        if len(legal_name) < 3:
+            reasons.append('name_too_short')
+            continue
+
+        companies.append({
+            'index': index,
+            'legal_name': legal_name,
+            'legal_id': company_id,
+            'address': address,
+            'page_number': page_number,
+        })
+        reasons.append(None)
+
+    return companies, reasons
+
+
+def benchmark_row_cleaning(rows: int = 10000, repeat: int = 5, seed: int = 0) -> Dict[str, Any]:
+    """
+    Time the legacy and column-oriented cleaners on the same synthetic table.
+
+    Continuation rows are merged once up front, so only cleaning and
+    validation are timed. Reports the best of `repeat` runs for each.
+
+    Raises:
+        AssertionError: If the two cleaners disagree
+    """
+    merged_rows = list(merge_continuation_rows(make_synthetic_table(rows, seed=seed)))
+    cleaner = CompanyTableCleaner()
+
+    def best_of(func):
+        best = None
+        result = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = func(merged_rows)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best, result
+
+    legacy_seconds, legacy_result = best_of(legacy_clean_rows)
+    columnar_seconds, columnar_result = best_of(cleaner.clean)
+    assert columnar_result == legacy_result, 'Column-oriented cleaner output differs from the legacy loop'
+
+    return {
+        'rows': len(merged_rows),
+        'companies': len(columnar_result[0]),
+        'legacy_seconds': round(legacy_seconds, 6),
+        'columnar_seconds': round(columnar_seconds, 6),
+        'speedup': round(legacy_seconds / columnar_seconds, 2) if columnar_seconds else None,
+        'legacy_rows_per_second': round(len(merged_rows) / legacy_seconds) if legacy_seconds else None,
+        'columnar_rows_per_second': round(len(merged_rows) / columnar_seconds) if columnar_seconds else None,
+    }
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description='Benchmark company row cleaning.')
+    arg_parser.add_argument('--rows', type=int, default=10000)
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    arg_parser.add_argument('--seed', type=int, default=0)
+    args = arg_parser.parse_args()
+    print(json.dumps(benchmark_row_cleaning(args.rows, args.repeat, args.seed), indent=2))
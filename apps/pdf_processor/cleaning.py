@@ -0,0 +1,166 @@
+"""
+Column-oriented cleaning and validation of company table rows.
+
+Like extraction.py, this module has no Django imports so it can be used
+(and benchmarked) outside a configured project.
+"""
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Cells containing any of these (case-insensitive) mark a repeated header row
+HEADER_KEYWORDS = ['r.br', 'naziv', 'oib', 'adresa', 'redni broj']
+
+# Default column schema of company tables
+COMPANY_COLUMNS = ['index', 'legal_name', 'legal_id', 'address']
+
+# Rejection reasons, in the order the rules are applied
+# (less_than_4_cols keeps its historical name for any schema width)
+LESS_THAN_4_COLS = 'less_than_4_cols'
+IS_HEADER = 'is_header'
+NO_LEGAL_NAME = 'no_legal_name'
+NO_LEGAL_ID = 'no_legal_id'
+NAME_TOO_SHORT = 'name_too_short'
+REJECTION_REASONS = [LESS_THAN_4_COLS, IS_HEADER, NO_LEGAL_NAME, NO_LEGAL_ID, NAME_TOO_SHORT]
+
+# Joins a row's cells for a single header search; cannot occur in a keyword
+_CELL_SEPARATOR = '\x1f'
+
+
+def normalize_whitespace(value: Any) -> str:
+    """Strip a cell and collapse internal whitespace runs to single spaces."""
+    if value is None:
+        return ''
+    return ' '.join(str(value).split())
+
+
+def merge_continuation_rows(tables_data: Iterable[Dict[str, Any]]) -> Iterator[Tuple[int, List[Any]]]:
+    """
+    Yield (page_number, row) pairs with continuation rows merged in.
+
+    A row whose first cell is None continues the previous row (wrapped
+    names or addresses), even when the previous row ended the page before.
+    Only the last row seen is held back, so the merge is a single linear
+    pass and pages are consumed one at a time.
+    """
+    pending = None
+
+    for table_info in tables_data:
+        page_number = table_info['page_number']
+
+        for row in table_info.get('rows', []):
+            # Copy so merging never mutates cached extraction results
+            row = list(row)
+
+            if pending is not None and row and row[0] is None:
+                previous_row = pending[1]
+                for j, value in enumerate(row[:len(previous_row)]):
+                    if previous_row[j] is not None and value is not None:
+                        previous_row[j] += " " + value
+                continue
+
+            if pending is not None:
+                yield pending
+            pending = (page_number, row)
+
+    if pending is not None:
+        yield pending
+
+
+class CompanyTableCleaner:
+    """
+    Clean and validate merged company table rows in column-oriented passes.
+
+    Rows go through one pass that drops empty cells. Each rule then runs as
+    a mask over the whole batch: column count, one compiled header regex per
+    row, and the name and OIB checks on the normalized columns. Only the
+    rows that still qualify are normalized.
+    """
+
+    def __init__(
+        self,
+        columns: Optional[List[str]] = None,
+        header_keywords: Optional[List[str]] = None,
+        min_name_length: int = 3,
+    ):
+        """
+        Args:
+            columns: Output keys in table column order; must include
+                'legal_name' and 'legal_id'
+
+            header_keywords: Lowercase substrings that mark a header row
+
+            min_name_length: Shortest accepted legal name
+
+        Raises:
+            ValueError: If the schema lacks legal_name or legal_id
+        """
+        self.columns = list(columns or COMPANY_COLUMNS)
+        if 'legal_name' not in self.columns or 'legal_id' not in self.columns:
+            raise ValueError("Company table columns must include 'legal_name' and 'legal_id'")
+
+        keywords = header_keywords or HEADER_KEYWORDS
+        self.header_pattern = re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+        self.min_columns = len(self.columns)
+        self.min_name_length = min_name_length
+
+    def clean(
+        self,
+        rows: Iterable[Tuple[int, List[Any]]],
+    ) -> Tuple[List[Dict[str, Any]], List[Optional[str]]]:
+        """
+        Clean merged (page_number, row) pairs into company dictionaries.
+
+        Args:
+            rows: Rows with continuation rows already merged in
+
+        Returns:
+            Tuple of (companies in row order, rejection reason per input row,
+            None for rows that produced a company)
+        """
+        page_numbers = []
+        cells = []
+        for page_number, row in rows:
+            page_numbers.append(page_number)
+            cells.append([value for value in row if value])
+
+        reasons: List[Optional[str]] = [None] * len(cells)
+
+        # Column count and header masks
+        search_header = self.header_pattern.search
+        candidates = []
+        for position, row_cells in enumerate(cells):
+            if len(row_cells) < self.min_columns:
+                reasons[position] = LESS_THAN_4_COLS
+            elif search_header(_CELL_SEPARATOR.join(map(str, row_cells)).lower()):
+                reasons[position] = IS_HEADER
+            else:
+                candidates.append(position)
+
+        # Normalized columns for the remaining rows
+        candidate_cells = [cells[position] for position in candidates]
+        normalized = [
+            [' '.join(str(row_cells[column]).split()) for row_cells in candidate_cells]
+            for column in range(len(self.columns))
+        ]
+        legal_names = normalized[self.columns.index('legal_name')]
+        legal_ids = normalized[self.columns.index('legal_id')]
+
+        # Validation masks; a row is rejected by the first rule it fails
+        has_name = [bool(name) for name in legal_names]
+        has_id = [bool(legal_id) for legal_id in legal_ids]
+        long_enough = [len(name) >= self.min_name_length for name in legal_names]
+
+        companies = []
+        for column, position in enumerate(candidates):
+            if not has_name[column]:
+                reasons[position] = NO_LEGAL_NAME
+            elif not has_id[column]:
+                reasons[position] = NO_LEGAL_ID
+            elif not long_enough[column]:
+                reasons[position] = NAME_TOO_SHORT
+            else:
+                company = {name: values[column] for name, values in zip(self.columns, normalized)}
+                company['page_number'] = page_numbers[position]
+                companies.append(company)
+
+        return companies, reasons
@@ -1,8 +1,13 @@
 from django.db import models
 
 
+# PDFDocument.source of the Croatian labor ministry list (see PARSER_REGISTRY)
+DEFAULT_PDF_SOURCE = 'croatian_labor'
+
+
 class PDFStatus(models.TextChoices):
     PENDING = 'pending', 'Pending'
+    QUEUED = 'queued', 'Queued'
     PROCESSING = 'processing', 'Processing'
     COMPLETED = 'completed', 'Completed'
     FAILED = 'failed', 'Failed'
@@ -10,3 +15,34 @@ class PDFStatus(models.TextChoices):
 
 class DataType(models.TextChoices):
     STRUCTURED_COMPANIES = 'structured_companies', 'Structured Companies'
+    RAW_TABLES = 'raw_tables', 'Raw Tables'
+
+
+# How ExtractedData stores parsed companies (see payloads.py)
+class CompanyPayloadFormat(models.TextChoices):
+    ROWS = 'rows', 'One object per company'
+    COLUMNAR = 'columnar', 'Schema header and one array per column'
+    COLUMNAR_ZLIB = 'columnar_zlib', 'Columnar, zlib-compressed'
+    TABLE = 'table', 'ExtractedCompanyRow table'
+
+
+class SyncMode(models.TextChoices):
+    FULL = 'full', 'Full reset and re-apply'
+    DIFF = 'diff', 'Diff against previous document'
+    CHUNKED = 'chunked', 'Chunked, swapped in at the end'
+
+
+class PipelineStage(models.TextChoices):
+    FIND_PDF_LINK = 'find_pdf_link', 'Find PDF link'
+    DOWNLOAD = 'download', 'Download'
+    PROCESS = 'process', 'Process'
+    PARSE = 'parse', 'Parse'
+    SYNC = 'sync', 'Sync companies'
+
+
+# In pipeline order; PDFDocument.checkpoint holds the last one reached
+class PipelineCheckpoint(models.TextChoices):
+    DOWNLOADED = 'downloaded', 'Downloaded'
+    EXTRACTED = 'extracted', 'Tables extracted'
+    PARSED = 'parsed', 'Companies parsed'
+    SYNCED = 'synced', 'Companies synced'
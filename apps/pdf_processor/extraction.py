@@ -0,0 +1,157 @@
+"""
+Page-level table extraction helpers.
+
+This module must not import Django models: its functions run inside
+process pool workers that are started without Django being set up.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+import pdfplumber
+from pdfplumber.table import TableSettings
+
+
+class TableLayout:
+    """
+    How a source's table is found on a page.
+
+    Instances are passed to process pool workers, so they must stay
+    picklable (plain attributes only).
+    """
+
+    def __init__(
+        self,
+        table_settings: Optional[Dict[str, Any]] = None,
+        skip_rows: int = 0,
+        reuse_column_edges: bool = False,
+    ):
+        """
+        Args:
+            table_settings: pdfplumber table_settings used for detection
+
+            skip_rows: Leading rows of every page table to drop (title, header)
+
+            reuse_column_edges: Detect the column boundaries on the first
+                page with a table and pass them to later pages as explicit
+                vertical lines instead of detecting them again
+        """
+        self.table_settings = dict(table_settings or {})
+        self.skip_rows = skip_rows
+        self.reuse_column_edges = reuse_column_edges
+
+    @property
+    def cache_key(self) -> Tuple:
+        """Hashable identity; extraction results differ between layouts."""
+        return (
+            tuple(sorted((key, repr(value)) for key, value in self.table_settings.items())),
+            self.skip_rows,
+            self.reuse_column_edges,
+        )
+
+    def settings_for(self, column_edges: Optional[List[float]] = None) -> Dict[str, Any]:
+        """Return table_settings, with explicit vertical lines when column edges are known."""
+        if not column_edges:
+            return self.table_settings
+        return {
+            **self.table_settings,
+            'vertical_strategy': 'explicit',
+            'explicit_vertical_lines': column_edges,
+        }
+
+
+def get_column_edges(table) -> List[float]:
+    """Return the sorted x positions of a detected table's column boundaries."""
+    edges = set()
+    for x0, _, x1, _ in table.cells:
+        edges.add(x0)
+        edges.add(x1)
+    return sorted(edges)
+
+
+def column_edges_fit(page: pdfplumber.page.Page, column_edges: List[float], tolerance: float) -> bool:
+    """
+    Return False if the page's vertical rulings disagree with column_edges.
+
+    Every ruling must lie on a column edge and every column edge on a
+    ruling, within tolerance. Pages without vertical rulings (text-only
+    layouts) cannot be checked, so their columns are detected again.
+    """
+    rulings = {edge['x0'] for edge in page.edges if edge['orientation'] == 'v'}
+    if not rulings:
+        return False
+
+    def near(x, positions):
+        return any(abs(x - position) <= tolerance for position in positions)
+
+    return all(near(x, column_edges) for x in rulings) and all(near(x, rulings) for x in column_edges)
+
+
+def _find_table(page: pdfplumber.page.Page, table_settings: Dict[str, Any]):
+    """Return (largest table or None, resolved settings), like page.extract_table does."""
+    settings = TableSettings.resolve(table_settings)
+    return page.find_table(settings), settings
+
+
+def extract_page_table(
+    page: pdfplumber.page.Page,
+    layout: Optional[TableLayout] = None,
+    column_edges: Optional[List[float]] = None,
+) -> Tuple[Optional[Dict[str, Any]], Optional[List[float]]]:
+    """
+    Extract the largest table of a page and release the page's caches.
+
+    Args:
+        page: pdfplumber page
+        layout: Table layout of the source (defaults to pdfplumber's detection)
+        column_edges: Column boundaries from an earlier page; the layout's
+            own detection is used instead when they disagree with the page's
+            vertical rulings or find no table here
+
+    Returns:
+        Tuple of (dict with 'page_number' and 'rows', or None if the page has
+        no table; column edges of the detected table, or None)
+    """
+    layout = layout or TableLayout()
+    try:
+        table = None
+        tolerance = TableSettings.resolve(layout.table_settings).snap_x_tolerance
+        if column_edges and column_edges_fit(page, column_edges, tolerance):
+            table, settings = _find_table(page, layout.settings_for(column_edges))
+        if table is None:
+            table, settings = _find_table(page, layout.table_settings)
+        rows = table.extract(**(settings.text_settings or {})) if table else None
+        edges = get_column_edges(table) if table else None
+    finally:
+        page.close()
+
+    if not rows:
+        return None, None
+
+    return {
+        'page_number': page.page_number,
+        'rows': rows[layout.skip_rows:]
+    }, edges
+
+
+def extract_page_range(
+    pdf_path: str,
+    first_page: int,
+    last_page: int,
+    layout: Optional[TableLayout] = None,
+    column_edges: Optional[List[float]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Extract tables from an inclusive, 1-based page range of a PDF file.
+
+    Used as a process pool task: each call opens the file independently.
+    The column edges are detected once by the caller, on the first page of
+    the document with a table, so every range extracts like the sequential
+    path does.
+    """
+    layout = layout or TableLayout()
+    tables = []
+    with pdfplumber.open(pdf_path, pages=range(first_page, last_page + 1)) as pdf:
+        for page in pdf.pages:
+            table_info, _ = extract_page_table(page, layout, column_edges)
+            if table_info:
+                tables.append(table_info)
+    return tables
@@ -0,0 +1,128 @@
+"""
+Resource measurements for PDF pipeline stages.
+"""
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from django.db import connection
+from django.utils import timezone
+
+try:
+    import resource
+except ImportError:  # Windows has no resource module
+    resource = None
+
+
+def _maxrss_kb(who: str) -> Optional[int]:
+    """Return ru_maxrss in KiB for 'RUSAGE_SELF' or 'RUSAGE_CHILDREN', or None if unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(getattr(resource, who)).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def peak_rss_kb() -> Optional[int]:
+    """Return the process's lifetime peak resident set size in KiB, or None if unavailable."""
+    return _maxrss_kb('RUSAGE_SELF')
+
+
+def children_peak_rss_kb() -> Optional[int]:
+    """Return the peak RSS in KiB of the largest finished child process (e.g. an extraction worker)."""
+    return _maxrss_kb('RUSAGE_CHILDREN')
+
+
+def current_rss_kb() -> Optional[int]:
+    """Return the process's current resident set size in KiB, or None where /proc is unavailable."""
+    try:
+        with open('/proc/self/statm') as statm:
+            resident_pages = int(statm.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf('SC_PAGE_SIZE') // 1024
+
+
+def child_cpu_seconds() -> float:
+    """Return CPU time used by finished child processes (e.g. extraction workers)."""
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+class StageMeter:
+    """
+    Context manager measuring one pipeline stage.
+
+    Records wall time, CPU time of the calling thread plus any child
+    processes that finished during the stage, the number of DB queries run
+    on this thread's connection, and memory:
+
+    - peak_rss_kb: highest RSS of this process during the stage, sampled
+      every sample_interval seconds by a background thread, so it is a lower
+      bound (spikes shorter than the interval are missed). Where RSS cannot
+      be sampled it is the lifetime peak instead.
+    - peak_rss_delta_kb: peak_rss_kb minus the RSS when the stage started.
+    - children_peak_rss_kb: peak RSS of the largest child process that has
+      finished so far (ProcessPool extraction workers). It is a lifetime
+      figure for a single child, not the sum of concurrent workers.
+
+    Callers may add stage-specific values to `metrics` (bytes, pages...).
+    """
+
+    sample_interval = 0.05
+
+    def __init__(self):
+        self.metrics: Dict[str, Any] = {}
+        self.queries = 0
+        self._rss_samples = []
+
+    def _count_query(self, execute, sql, params, many, context):
+        self.queries += 1
+        return execute(sql, params, many, context)
+
+    def _sample_rss(self) -> None:
+        while not self._stop_sampling.wait(self.sample_interval):
+            self._rss_samples.append(current_rss_kb())
+
+    def __enter__(self) -> 'StageMeter':
+        self.metrics['started_at'] = timezone.now().isoformat()
+        self._wall = time.perf_counter()
+        self._cpu = time.thread_time()
+        self._child_cpu = child_cpu_seconds()
+        self._start_rss = current_rss_kb()
+        self._stop_sampling = threading.Event()
+        self._sampler = None
+        if self._start_rss is not None:
+            self._sampler = threading.Thread(target=self._sample_rss, daemon=True)
+            self._sampler.start()
+        self._query_wrapper = connection.execute_wrapper(self._count_query)
+        self._query_wrapper.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self._query_wrapper.__exit__(exc_type, exc_value, traceback)
+        if self._sampler is not None:
+            self._stop_sampling.set()
+            self._sampler.join()
+
+        cpu_seconds = (time.thread_time() - self._cpu) + (child_cpu_seconds() - self._child_cpu)
+        if self._start_rss is not None:
+            peak_rss = max([self._start_rss, current_rss_kb() or 0, *filter(None, self._rss_samples)])
+            peak_rss_delta = peak_rss - self._start_rss
+        else:
+            peak_rss = peak_rss_kb()
+            peak_rss_delta = None
+        self.metrics.update({
+            'finished_at': timezone.now().isoformat(),
+            'duration_seconds': round(time.perf_counter() - self._wall, 6),
+            'cpu_seconds': round(cpu_seconds, 6),
+            'peak_rss_kb': peak_rss,
+            'peak_rss_delta_kb': peak_rss_delta,
+            'children_peak_rss_kb': children_peak_rss_kb(),
+            'queries': self.queries,
+        })
+        return False
@@ -0,0 +1,205 @@
+import json
+import os
+import platform
+import subprocess
+import tempfile
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.pdf_processor.benchmarks import build_ministry_pdf, compare_results, make_company_fixture
+from apps.pdf_processor.constants import DataType, PDFStatus, SyncMode
+from apps.pdf_processor.instrumentation import StageMeter
+from apps.pdf_processor.models import ExtractedData, PDFDocument
+from apps.pdf_processor.services import (
+    CompanySyncService,
+    CroatianLaborPDFParser,
+    PDFExtractionCache,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark PDF extraction, parsing and company sync on synthetic ministry PDFs "
+        "and company fixtures against the configured database. All rows written are rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--pages',
+            type=int,
+            nargs='*',
+            default=[10, 100, 1000],
+            help='Page counts of the generated PDFs (default: 10 100 1000).',
+        )
+        parser.add_argument(
+            '--rows-per-page',
+            type=int,
+            default=40,
+            help='Company rows per generated page (default: 40).',
+        )
+        parser.add_argument(
+            '--companies',
+            type=int,
+            nargs='*',
+            default=[1000, 10000, 100000],
+            help='Row counts of the company fixtures synced (default: 1000 10000 100000).',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Number of processes used for PDF table detection (default: 1).',
+        )
+        parser.add_argument('--output', help='Write the JSON report to this file.')
+        parser.add_argument('--compare', help='Earlier JSON report to compare throughput against.')
+
+    def handle(self, *args, **options):
+        sizes = options['pages'] + options['companies'] + [options['rows_per_page'], options['workers']]
+        if any(size < 1 for size in sizes):
+            raise CommandError('Page counts, company counts, --rows-per-page and --workers must be positive.')
+
+        baseline = None
+        if options['compare']:
+            try:
+                with open(options['compare'], encoding='utf-8') as baseline_file:
+                    baseline = json.load(baseline_file)
+            except (OSError, json.JSONDecodeError) as exc:
+                raise CommandError(f'Cannot read --compare report: {exc}') from exc
+
+        results = []
+        with tempfile.TemporaryDirectory(prefix='pdf-benchmark-') as directory:
+            for pages in options['pages']:
+                results += self._benchmark_pdf(directory, pages, options['rows_per_page'], options['workers'])
+        for companies in options['companies']:
+            results += self._benchmark_sync(companies)
+
+        report = {
+            'created_at': timezone.now().isoformat(),
+            'commit': self._current_commit(),
+            'python': platform.python_version(),
+            'database': connection.vendor,
+            'workers': options['workers'],
+            'rows_per_page': options['rows_per_page'],
+            'results': results,
+        }
+
+        for entry in results:
+            self.stdout.write(
+                f"{entry['benchmark']:<14} {entry['size']:>7} {entry['unit']:<9} "
+                f"{entry['duration_seconds']:>9.3f}s  {entry['rows_per_second'] or 0:>9} rows/s  "
+                f"{entry['queries']:>5} queries  +{entry['peak_rss_delta_kb'] or 0} KiB peak RSS"
+            )
+
+        if baseline is not None:
+            report['comparison'] = compare_results(baseline, report)
+            for entry in report['comparison']:
+                self.stdout.write(
+                    f"{entry['benchmark']:<14} {entry['size']:>7}: {entry['ratio']}x "
+                    f"({entry['baseline_rows_per_second']} -> {entry['rows_per_second']} rows/s)"
+                )
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as output_file:
+                json.dump(report, output_file, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Benchmark report written to {options['output']}"))
+        else:
+            self.stdout.write(json.dumps(report, indent=2))
+
+    def _benchmark_pdf(self, directory, pages, rows_per_page, workers):
+        """Measure table extraction and parsing of one generated PDF."""
+        pdf_path = os.path.join(directory, f'ministry-{pages}.pdf')
+        with open(pdf_path, 'wb') as pdf_file:
+            pdf_file.write(build_ministry_pdf(pages, rows_per_page=rows_per_page))
+
+        with transaction.atomic():
+            pdf_document = PDFDocument.objects.create(
+                file=f'pdfs/benchmark-{pages}.pdf',
+                original_filename=f'benchmark-{pages}.pdf',
+                status=PDFStatus.PENDING,
+            )
+            pdf_document.local_path = pdf_path
+            PDFExtractionCache.clear()
+
+            with StageMeter() as extract_meter:
+                extraction = PDFExtractionCache.get_result(
+                    pdf_document,
+                    workers=workers,
+                    layout=CroatianLaborPDFParser.table_layout(),
+                )
+            rows = sum(len(table['rows']) for table in extraction.tables)
+
+            # Reuses the cached extraction, so this measures cleaning and saving
+            with StageMeter() as parse_meter:
+                extracted = CroatianLaborPDFParser(pdf_document, workers=workers).process_and_save()
+            parse_rows = extracted.raw_data['parse_stats']['rows_seen']
+
+            PDFExtractionCache.clear()
+            transaction.set_rollback(True)
+
+        return [
+            self._entry('extract', pages, 'pages', extract_meter, rows=rows, pages=extraction.page_count),
+            self._entry('parse', pages, 'pages', parse_meter, rows=parse_rows, pages=extraction.page_count),
+        ]
+
+    def _benchmark_sync(self, companies):
+        """Measure syncing a company fixture into an empty table, then again onto the same companies."""
+        fixture = make_company_fixture(companies)
+        entries = []
+
+        with transaction.atomic():
+            for benchmark in ('sync_new', 'sync_existing'):
+                pdf_document = PDFDocument.objects.create(
+                    file=f'pdfs/benchmark-{benchmark}.pdf',
+                    original_filename=f'benchmark-{benchmark}.pdf',
+                    status=PDFStatus.COMPLETED,
+                )
+                ExtractedData.objects.create(
+                    pdf_document=pdf_document,
+                    data_type=DataType.STRUCTURED_COMPANIES,
+                    raw_data={'companies': fixture, 'total_count': companies},
+                    processed=True,
+                )
+
+                with StageMeter() as meter:
+                    CompanySyncService(pdf_document).sync_companies(mode=SyncMode.FULL)
+                entries.append(self._entry(benchmark, companies, 'companies', meter, rows=companies))
+
+            transaction.set_rollback(True)
+
+        return entries
+
+    @staticmethod
+    def _entry(benchmark, size, unit, meter, rows, pages=None):
+        duration = meter.metrics['duration_seconds']
+        return {
+            'benchmark': benchmark,
+            'size': size,
+            'unit': unit,
+            'rows': rows,
+            'pages': pages,
+            'duration_seconds': duration,
+            'cpu_seconds': meter.metrics['cpu_seconds'],
+            'rows_per_second': round(rows / duration) if duration else None,
+            'pages_per_second': round(pages / duration, 2) if pages and duration else None,
+            'queries': meter.metrics['queries'],
+            'peak_rss_delta_kb': meter.metrics['peak_rss_delta_kb'],
+            'peak_rss_kb': meter.metrics['peak_rss_kb'],
+            'children_peak_rss_kb': meter.metrics['children_peak_rss_kb'],
+        }
+
+    @staticmethod
+    def _current_commit():
+        """Return the checked-out git commit, or None outside a git checkout."""
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', 'HEAD'],
+                cwd=settings.BASE_DIR,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
@@ -3,25 +3,127 @@ import asyncio
 
 from django.core.management.base import BaseCommand, CommandError
 
-from apps.pdf_processor.services import PDFCronPipelineService
+from apps.pdf_processor.constants import DEFAULT_PDF_SOURCE, SyncMode
+from apps.pdf_processor.services import PARSER_REGISTRY, PDFCronPipelineService
 
 
 class Command(BaseCommand):
-    help = "Run full PDF pipeline: scrape, download, process, parse and sync companies."
+    help = (
+        "Run full PDF pipeline: scrape, download, process, parse and sync companies. "
+        "With --document-id, process an already stored document instead; with --resume, "
+        "continue a failed document after its last checkpoint; "
+        "with --sources-json, run several source pages concurrently."
+    )
 
     def add_arguments(self, parser):
-        parser.add_argument('--page-url', required=True, help='Web page URL to scrape for PDF link.')
-        parser.add_argument('--attribute-name', required=True, help='HTML attribute used to find the PDF link.')
+        parser.add_argument('--page-url', help='Web page URL to scrape for PDF link.')
+        parser.add_argument('--attribute-name', help='HTML attribute used to find the PDF link.')
+        parser.add_argument(
+            '--source',
+            choices=sorted(PARSER_REGISTRY),
+            default=DEFAULT_PDF_SOURCE,
+            help=f'Registered PDF source whose parser handles the document (default: {DEFAULT_PDF_SOURCE}).',
+        )
+        parser.add_argument(
+            '--document-id',
+            type=int,
+            help='Process, parse and sync an existing PDF document instead of scraping.',
+        )
+        parser.add_argument(
+            '--resume',
+            type=int,
+            metavar='DOCUMENT_ID',
+            help=(
+                'Resume an existing PDF document: skip the stages it has completed '
+                '(downloaded, extracted, parsed, synced) and reuse their stored output.'
+            ),
+        )
         parser.add_argument(
             '--headers-json',
             required=False,
             help='Optional JSON object with custom request headers.',
         )
+        parser.add_argument(
+            '--sources-json',
+            help=(
+                'JSON list of source configs, each with "page_url", "attribute_name" '
+                'and optional "headers" and "source". Replaces --page-url/--attribute-name.'
+            ),
+        )
+        parser.add_argument(
+            '--max-concurrency',
+            type=int,
+            default=4,
+            help='Maximum number of sources downloaded at the same time with --sources-json (default: 4).',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Number of processes used for PDF table detection (default: 1, sequential).',
+        )
+        parser.add_argument(
+            '--sync-mode',
+            choices=SyncMode.values,
+            default=None,
+            help=(
+                'full: reset and re-apply the whole blacklist; diff: only apply changes since the previous document; '
+                'chunked: like full, but committed in chunks of --sync-batch-size rows and swapped in at the end. '
+                'Defaults to settings.PDF_SYNC_MODE (diff).'
+            ),
+        )
+        parser.add_argument(
+            '--sync-batch-size',
+            type=int,
+            default=None,
+            help='Rows per batch in the company sync, and per transaction with --sync-mode chunked (default: 500).',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Process the PDF even if it is unchanged since the last completed run.',
+        )
 
     def handle(self, *args, **options):
         page_url = options['page_url']
         attribute_name = options['attribute_name']
         headers_json = options.get('headers_json')
+        workers = options['workers']
+
+        if workers < 1:
+            raise CommandError('--workers must be a positive integer.')
+        if options['sync_batch_size'] is not None and options['sync_batch_size'] < 1:
+            raise CommandError('--sync-batch-size must be a positive integer.')
+
+        if options.get('sources_json'):
+            self._run_many(options)
+            return
+
+        sync_mode = options['sync_mode']
+
+        if options.get('document_id') is not None and options.get('resume') is not None:
+            raise CommandError('Use either --document-id or --resume, not both.')
+
+        if options.get('document_id') is not None or options.get('resume') is not None:
+            resume = options.get('resume') is not None
+            try:
+                result = PDFCronPipelineService.process_document(
+                    options['resume'] if resume else options['document_id'],
+                    workers=workers,
+                    sync_mode=sync_mode,
+                    resume=resume,
+                    sync_batch_size=options['sync_batch_size'],
+                )
+            except Exception as exc:
+                raise CommandError(f'Pipeline failed: {exc}') from exc
+
+            self.stdout.write(self.style.SUCCESS('PDF pipeline completed successfully.'))
+            self._write_stage_summary(result.get('stages'))
+            self.stdout.write(json.dumps(result, ensure_ascii=False, indent=2, default=str))
+            return
+
+        if not page_url or not attribute_name:
+            raise CommandError('--page-url and --attribute-name are required unless --document-id or --resume is given.')
 
         headers = None
         if headers_json:
@@ -38,10 +140,78 @@ class Command(BaseCommand):
                     page_url=page_url,
                     attribute_name=attribute_name,
                     headers=headers,
+                    workers=workers,
+                    sync_mode=sync_mode,
+                    skip_unchanged=not options['force'],
+                    source=options['source'],
+                    sync_batch_size=options['sync_batch_size'],
                 )
             )
         except Exception as exc:
             raise CommandError(f'Pipeline failed: {exc}') from exc
 
-        self.stdout.write(self.style.SUCCESS('PDF pipeline completed successfully.'))
+        if result.get('status') == 'unchanged':
+            self.stdout.write(self.style.SUCCESS(
+                f"PDF unchanged since document {result['pdf_document_id']}; nothing to do."
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS('PDF pipeline completed successfully.'))
+        self._write_stage_summary(result.get('stages'))
+        self.stdout.write(json.dumps(result, ensure_ascii=False, indent=2, default=str))
+
+    def _write_stage_summary(self, stages):
+        """Write one line of resource metrics per pipeline stage."""
+        if not stages:
+            return
+
+        self.stdout.write('Stage metrics:')
+        for stage, metrics in stages.items():
+            parts = [f"{metrics.get('duration_seconds', 0):.3f}s wall"]
+            if metrics.get('cpu_seconds') is not None:
+                parts.append(f"{metrics['cpu_seconds']:.3f}s cpu")
+            if metrics.get('peak_rss_kb') is not None:
+                parts.append(f"{metrics['peak_rss_kb']} KiB peak RSS (+{metrics.get('peak_rss_delta_kb') or 0})")
+            if metrics.get('children_peak_rss_kb'):
+                parts.append(f"{metrics['children_peak_rss_kb']} KiB worker peak RSS")
+            if metrics.get('queries') is not None:
+                parts.append(f"{metrics['queries']} queries")
+            if metrics.get('bytes_downloaded') is not None:
+                parts.append(f"{metrics['bytes_downloaded']} bytes")
+            if metrics.get('pages') is not None:
+                parts.append(f"{metrics['pages']} pages")
+            self.stdout.write(f"  {stage:<14} {metrics.get('status', '')}: {', '.join(parts)}")
+
+    def _run_many(self, options):
+        if options['max_concurrency'] < 1:
+            raise CommandError('--max-concurrency must be a positive integer.')
+
+        try:
+            sources = json.loads(options['sources_json'])
+        except json.JSONDecodeError as exc:
+            raise CommandError(f'Invalid --sources-json: {exc}') from exc
+        if not isinstance(sources, list) or not all(isinstance(source, dict) for source in sources):
+            raise CommandError('--sources-json must be a JSON list of objects.')
+
+        try:
+            result = asyncio.run(
+                PDFCronPipelineService.run_many_async(
+                    sources,
+                    max_concurrency=options['max_concurrency'],
+                    workers=options['workers'],
+                    sync_mode=options['sync_mode'],
+                    skip_unchanged=not options['force'],
+                    sync_batch_size=options['sync_batch_size'],
+                )
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+
+        message = (
+            f"Processed {result['total_sources']} source(s): {result['completed']} completed, "
+            f"{result['unchanged']} unchanged, {result['failed']} failed."
+        )
+        if result['failed']:
+            self.stdout.write(self.style.WARNING(message))
+        else:
+            self.stdout.write(self.style.SUCCESS(message))
         self.stdout.write(json.dumps(result, ensure_ascii=False, indent=2, default=str))
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pdf_processor', '0007_alter_extracteddata_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pdfdocument',
+            name='content_hash',
+            field=models.CharField(blank=True, db_index=True, help_text='SHA-256 of the file content', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='pdfdocument',
+            name='etag',
+            field=models.CharField(blank=True, help_text='ETag returned when the PDF was downloaded', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='pdfdocument',
+            name='last_modified',
+            field=models.CharField(blank=True, help_text='Last-Modified header returned when the PDF was downloaded', max_length=64),
+        ),
+    ]
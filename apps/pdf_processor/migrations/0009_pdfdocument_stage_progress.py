@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pdf_processor', '0008_pdfdocument_content_hash_etag_last_modified'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pdfdocument',
+            name='stage_progress',
+            field=models.JSONField(blank=True, default=dict, help_text='Per-stage pipeline status and timings, keyed by stage name'),
+        ),
+        migrations.AlterField(
+            model_name='pdfdocument',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('queued', 'Queued'), ('processing', 'Processing'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=20),
+        ),
+    ]
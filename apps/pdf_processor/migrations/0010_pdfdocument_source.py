@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 16:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pdf_processor', '0009_pdfdocument_stage_progress'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pdfdocument',
+            name='source',
+            field=models.CharField(db_index=True, default='croatian_labor', help_text='PDF source; selects the registered parser', max_length=50),
+        ),
+    ]
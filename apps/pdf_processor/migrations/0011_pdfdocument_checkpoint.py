@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 16:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pdf_processor', '0010_pdfdocument_source'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pdfdocument',
+            name='checkpoint',
+            field=models.CharField(blank=True, choices=[('downloaded', 'Downloaded'), ('extracted', 'Tables extracted'), ('parsed', 'Companies parsed'), ('synced', 'Companies synced')], help_text='Last pipeline checkpoint whose output is stored; resumed runs continue after it', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='extracteddata',
+            name='data_type',
+            field=models.CharField(choices=[('structured_companies', 'Structured Companies'), ('raw_tables', 'Raw Tables')], max_length=20),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:11
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0012_alter_company_category_alter_company_description'),
+        ('pdf_processor', '0011_pdfdocument_checkpoint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingBlacklistEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='companies.company')),
+                ('pdf_document', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pending_blacklist', to='pdf_processor.pdfdocument')),
+            ],
+            options={
+                'db_table': 'pdf_processor_pendingblacklistentry',
+                'unique_together': {('pdf_document', 'company')},
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pdf_processor', '0012_pendingblacklistentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExtractedCompanyRow',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField(help_text='Row order within the document')),
+                ('page_number', models.IntegerField(blank=True, null=True)),
+                ('legal_name', models.CharField(max_length=255)),
+                ('legal_id', models.CharField(db_index=True, max_length=50)),
+                ('address', models.TextField(blank=True)),
+                ('extra', models.JSONField(blank=True, default=dict, help_text="Values of the parser's other columns, e.g. index")),
+                ('extracted_data', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='company_rows', to='pdf_processor.extracteddata')),
+            ],
+            options={
+                'db_table': 'pdf_processor_extractedcompanyrow',
+                'ordering': ['extracted_data', 'position'],
+                'unique_together': {('extracted_data', 'position')},
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pdf_processor', '0013_extractedcompanyrow'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='extractedcompanyrow',
+            name='legal_id',
+            field=models.TextField(db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='extractedcompanyrow',
+            name='legal_name',
+            field=models.TextField(),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:05
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pdf_processor', '0014_alter_extractedcompanyrow_text_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pendingblacklistentry',
+            name='deleted_at',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='pendingblacklistentry',
+            name='modified_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
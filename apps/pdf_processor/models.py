@@ -1,6 +1,7 @@
 from django.db import models
 from apps.common.models import BaseModel
-from .constants import PDFStatus, DataType
+from .constants import DEFAULT_PDF_SOURCE, CompanyPayloadFormat, PDFStatus, DataType, PipelineCheckpoint
+from .payloads import decode_companies
 
 
 class PDFDocument(BaseModel):
@@ -9,12 +10,32 @@ class PDFDocument(BaseModel):
     original_filename = models.CharField(max_length=255)
     scraped_url = models.URLField(null=True, blank=True, help_text="URL the PDF was scraped from")
     source_url = models.URLField(null=True, blank=True, help_text="URL the PDF was downloaded from")
+    source = models.CharField(
+        max_length=50,
+        default=DEFAULT_PDF_SOURCE,
+        db_index=True,
+        help_text="PDF source; selects the registered parser"
+    )
     status = models.CharField(
         max_length=20,
         choices=PDFStatus.choices,
         default=PDFStatus.PENDING
     )
     error_message = models.TextField(blank=True)
+    stage_progress = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Per-stage pipeline status and timings, keyed by stage name"
+    )
+    checkpoint = models.CharField(
+        max_length=20,
+        choices=PipelineCheckpoint.choices,
+        blank=True,
+        help_text="Last pipeline checkpoint whose output is stored; resumed runs continue after it"
+    )
+    content_hash = models.CharField(max_length=64, blank=True, db_index=True, help_text="SHA-256 of the file content")
+    etag = models.CharField(max_length=255, blank=True, help_text="ETag returned when the PDF was downloaded")
+    last_modified = models.CharField(max_length=64, blank=True, help_text="Last-Modified header returned when the PDF was downloaded")
 
     class Meta:
         db_table = 'pdf_processor_pdfdocument'
@@ -23,6 +44,13 @@ class PDFDocument(BaseModel):
     def __str__(self):
         return f"{self.original_filename} - {self.status}"
 
+    def reached_checkpoint(self, checkpoint: str) -> bool:
+        """Return True if the pipeline has stored the output of `checkpoint` (or a later one)."""
+        if not self.checkpoint:
+            return False
+        order = PipelineCheckpoint.values
+        return order.index(self.checkpoint) >= order.index(checkpoint)
+
 
 class ExtractedData(BaseModel):
     """Model to store data extracted from PDFs."""
@@ -46,3 +74,85 @@ class ExtractedData(BaseModel):
 
     def __str__(self):
         return f"{self.pdf_document.original_filename} - {self.data_type}"
+
+    @property
+    def payload_format(self) -> str:
+        return self.raw_data.get('format', CompanyPayloadFormat.ROWS)
+
+    def get_companies(self):
+        """Return the stored companies as dicts, decoding columnar payloads and reading table rows."""
+        if self.payload_format == CompanyPayloadFormat.TABLE:
+            schema = self.raw_data['schema']
+            return [row.as_dict(schema) for row in self.company_rows.iterator(chunk_size=2000)]
+        return decode_companies(self.raw_data)
+
+
+class ExtractedCompanyRow(models.Model):
+    """
+    One parsed company of an ExtractedData stored in the table payload format.
+
+    Unlike the app's other models it does not extend BaseModel: rows are
+    bulk-inserted once and deleted with their ExtractedData, never edited, so
+    the timestamp columns would only add three values to every company row.
+    """
+    extracted_data = models.ForeignKey(
+        ExtractedData,
+        on_delete=models.CASCADE,
+        related_name='company_rows'
+    )
+    position = models.PositiveIntegerField(help_text="Row order within the document")
+    page_number = models.IntegerField(null=True, blank=True)
+    # Unbounded like the JSON payloads: merged continuation rows can be long
+    legal_name = models.TextField()
+    legal_id = models.TextField(db_index=True)
+    address = models.TextField(blank=True)
+    extra = models.JSONField(default=dict, blank=True, help_text="Values of the parser's other columns, e.g. index")
+
+    # Schema keys stored in their own columns
+    fields_in_columns = ('page_number', 'legal_name', 'legal_id', 'address')
+
+    class Meta:
+        db_table = 'pdf_processor_extractedcompanyrow'
+        ordering = ['extracted_data', 'position']
+        unique_together = ('extracted_data', 'position')
+
+    def __str__(self):
+        return f"{self.legal_name} ({self.legal_id})"
+
+    @classmethod
+    def from_company(cls, extracted_data: ExtractedData, position: int, company) -> 'ExtractedCompanyRow':
+        return cls(
+            extracted_data=extracted_data,
+            position=position,
+            page_number=company.get('page_number'),
+            legal_name=company.get('legal_name') or '',
+            legal_id=company.get('legal_id') or '',
+            address=company.get('address') or '',
+            extra={key: value for key, value in company.items() if key not in cls.fields_in_columns},
+        )
+
+    def as_dict(self, schema):
+        """Return the row as a parsed company dict with the schema's keys, in order."""
+        values = {**self.extra, **{key: getattr(self, key) for key in self.fields_in_columns}}
+        return {key: values.get(key) for key in schema}
+
+
+class PendingBlacklistEntry(BaseModel):
+    """Company matched or created by a chunked sync, blacklisted when the sync swaps its list in."""
+    pdf_document = models.ForeignKey(
+        PDFDocument,
+        on_delete=models.CASCADE,
+        related_name='pending_blacklist'
+    )
+    company = models.ForeignKey(
+        'companies.Company',
+        on_delete=models.CASCADE,
+        related_name='+'
+    )
+
+    class Meta:
+        db_table = 'pdf_processor_pendingblacklistentry'
+        unique_together = ('pdf_document', 'company')
+
+    def __str__(self):
+        return f"{self.pdf_document_id} - {self.company_id}"
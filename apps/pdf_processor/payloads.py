@@ -0,0 +1,88 @@
+"""
+Storage formats of the parsed company list in ExtractedData.raw_data.
+
+The rows format stores one dict per company, repeating every key. The
+columnar formats store a schema header (the keys, once) and one value array
+per key, optionally zlib-compressed. The table format keeps only the header
+in raw_data; its rows live in ExtractedCompanyRow.
+
+pack_json/unpack_json also compress the raw tables kept at the extracted
+checkpoint.
+"""
+import base64
+import json
+import zlib
+from typing import Any, Dict, List
+
+from .constants import CompanyPayloadFormat
+
+
+def pack_json(value: Any) -> str:
+    """Serialize value as zlib-compressed, base64-encoded JSON."""
+    packed = zlib.compress(json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+    return base64.b64encode(packed).decode('ascii')
+
+
+def unpack_json(packed: str) -> Any:
+    """Reverse pack_json."""
+    return json.loads(zlib.decompress(base64.b64decode(packed)).decode('utf-8'))
+
+
+def company_schema(columns: List[str]) -> List[str]:
+    """Return the stored keys of companies parsed with the given table columns."""
+    return [*columns, 'page_number']
+
+
+def encode_companies(companies: List[Dict[str, Any]], schema: List[str], payload_format: str) -> Dict[str, Any]:
+    """
+    Encode companies for raw_data in the given format.
+
+    Args:
+        companies: Parsed companies, each holding the schema's keys
+        schema: Keys to store, in order
+        payload_format: A CompanyPayloadFormat value
+
+    Returns:
+        The raw_data keys holding the companies; for the table format only
+        the header, the caller stores the rows
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if payload_format == CompanyPayloadFormat.ROWS:
+        return {'companies': companies}
+
+    if payload_format == CompanyPayloadFormat.TABLE:
+        return {'format': CompanyPayloadFormat.TABLE.value, 'schema': schema}
+
+    if payload_format not in (CompanyPayloadFormat.COLUMNAR, CompanyPayloadFormat.COLUMNAR_ZLIB):
+        raise ValueError(f"Unknown company payload format: {payload_format}")
+
+    columns = [[company.get(key) for company in companies] for key in schema]
+    if payload_format == CompanyPayloadFormat.COLUMNAR_ZLIB:
+        columns = pack_json(columns)
+
+    return {'format': str(payload_format), 'schema': schema, 'columns': columns}
+
+
+def decode_companies(raw_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Return the companies stored in raw_data as dicts, whatever the format.
+
+    Raises:
+        ValueError: For the table format, whose rows are not in raw_data
+    """
+    payload_format = raw_data.get('format', CompanyPayloadFormat.ROWS)
+
+    if payload_format == CompanyPayloadFormat.ROWS:
+        return raw_data.get('companies', [])
+
+    if payload_format == CompanyPayloadFormat.TABLE:
+        raise ValueError("Companies in the table format are stored in ExtractedCompanyRow")
+
+    columns = raw_data['columns']
+    if payload_format == CompanyPayloadFormat.COLUMNAR_ZLIB:
+        columns = unpack_json(columns)
+
+    schema = raw_data['schema']
+    return [dict(zip(schema, values)) for values in zip(*columns)]
@@ -1,8 +1,19 @@
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
+from .constants import DataType
 from .models import PDFDocument, ExtractedData
+from .services import PARSER_REGISTRY, compute_upload_hash
 
 
 class ExtractedDataSerializer(serializers.ModelSerializer):
+    """
+    Renders raw_data without its payload: companies (or raw tables) are only
+    served a page at a time by ExtractedDataViewSet.companies.
+    """
+
+    # raw_data keys holding the rows of each payload format and the raw tables
+    payload_keys = ('companies', 'columns', 'tables')
+
     class Meta:
         model = ExtractedData
         fields = [
@@ -16,9 +27,17 @@ class ExtractedDataSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'modified_at']
 
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        header = {key: value for key, value in instance.raw_data.items() if key not in self.payload_keys}
+        if instance.data_type == DataType.STRUCTURED_COMPANIES:
+            header['format'] = instance.payload_format
+        data['raw_data'] = header
+        return data
+
 
 class PDFDocumentSerializer(serializers.ModelSerializer):
-    extracted_data = ExtractedDataSerializer(many=True, read_only=True)
+    extracted_data = serializers.SerializerMethodField()
 
     class Meta:
         model = PDFDocument
@@ -26,21 +45,45 @@ class PDFDocumentSerializer(serializers.ModelSerializer):
             'id',
             'file',
             'original_filename',
+            'source',
             'source_url',
             'status',
+            'stage_progress',
+            'checkpoint',
             'error_message',
+            'content_hash',
             'extracted_data',
             'created_at',
             'modified_at'
         ]
-        read_only_fields = ['id', 'status', 'error_message', 'created_at', 'modified_at']
+        read_only_fields = ['id', 'status', 'stage_progress', 'checkpoint', 'error_message', 'content_hash', 'created_at', 'modified_at']
+
+    @extend_schema_field(ExtractedDataSerializer(many=True))
+    def get_extracted_data(self, obj):
+        # Raw tables are a pipeline checkpoint (often several MB), not document data
+        extracted_data = obj.extracted_data.exclude(data_type=DataType.RAW_TABLES)
+        return ExtractedDataSerializer(extracted_data, many=True, context=self.context).data
+
+    def validate_source(self, value):
+        if value not in PARSER_REGISTRY:
+            raise serializers.ValidationError(
+                f"Unknown source. Registered sources: {', '.join(sorted(PARSER_REGISTRY))}."
+            )
+        return value
 
     def create(self, validated_data):
         # Automatically set original filename from uploaded file
         if 'file' in validated_data:
             validated_data['original_filename'] = validated_data['file'].name
+            validated_data['content_hash'] = compute_upload_hash(validated_data['file'])
         return super().create(validated_data)
 
+    def update(self, instance, validated_data):
+        # A replaced file gets a new hash, so cached copies of the old one are not reused
+        if 'file' in validated_data:
+            validated_data['content_hash'] = compute_upload_hash(validated_data['file'])
+        return super().update(instance, validated_data)
+
 
 class PDFDocumentListSerializer(serializers.ModelSerializer):
     """Lightweight serializer for list views."""
@@ -54,6 +97,7 @@ class PDFDocumentListSerializer(serializers.ModelSerializer):
         fields = [
             'id',
             'original_filename',
+            'source',
             'source_url',
             'status',
             'extracted_data_count',
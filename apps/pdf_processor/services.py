@@ -1,13 +1,34 @@
 import pdfplumber
 import asyncio
+import hashlib
+import math
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from asgiref.sync import sync_to_async
-from typing import List, Dict, Any, Optional
-from .models import PDFDocument, ExtractedData
-from .constants import PDFStatus, DataType
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set, Tuple
+from .models import PDFDocument, ExtractedData, ExtractedCompanyRow
+from .constants import DEFAULT_PDF_SOURCE, CompanyPayloadFormat, PDFStatus, DataType, PipelineCheckpoint, PipelineStage, SyncMode
+from .cleaning import HEADER_KEYWORDS, REJECTION_REASONS, CompanyTableCleaner, merge_continuation_rows
+from .instrumentation import StageMeter
+from .extraction import TableLayout, extract_page_range, extract_page_table
+from .payloads import company_schema, encode_companies, pack_json, unpack_json
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urljoin
-from django.core.files.base import ContentFile
+from apps.common.services import JobQueueService
+from django.conf import settings
+from django.core.files.base import File
+from django.db import transaction
+from django.db.models import F, Q
+from django.db.models.functions import Lower
 from django.utils import timezone
 import logging
 
@@ -15,14 +36,185 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def compute_file_hash(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Return the SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compute_upload_hash(uploaded_file) -> str:
+    """Return the SHA-256 hex digest of an uploaded (or any Django) file, read in chunks."""
+    digest = hashlib.sha256()
+    for chunk in uploaded_file.chunks():
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+class LocalPDFCache:
+    """
+    Resolve a local file path for a document's PDF, whatever the storage backend.
+
+    Lookup order:
+    1. The spool file left by the download step (pdf_document.local_path)
+    2. The storage's own local path (FileSystemStorage)
+    3. A bounded on-disk cache keyed by document id and content hash (or the
+       storage name for documents saved without a hash), filled
+       by reading the file from storage once (e.g. MediaCloudinaryStorage,
+       which has no local path)
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.directory = directory or getattr(
+            settings,
+            'PDF_LOCAL_CACHE_DIR',
+            os.path.join(tempfile.gettempdir(), 'expats-pdf-cache'),
+        )
+        self.max_bytes = max_bytes or getattr(settings, 'PDF_LOCAL_CACHE_MAX_BYTES', 200 * 1024 * 1024)
+
+    def get_path(self, pdf_document: PDFDocument) -> str:
+        """
+        Return a local path for the document's PDF, downloading it if needed.
+        
+        Raises:
+            ValueError: If the document has no file
+        """
+        local_path = getattr(pdf_document, 'local_path', None)
+        if local_path and os.path.exists(local_path):
+            return local_path
+        
+        if not pdf_document.file:
+            raise ValueError(f"PDF document {pdf_document.pk} has no file")
+        
+        try:
+            storage_path = pdf_document.file.path
+        except NotImplementedError:
+            storage_path = None
+        if storage_path and os.path.exists(storage_path):
+            return storage_path
+        
+        cache_path = os.path.join(self.directory, self._cache_key(pdf_document))
+        if os.path.exists(cache_path):
+            # Mark as recently used for eviction
+            os.utime(cache_path)
+            return cache_path
+        
+        self._download(pdf_document, cache_path)
+        self._evict(keep=cache_path)
+        return cache_path
+
+    def _cache_key(self, pdf_document: PDFDocument) -> str:
+        # The storage name is fixed once saved, unlike modified_at, which every status save bumps
+        version = pdf_document.content_hash or hashlib.sha256(pdf_document.file.name.encode()).hexdigest()[:16]
+        return f"{pdf_document.pk}-{version}.pdf"
+
+    def _download(self, pdf_document: PDFDocument, cache_path: str) -> None:
+        """Copy the file from storage into the cache, atomically."""
+        os.makedirs(self.directory, exist_ok=True)
+        partial = tempfile.NamedTemporaryFile(dir=self.directory, suffix='.part', delete=False)
+        try:
+            with partial:
+                with pdf_document.file.open('rb') as source:
+                    for chunk in source.chunks():
+                        partial.write(chunk)
+            os.replace(partial.name, cache_path)
+        except Exception:
+            if os.path.exists(partial.name):
+                os.remove(partial.name)
+            raise
+
+    def _evict(self, keep: str) -> None:
+        """Delete least recently used cached files until the cache fits max_bytes."""
+        entries = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.endswith('.pdf') and path != keep:
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+        
+        total = sum(size for _, size, _ in entries) + os.path.getsize(keep)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+
+def get_local_pdf_path(pdf_document: PDFDocument) -> str:
+    """Return a local path for a document's PDF; every extraction path reads through this."""
+    return LocalPDFCache().get_path(pdf_document)
+
+
+def discard_local_copy(pdf_document: PDFDocument) -> None:
+    """Delete the spool file left by the download step, if any."""
+    local_path = getattr(pdf_document, 'local_path', None)
+    if local_path and os.path.exists(local_path):
+        os.remove(local_path)
+    pdf_document.local_path = None
+
+
+def build_http_session(
+    retries: int = 3,
+    backoff_factor: float = 0.5,
+    pool_maxsize: int = 10,
+) -> requests.Session:
+    """
+    Build a requests session with keep-alive connection pooling and retries.
+
+    Transient failures (connection errors, 429 and 5xx responses) are retried
+    with exponential backoff for idempotent methods only.
+
+    Args:
+        retries: Maximum number of retries per request
+        
+        backoff_factor: Base delay in seconds between retries (doubles each time)
+        
+        pool_maxsize: Connections kept alive per host
+
+    Returns:
+        requests.Session: Session ready to be shared by scrapers
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({'GET', 'HEAD'}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_maxsize=pool_maxsize)
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 class WebPDFScraper:
-    """Service class for scraping and downloading PDF files from web pages."""
+    """
+    Service class for scraping and downloading PDF files from web pages.
+
+    Use it as a context manager (or call close()) to release the pooled
+    connections of the session it created.
+    """
+
+    # (connect, read) timeouts in seconds
+    page_timeout = (5, 10)
+    download_timeout = (5, 30)
+    # Bytes read per chunk when streaming a PDF download
+    chunk_size = 64 * 1024
 
     def __init__(
         self,
         page_url: str,
         attribute_name: str = None, 
-        headers: Dict[str, str] = None
+        headers: Dict[str, str] = None,
+        session: Optional[requests.Session] = None,
     ):
         """
         Initialize the web scraper.
@@ -33,12 +225,34 @@ class WebPDFScraper:
             attribute_name: Custom attribute name to search for (e.g., 'data-fileid')
             
             headers: Optional HTTP headers for the request
+            
+            session: Optional requests session; defaults to a pooled session
+                     with retries from build_http_session(), closed by close().
+                     A given session is left open for its owner.
         """
         self.page_url = page_url 
         self.attribute_name = attribute_name
         self.headers = headers or {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
+        # The page fetch and the PDF download reuse the same keep-alive connection
+        self.session = session or build_http_session()
+        self._owns_session = session is None
+        # Last completed document from this page, set when skipping unchanged PDFs
+        self.previous_document = None
+        # StageMeter results of the last download, keyed by pipeline stage
+        self.metrics: Dict[str, Dict[str, Any]] = {}
+
+    def close(self) -> None:
+        """Close the HTTP session if this scraper created it."""
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> 'WebPDFScraper':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def find_pdf_link(self) -> str:
         """
@@ -75,7 +289,7 @@ class WebPDFScraper:
                 raise ValueError("attribute_name is required for attribute search")
 
             # Fetch the page
-            response = requests.get(self.page_url, headers=self.headers, timeout=10)
+            response = self.session.get(self.page_url, headers=self.headers, timeout=self.page_timeout)
             response.raise_for_status()
             response.encoding = 'utf-8'
             
@@ -98,18 +312,32 @@ class WebPDFScraper:
             raise ValueError(f"Failed to fetch page: {str(e)}")
 
 
+    def get_previous_document(self) -> Optional[PDFDocument]:
+        """Return the latest completed document scraped from this page, if any."""
+        return PDFDocument.objects.filter(
+            scraped_url=self.page_url,
+            status=PDFStatus.COMPLETED,
+        ).exclude(content_hash='').order_by('-created_at').first()
+
     def download_and_create_document(
         self,
         attribute_name: str = None,
-    ) -> PDFDocument:
+        skip_unchanged: bool = False,
+    ) -> Optional[PDFDocument]:
         """
         Download PDF from found link and create a PDFDocument record.
         
         Args:
             attribute_name: Optional override for attribute name
             
+            skip_unchanged: Compare against the last completed document from
+                            this page. A conditional GET (ETag/Last-Modified)
+                            avoids the download when the server supports it,
+                            and a matching content hash avoids the storage write.
+            
         Returns:
-            PDFDocument: Created document instance
+            PDFDocument: Created document instance, or None if skip_unchanged
+            is set and the PDF did not change (see self.previous_document)
             
         Raises:
             ValueError: If download or creation fails
@@ -118,52 +346,138 @@ class WebPDFScraper:
         if attribute_name:
             self.attribute_name = attribute_name
         
+        self.metrics = {}
         try:
             # Find PDF link
-            pdf_url = self.find_pdf_link()
-            
-            # Download PDF file
-            response = requests.get(pdf_url, headers=self.headers, timeout=30)
-            response.raise_for_status()
-            
-            # Extract filename from URL
-            filename = pdf_url.split('/')[-1].split('?')[0]
-            if not filename.lower().endswith('.pdf'):
-                filename = f"{filename}.pdf"
+            with self._measure(PipelineStage.FIND_PDF_LINK):
+                pdf_url = self.find_pdf_link()
             
-            # Create PDFDocument
-            pdf_document = PDFDocument(
-                original_filename=filename,
-                scraped_url=self.page_url,
-                source_url=pdf_url,
-                status=PDFStatus.PENDING
-            )
-            
-            # Save the file
-            pdf_document.file.save(
-                filename,
-                ContentFile(response.content),
-                save=True
-            )
-            
-            return pdf_document
+            with self._measure(PipelineStage.DOWNLOAD) as meter:
+                return self._download_document(pdf_url, skip_unchanged, meter)
             
         except Exception as e:
             raise ValueError(f"Failed to download and create document: {str(e)}")
 
+    def _measure(self, stage: str) -> StageMeter:
+        """Return a StageMeter whose metrics are stored under the stage in self.metrics."""
+        meter = StageMeter()
+        self.metrics[stage] = meter.metrics
+        return meter
+
+    def _download_document(self, pdf_url: str, skip_unchanged: bool, meter: StageMeter) -> Optional[PDFDocument]:
+        """Download the PDF at pdf_url and create its PDFDocument (see download_and_create_document)."""
+        meter.metrics['bytes_downloaded'] = 0
+        self.previous_document = self.get_previous_document() if skip_unchanged else None
+        previous = self.previous_document
+        
+        request_headers = dict(self.headers)
+        if previous and previous.source_url == pdf_url:
+            if previous.etag:
+                request_headers['If-None-Match'] = previous.etag
+            if previous.last_modified:
+                request_headers['If-Modified-Since'] = previous.last_modified
+        
+        # Stream the PDF to a local spool file, hashing it on the way
+        with self.session.get(
+            pdf_url,
+            headers=request_headers,
+            timeout=self.download_timeout,
+            stream=True,
+        ) as response:
+            if previous and response.status_code == 304:
+                logger.info('PDF not modified since document %s: %s', previous.id, pdf_url)
+                return None
+            
+            response.raise_for_status()
+            spool_path, content_hash = self._spool_response(response)
+        
+        meter.metrics['bytes_downloaded'] = os.path.getsize(spool_path)
+        if previous and previous.content_hash == content_hash:
+            logger.info('PDF content unchanged since document %s: %s', previous.id, pdf_url)
+            os.remove(spool_path)
+            return None
+        
+        # Extract filename from URL
+        filename = pdf_url.split('/')[-1].split('?')[0]
+        if not filename.lower().endswith('.pdf'):
+            filename = f"{filename}.pdf"
+        
+        # Create PDFDocument
+        pdf_document = PDFDocument(
+            original_filename=filename,
+            scraped_url=self.page_url,
+            source_url=pdf_url,
+            status=PDFStatus.PENDING,
+            content_hash=content_hash,
+            etag=response.headers.get('ETag', ''),
+            last_modified=response.headers.get('Last-Modified', ''),
+        )
+        
+        # Save the file, handing the spool file object to the storage backend
+        try:
+            with open(spool_path, 'rb') as spool_file:
+                pdf_document.file.save(
+                    filename,
+                    File(spool_file),
+                    save=True
+                )
+        except Exception:
+            os.remove(spool_path)
+            raise
+        
+        # Extraction reads the local copy instead of fetching it back from storage
+        pdf_document.local_path = spool_path
+        
+        return pdf_document
+
+    def _spool_response(self, response: requests.Response) -> Tuple[str, str]:
+        """
+        Write a streamed response body to a temporary file in chunks.
+
+        Returns:
+            Tuple of (temporary file path, SHA-256 hex digest of the content)
+        """
+        digest = hashlib.sha256()
+        spool = tempfile.NamedTemporaryFile(prefix='pdf-', suffix='.pdf', delete=False)
+        try:
+            with spool:
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    digest.update(chunk)
+                    spool.write(chunk)
+        except Exception:
+            os.remove(spool.name)
+            raise
+        return spool.name, digest.hexdigest()
+
     async def download_and_create_document_async(
         self,
         attribute_name: str = None,
-    ) -> PDFDocument:
+        skip_unchanged: bool = False,
+    ) -> Optional[PDFDocument]:
         """Async wrapper for downloading PDF and creating a document."""
-        return await asyncio.to_thread(self.download_and_create_document, attribute_name)
+        return await asyncio.to_thread(self.download_and_create_document, attribute_name, skip_unchanged)
 
 
 class PDFExtractor:
     """Service class for extracting data from PDF files."""
 
-    def __init__(self, pdf_path: str):
+    # Each worker gets several page ranges so uneven pages balance out
+    tasks_per_worker = 4
+
+    def __init__(self, pdf_path: str, workers: int = 1, layout: Optional[TableLayout] = None):
+        """
+        Initialize the extractor.
+
+        Args:
+            pdf_path: Local path of the PDF file
+
+            workers: Number of processes used for table detection (1 = sequential)
+
+            layout: Table layout of the PDF source (see TablePDFParser.table_layout)
+        """
         self.pdf_path = pdf_path
+        self.workers = max(1, workers or 1)
+        self.layout = layout or TableLayout()
 
     # def extract_text(self) -> List[Dict[str, Any]]:
     #     """Extract plain text from all pages of the PDF."""
@@ -179,43 +493,311 @@ class PDFExtractor:
 
     def extract_tables(self) -> List[Dict[str, Any]]:
         """Extract largest table from all pages of the PDF."""
-        extracted_tables = []
+        return list(self.iter_tables())
+
+    def iter_tables(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the largest table of each page, one page at a time.
+
+        Each page's layout caches are flushed as soon as its table has been
+        extracted, so memory stays flat regardless of page count.
+
+        Yields:
+            Dict with 'page_number' and 'rows' for every page that has a table
+        """
+        if self.workers > 1:
+            yield from self._iter_tables_parallel()
+            return
+
+        column_edges = None
         with pdfplumber.open(self.pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages, start=1):
-                table = page.extract_table()
-                
-                if table:
-                    # Convert table to DataFrame for better structure
-                    # df = pd.DataFrame(table[2:])
-                    extracted_tables.append({
-                        'page_number': page_num,
-                        'rows': table[2:]
-                    })
-        return extracted_tables
+            for page in pdf.pages:
+                table_info, edges = extract_page_table(page, self.layout, column_edges)
+                if table_info:
+                    # Later pages reuse the first table's columns instead of detecting them
+                    if self.layout.reuse_column_edges and column_edges is None:
+                        column_edges = edges
+                    yield table_info
+
+    def _iter_tables_parallel(self) -> Iterator[Dict[str, Any]]:
+        """
+        Extract page ranges in a process pool and yield tables in page order.
+
+        Every worker opens the file on its own; results are identical to the
+        sequential path because both use extract_page_table. When the layout
+        reuses column edges, the pages up to the first table are extracted
+        here and its edges are passed to every worker.
+        """
+        start_page = 1
+        column_edges = None
+        with pdfplumber.open(self.pdf_path) as pdf:
+            page_count = len(pdf.pages)
+            if self.layout.reuse_column_edges:
+                for page in pdf.pages:
+                    table_info, edges = extract_page_table(page, self.layout)
+                    start_page = page.page_number + 1
+                    if table_info:
+                        column_edges = edges
+                        yield table_info
+                        break
+
+        if start_page > page_count:
+            return
+
+        remaining = page_count - start_page + 1
+        chunk_size = math.ceil(remaining / (self.workers * self.tasks_per_worker))
+        first_pages = list(range(start_page, page_count + 1, chunk_size))
+        last_pages = [min(first_page + chunk_size - 1, page_count) for first_page in first_pages]
+
+        # Spawned workers avoid forking a process that may hold DB connections
+        # and running threads (the async pipeline runs stages in threads)
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(first_pages)),
+            mp_context=multiprocessing.get_context('spawn'),
+        ) as executor:
+            # map() returns results in submission order, i.e. page order
+            for tables in executor.map(
+                extract_page_range,
+                repeat(self.pdf_path),
+                first_pages,
+                last_pages,
+                repeat(self.layout),
+                repeat(column_edges),
+            ):
+                yield from tables
+
+
+class PDFExtractionResult:
+    """Tables extracted from one version of a PDF file, shared by all pipeline stages."""
+
+    def __init__(self, content_hash: str, tables: List[Dict[str, Any]], layout_key: Tuple = ()):
+        self.content_hash = content_hash
+        self.tables = tables
+        self.layout_key = layout_key
+
+    @property
+    def has_tables(self) -> bool:
+        return bool(self.tables)
+
+    @property
+    def page_count(self) -> int:
+        return len(self.tables)
+
+
+class PDFExtractionCache:
+    """
+    Process-local cache of extraction results.
+
+    Entries are stored per PDFDocument and are only reused while the file
+    content hash and the table layout match, so table detection runs once
+    per file version.
+    """
+
+    max_entries = 8
+    _results: "OrderedDict[Any, PDFExtractionResult]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_result(
+        cls,
+        pdf_document: PDFDocument,
+        workers: int = 1,
+        layout: Optional[TableLayout] = None,
+    ) -> PDFExtractionResult:
+        """
+        Return the extraction result for a document, extracting tables if needed.
+
+        Args:
+            pdf_document: Document whose file should be extracted
+
+            workers: Number of extraction processes used on a cache miss
+
+            layout: Table layout; defaults to the layout of the document's source parser
+
+        Returns:
+            PDFExtractionResult: Cached or freshly extracted tables
+        """
+        layout = layout or get_parser_class(pdf_document.source).table_layout()
+        pdf_path = get_local_pdf_path(pdf_document)
+        content_hash = cls._content_hash(pdf_document, pdf_path)
+
+        cached = cls._lookup(pdf_document, content_hash, layout.cache_key)
+        if cached:
+            return cached
+
+        cached = cls._load_persisted(pdf_document, content_hash, layout.cache_key)
+        if cached:
+            return cached
+
+        result = PDFExtractionResult(
+            content_hash=content_hash,
+            tables=PDFExtractor(pdf_path, workers=workers, layout=layout).extract_tables(),
+            layout_key=layout.cache_key,
+        )
+        cls._store(pdf_document, result)
+        return result
+
+    @classmethod
+    def iter_tables(
+        cls,
+        pdf_document: PDFDocument,
+        workers: int = 1,
+        layout: Optional[TableLayout] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield page tables for a document without waiting for the whole file.
+
+        Cached results are replayed; otherwise pages are streamed from the
+        extractor and the result is cached once the last page has been read.
+
+        Args:
+            pdf_document: Document whose file should be extracted
+
+            workers: Number of extraction processes used on a cache miss
+
+            layout: Table layout; defaults to the layout of the document's source parser
+
+        Yields:
+            Dict with 'page_number' and 'rows' for every page that has a table
+        """
+        layout = layout or get_parser_class(pdf_document.source).table_layout()
+        pdf_path = get_local_pdf_path(pdf_document)
+        content_hash = cls._content_hash(pdf_document, pdf_path)
+
+        cached = (
+            cls._lookup(pdf_document, content_hash, layout.cache_key)
+            or cls._load_persisted(pdf_document, content_hash, layout.cache_key)
+        )
+        if cached:
+            yield from cached.tables
+            return
+
+        tables = []
+        for table_info in PDFExtractor(pdf_path, workers=workers, layout=layout).iter_tables():
+            tables.append(table_info)
+            yield table_info
+
+        cls._store(pdf_document, PDFExtractionResult(
+            content_hash=content_hash,
+            tables=tables,
+            layout_key=layout.cache_key,
+        ))
+
+    @staticmethod
+    def _content_hash(pdf_document: PDFDocument, pdf_path: str) -> str:
+        """Return the document's stored content hash, hashing the file only if it has none."""
+        return pdf_document.content_hash or compute_file_hash(pdf_path)
+
+    @classmethod
+    def _lookup(cls, pdf_document: PDFDocument, content_hash: str, layout_key: Tuple) -> Optional[PDFExtractionResult]:
+        with cls._lock:
+            cached = cls._results.get(pdf_document.pk)
+            if cached and cached.content_hash == content_hash and cached.layout_key == layout_key:
+                cls._results.move_to_end(pdf_document.pk)
+                return cached
+        return None
+
+    @classmethod
+    def _store(cls, pdf_document: PDFDocument, result: PDFExtractionResult) -> None:
+        with cls._lock:
+            cls._results[pdf_document.pk] = result
+            cls._results.move_to_end(pdf_document.pk)
+            while len(cls._results) > cls.max_entries:
+                cls._results.popitem(last=False)
+
+    @classmethod
+    def persist(cls, pdf_document: PDFDocument, result: PDFExtractionResult) -> ExtractedData:
+        """
+        Store an extraction result as the document's raw tables.
+
+        Resumed pipeline runs load it instead of extracting the file again,
+        also in a different process. The tables are compressed with
+        pack_json; the record is deleted once the parse stage is checkpointed.
+
+        Returns:
+            The RAW_TABLES ExtractedData record
+        """
+        extracted_data, _ = ExtractedData.objects.update_or_create(
+            pdf_document=pdf_document,
+            data_type=DataType.RAW_TABLES,
+            defaults={
+                'raw_data': {
+                    'content_hash': result.content_hash,
+                    'layout_key': repr(result.layout_key),
+                    'tables': pack_json(result.tables),
+                },
+                'processed': False,
+            },
+        )
+        return extracted_data
+
+    @classmethod
+    def _load_persisted(
+        cls,
+        pdf_document: PDFDocument,
+        content_hash: str,
+        layout_key: Tuple,
+    ) -> Optional[PDFExtractionResult]:
+        """Return persisted raw tables for the same file version and layout, caching them."""
+        if not pdf_document.reached_checkpoint(PipelineCheckpoint.EXTRACTED):
+            return None
+
+        stored = pdf_document.extracted_data.filter(data_type=DataType.RAW_TABLES).first()
+        if (
+            stored is None
+            or stored.raw_data.get('content_hash') != content_hash
+            or stored.raw_data.get('layout_key') != repr(layout_key)
+        ):
+            return None
+
+        result = PDFExtractionResult(
+            content_hash=content_hash,
+            tables=unpack_json(stored.raw_data['tables']),
+            layout_key=layout_key,
+        )
+        cls._store(pdf_document, result)
+        return result
+
+    @classmethod
+    def discard(cls, pdf_document: PDFDocument) -> None:
+        """Drop the cached result for a document, if any."""
+        with cls._lock:
+            cls._results.pop(pdf_document.pk, None)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all cached results."""
+        with cls._lock:
+            cls._results.clear()
 
 
 class PDFProcessor:
     """Service class for processing PDF documents."""
 
-    def __init__(self, pdf_document: PDFDocument):
+    def __init__(self, pdf_document: PDFDocument, workers: int = 1):
         self.pdf_document = pdf_document
+        self.workers = workers
+
+    def process(self) -> 'PDFExtractionResult':
+        """
+        Process the PDF document: validate and mark as processing.
 
-    def process(self) -> None:
-        """Process the PDF document: validate and mark as processing."""
+        Returns:
+            The cached extraction result the parser will reuse
+        """
         try:
             # Update status to processing
             self.pdf_document.status = PDFStatus.PROCESSING
             self.pdf_document.save()
 
-            # Basic validation - ensure file exists and is readable
-            extractor = PDFExtractor(self.pdf_document.file.path)
-            
-            # Verify we can extract tables (just check, don't store)
-            table_data = extractor.extract_tables()
-            if not table_data:
+            # Basic validation - ensure file exists and is readable.
+            # The extraction result is cached so the parser can reuse it.
+            extraction = PDFExtractionCache.get_result(self.pdf_document, workers=self.workers)
+            if not extraction.has_tables:
                 raise ValueError("No tables found in PDF document")
 
             # Status will be updated to COMPLETED by the parser after successful parsing
+            return extraction
 
         except Exception as e:
             # Update status to failed with error message
@@ -224,133 +806,186 @@ class PDFProcessor:
             self.pdf_document.save()
             raise
 
-    async def process_async(self) -> None:
+    async def process_async(self) -> 'PDFExtractionResult':
         """Async wrapper for processing PDF document."""
-        await asyncio.to_thread(self.process)
+        return await asyncio.to_thread(self.process)
+
 
+# Parser classes by PDFDocument.source
+PARSER_REGISTRY: Dict[str, type] = {}
 
-class CroatianLaborPDFParser:
-    """Specialized parser for Croatian Ministry of Labor PDF tables."""
 
-    def __init__(self, pdf_document: PDFDocument):
+def register_parser(source: str):
+    """
+    Class decorator registering a TablePDFParser subclass for a PDF source.
+    
+    Raises:
+        ValueError: If the source already has a parser
+    """
+    def decorator(parser_class):
+        if source in PARSER_REGISTRY:
+            raise ValueError(f"A PDF parser is already registered for source '{source}'")
+        parser_class.source = source
+        PARSER_REGISTRY[source] = parser_class
+        return parser_class
+    return decorator
+
+
+def get_parser_class(source: str) -> type:
+    """
+    Return the parser class registered for a PDF source.
+    
+    Raises:
+        ValueError: If no parser is registered for the source
+    """
+    try:
+        return PARSER_REGISTRY[source]
+    except KeyError:
+        raise ValueError(f"No PDF parser registered for source '{source}'")
+
+
+class TablePDFParser:
+    """
+    Base class for parsers of company tables spread over PDF pages.
+    
+    A new source only declares its layout and schema in a subclass and
+    registers it with @register_parser; extraction, cleaning, statistics
+    and the pipeline are shared.
+    """
+
+    source: Optional[str] = None
+
+    # Output keys, in table column order; must include legal_name and legal_id
+    columns = ['index', 'legal_name', 'legal_id', 'address']
+    # Cells containing any of these (case-insensitive) mark a repeated header row
+    header_keywords = HEADER_KEYWORDS
+    min_name_length = 3
+
+    # pdfplumber table_settings, and leading rows of each page table to drop
+    table_settings: Dict[str, Any] = {}
+    skip_rows = 0
+    # Reuse the first page's column boundaries as explicit vertical lines
+    reuse_column_edges = True
+
+    # Rejected rows kept per rule when collecting statistics
+    rejected_sample_size = 5
+    # Rows per INSERT when storing companies in the table payload format
+    row_batch_size = 1000
+
+    def __init__(self, pdf_document: PDFDocument, workers: int = 1):
         self.pdf_document = pdf_document
-        self.extractor = PDFExtractor(pdf_document.file.path)
+        self.workers = workers
+
+    @classmethod
+    def table_layout(cls) -> TableLayout:
+        """Return the table layout used to extract this source's PDFs."""
+        return TableLayout(
+            table_settings=cls.table_settings,
+            skip_rows=cls.skip_rows,
+            reuse_column_edges=cls.reuse_column_edges,
+        )
+
+    def get_cleaner(self) -> CompanyTableCleaner:
+        return CompanyTableCleaner(
+            columns=self.columns,
+            header_keywords=self.header_keywords,
+            min_name_length=self.min_name_length,
+        )
 
     def parse_companies_table(self) -> List[Dict[str, Any]]:
         """
-        Parse the companies table from the Croatian labor ministry PDF.
-        
-        Expected table structure (4 columns):
-        1. Correlative index (R.BR.)
-        2. Company legal name (NAZIV POSLODAVCA)
-        3. Company ID/OIB (OIB)
-        4. Address (ADRESA)
+        Parse the companies table using the parser's column schema.
         
         Returns:
             List of company dictionaries with cleaned data
         """
-        companies = []
-        skipped_rows = []
-        header_keywords = ['r.br', 'naziv', 'oib', 'adresa', 'redni broj']
+        companies, _ = self.parse(collect_stats=False)
+        return companies
+
+    def parse(self, collect_stats: bool = False) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Parse engine shared by production parsing and debugging.
         
-        # Extract all tables from PDF
-        tables_data = self.extractor.extract_tables()
+        Args:
+            collect_stats: Also collect per-rule rejection counters, sampled
+                           rejected rows and per-page extraction timing. When
+                           False nothing beyond the companies is kept.
         
-        for table_info in tables_data:
-            page_number = table_info['page_number']
-            rows = table_info.get('rows', [])
-            
-            # Skip if no rows
-            if not rows:
-                continue
-            
-            # Remove empty rows (where first cell is None) by merging them with the previous row assuming they are continuations of the previous row
-            row_count = 1
-            while row_count < len(rows):
-                if rows[row_count][0] is None:
-                    for j in range(len(rows[row_count])):
-                        if rows[row_count-1][j] is not None and rows[row_count][j] is not None:
-                            rows[row_count-1][j] += " " + rows[row_count][j]           
-                    rows.pop(row_count)
-                else:
-                    row_count += 1
-            
+        Returns:
+            Tuple of (companies, statistics dict or None)
+        """
+        # Stream page tables (replayed from cache when PDFProcessor already
+        # extracted them) and merge continuation rows across page boundaries
+        tables_data = PDFExtractionCache.iter_tables(
+            self.pdf_document,
+            workers=self.workers,
+            layout=self.table_layout(),
+        )
+        cleaner = self.get_cleaner()
 
-            # Process each row
-            for row_values in rows:
+        if not collect_stats:
+            companies, _ = cleaner.clean(merge_continuation_rows(tables_data))
+            return companies, None
 
-                # Clean row values
-                row_values = list(filter(None, row_values))
+        pages = []
+        merged_rows = list(merge_continuation_rows(self._iter_timed_pages(tables_data, pages)))
 
-                # Skip if row has less than 4 columns
-                if len(row_values) < 4:
-                    skipped_rows.append(('less_than_4_cols', row_values))
-                    continue
-                
-                # Skip header rows (check if any cell contains header keywords)
-                is_header = False
-                for cell in row_values:
-                    cell_str = str(cell).lower().strip() if cell else ''
-                    if any(keyword in cell_str for keyword in header_keywords):
-                        is_header = True
-                        break
-                
-                if is_header:
-                    skipped_rows.append(('is_header', row_values))
-                    continue
-                
-                # Clean all values
-                cleaned_values = [self._clean_value(v) for v in row_values[:4]]
-                index, legal_name, company_id, address = cleaned_values
-                
-                # Strict validation: skip incomplete rows
-                # A valid row must have at least: legal_name and company_id
-                if not legal_name:
-                    skipped_rows.append(('no_legal_name', row_values))
-                    continue
-                
-                if not company_id:
-                    skipped_rows.append(('no_legal_id', row_values))
-                    continue
-                
-                # Company name should be at least 3 characters
-                if len(legal_name) < 3:
-                    skipped_rows.append(('name_too_short', row_values))
-                    continue
-                
-                company = {
-                    'index': index,
-                    'legal_name': legal_name,
-                    'legal_id': company_id,
-                    'address': address,
-                    'page_number': page_number
-                }
-                
-                companies.append(company)
-        
-        return companies
+        started = time.perf_counter()
+        companies, reasons = cleaner.clean(merged_rows)
+        clean_seconds = time.perf_counter() - started
 
-    def _clean_value(self, value: Any) -> str:
-        """Clean and normalize cell values."""
-        if value is None:
-            return ''
-        
-        # Convert to string and strip whitespace
-        cleaned = str(value).strip()
-        
-        # Remove extra whitespace
-        cleaned = ' '.join(cleaned.split())
-        
-        return cleaned
+        filters = dict.fromkeys(REJECTION_REASONS, 0)
+        samples = {reason: [] for reason in REJECTION_REASONS}
+        for (page_number, row), reason in zip(merged_rows, reasons):
+            if reason is None:
+                continue
+            filters[reason] += 1
+            if len(samples[reason]) < self.rejected_sample_size:
+                samples[reason].append({'page_number': page_number, 'row': row})
 
-    def process_and_save(self) -> ExtractedData:
+        stats = {
+            'rows_seen': len(merged_rows),
+            'filters_applied': filters,
+            'total_rows_filtered': sum(filters.values()),
+            'rejected_samples': {reason: rows for reason, rows in samples.items() if rows},
+            'pages': pages,
+            'clean_seconds': round(clean_seconds, 6),
+        }
+        return companies, stats
+
+    @staticmethod
+    def _iter_timed_pages(tables_data: Iterable[Dict[str, Any]], pages: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Pass page tables through, appending each page's row count and extraction time to pages."""
+        started = time.perf_counter()
+        for table_info in tables_data:
+            pages.append({
+                'page_number': table_info['page_number'],
+                'rows': len(table_info.get('rows', [])),
+                'extract_seconds': round(time.perf_counter() - started, 6),
+            })
+            yield table_info
+            started = time.perf_counter()
+
+    def process_and_save(self, collect_stats: bool = True, payload_format: Optional[str] = None) -> ExtractedData:
         """
         Parse the companies table and save as structured data.
         
+        Args:
+            collect_stats: Store parse statistics under raw_data['parse_stats'],
+                           so a bad run can be inspected without re-parsing
+            
+            payload_format: CompanyPayloadFormat used to store the companies,
+                            default settings.PDF_COMPANY_PAYLOAD_FORMAT. Read
+                            them back with ExtractedData.get_companies().
+        
         Returns:
             ExtractedData instance with structured company data
         """
-        companies = self.parse_companies_table()
+        payload_format = payload_format or getattr(settings, 'PDF_COMPANY_PAYLOAD_FORMAT', CompanyPayloadFormat.ROWS)
+        if payload_format not in CompanyPayloadFormat.values:
+            raise ValueError(f"Unknown company payload format: {payload_format}")
+        
+        companies, stats = self.parse(collect_stats=collect_stats)
 
         # Keep only the latest structured companies data for this PDF
         ExtractedData.objects.filter(
@@ -358,206 +993,566 @@ class CroatianLaborPDFParser:
             data_type=DataType.STRUCTURED_COMPANIES
         ).delete()
         
+        raw_data = {
+            **encode_companies(companies, company_schema(self.columns), payload_format),
+            'total_count': len(companies),
+            'parser': type(self).__name__,
+            'source': self.source,
+        }
+        if stats is not None:
+            raw_data['parse_stats'] = stats
+        
         # Create ExtractedData record
         extracted_data = ExtractedData.objects.create(
             pdf_document=self.pdf_document,
             data_type=DataType.STRUCTURED_COMPANIES,
-            raw_data={
-                'companies': companies,
-                'total_count': len(companies),
-                'parser': 'CroatianLaborPDFParser'
-            },
+            raw_data=raw_data,
             processed=True
         )
         
+        if payload_format == CompanyPayloadFormat.TABLE:
+            ExtractedCompanyRow.objects.bulk_create(
+                [
+                    ExtractedCompanyRow.from_company(extracted_data, position, company)
+                    for position, company in enumerate(companies)
+                ],
+                batch_size=self.row_batch_size,
+            )
+        
         return extracted_data
 
-    async def process_and_save_async(self) -> ExtractedData:
+    async def process_and_save_async(self, collect_stats: bool = True, payload_format: Optional[str] = None) -> ExtractedData:
         """Async wrapper for parsing and saving structured data."""
-        return await asyncio.to_thread(self.process_and_save)
+        return await asyncio.to_thread(self.process_and_save, collect_stats, payload_format)
     
     def parse_companies_table_with_debug(self) -> Dict[str, Any]:
         """
         Parse the companies table and return detailed debug information.
         
-        Useful for understanding why rows are being filtered.
+        Uses the same engine as parse_companies_table, so the companies and
+        counts match production parsing exactly.
         
         Returns:
             Dictionary with companies and filtering statistics
         """
-        companies = []
-        filters = {
-            'less_than_4_cols': 0,
-            'is_header': 0,
-            'no_legal_name': 0,
-            'no_legal_id': 0,
-            'name_too_short': 0,
-        }
-        
-        header_keywords = ['r.br', 'naziv', 'oib', 'adresa', 'redni broj']
-        
-        # Extract all tables from PDF
-        tables_data = self.extractor.extract_tables()
-        
-        for table_info in tables_data:
-            page_number = table_info['page_number']
-            rows = table_info.get('rows', [])
-            
-            if not rows:
-                continue
-            
-            for row in rows:
-                row_values = list(filter(None, row))
-                
-                if len(row_values) < 4:
-                    filters['less_than_4_cols'] += 1
-                    continue
-                
-                is_header = False
-                for cell in row_values:
-                    cell_str = str(cell).lower().strip() if cell else ''
-                    if any(keyword in cell_str for keyword in header_keywords):
-                        is_header = True
-                        break
-                
-                if is_header:
-                    filters['is_header'] += 1
-                    continue
-                
-                cleaned_values = [self._clean_value(v) for v in row_values[:4]]
-                index, legal_name, company_id, address = cleaned_values
-                
-                if not legal_name:
-                    filters['no_legal_name'] += 1
-                    continue
-                
-                if not company_id:
-                    filters['no_legal_id'] += 1
-                    continue
-                
-                if len(legal_name) < 3:
-                    filters['name_too_short'] += 1
-                    continue
-                
-                company = {
-                    'index': index,
-                    'legal_name': legal_name,
-                    'legal_id': company_id,
-                    'address': address,
-                    'page_number': page_number
-                }
-                
-                companies.append(company)
-        
+        companies, stats = self.parse(collect_stats=True)
         return {
             'companies': companies,
             'total_count': len(companies),
-            'filters_applied': filters,
-            'total_rows_filtered': sum(filters.values())
+            **stats,
         }
 
 
+@register_parser(DEFAULT_PDF_SOURCE)
+class CroatianLaborPDFParser(TablePDFParser):
+    """
+    Specialized parser for Croatian Ministry of Labor PDF tables.
+    
+    Expected table structure (4 columns):
+    1. Correlative index (R.BR.)
+    2. Company legal name (NAZIV POSLODAVCA)
+    3. Company ID/OIB (OIB)
+    4. Address (ADRESA)
+    
+    Every page table starts with the document title and the column header.
+    """
+
+    columns = ['index', 'legal_name', 'legal_id', 'address']
+    skip_rows = 2
+
+
+def get_sync_mode(sync_mode: Optional[str] = None) -> str:
+    """
+    Return sync_mode, or settings.PDF_SYNC_MODE if it is not given.
+    
+    Every entry point (API, admin, command, cron) defaults through here, so
+    the same document is synced the same way whichever way it is run.
+    
+    Raises:
+        ValueError: If the mode is not a SyncMode value
+    """
+    sync_mode = sync_mode or getattr(settings, 'PDF_SYNC_MODE', SyncMode.DIFF)
+    if sync_mode not in SyncMode.values:
+        raise ValueError(f"Unknown sync mode: {sync_mode}")
+    return str(sync_mode)
+
+
 class CompanySyncService:
     """Service to synchronize companies from PDF data to the Company app."""
 
-    def __init__(self, pdf_document: PDFDocument):
+    # Rows per IN (...) lookup and per bulk write; also the chunk size of a chunked sync
+    batch_size = 500
+
+    def __init__(self, pdf_document: PDFDocument, batch_size: Optional[int] = None):
         self.pdf_document = pdf_document
+        if batch_size is not None:
+            if batch_size < 1:
+                raise ValueError("batch_size must be a positive integer")
+            self.batch_size = batch_size
 
-    def reset_blacklist_status(self) -> None:
+    def reset_blacklist_status(self) -> int:
         """
-        Reset blacklist status before sync.
+        Reset blacklist status before sync, in a single UPDATE statement.
         
         For each company with blacklisted_at not null:
         - Copy blacklisted_at to last_blacklisted_at
         - Set blacklisted_at to null
+        
+        Companies that another source's current list still names keep their
+        stamp, so a full sync of one source does not delist the others.
+        
+        Returns:
+            Number of companies reset
         """
         from apps.companies.models import Company
         
-        companies_with_blacklist = Company.objects.filter(blacklisted_at__isnull=False)
+        companies = Company.objects.filter(blacklisted_at__isnull=False)
+        kept_ids, kept_names = self._other_source_listings()
+        if kept_ids or kept_names:
+            companies = companies.annotate(legal_name_lower=Lower('legal_name')).exclude(
+                Q(legal_id__in=kept_ids) | Q(legal_id__isnull=True, legal_name_lower__in=kept_names)
+            )
         
-        for company in companies_with_blacklist:
-            company.last_blacklisted_at = company.blacklisted_at
-            company.blacklisted_at = None
-            company.save()
+        return companies.update(
+            last_blacklisted_at=F('blacklisted_at'),
+            blacklisted_at=None,
+            modified_at=timezone.now(),
+        )
 
-    def sync_companies(self) -> Dict[str, Any]:
+    def sync_companies(self, bulk: bool = True, mode: Optional[str] = None, resume: bool = False) -> Dict[str, Any]:
         """
         Synchronize companies from PDF to Company app.
         
         Rules:
-        - If company exists in Company app (by legal_name or legal_id), skip it
+        - If company exists in Company app (by legal_id, then legal_name), stamp it as blacklisted
         - If company is in PDF but not in Company app, create it
         
+        Args:
+            bulk: Use the set-based path (a few queries per batch) instead of
+                  per-row lookups and saves. Both produce the same statistics.
+            
+            mode: SyncMode.FULL resets the blacklist, except companies other
+                  sources still list, and re-applies this document.
+                  SyncMode.DIFF only touches companies added to or removed
+                  from the list since the previous successful document of the
+                  same source; without one it stamps this document's
+                  companies and clears nothing, so other sources' entries stay.
+                  SyncMode.CHUNKED gives the result of FULL, but commits
+                  batch_size rows at a time and swaps the blacklist in at the
+                  end (see _sync_chunked); bulk is ignored. Defaults to
+                  settings.PDF_SYNC_MODE (see get_sync_mode).
+            
+            resume: With SyncMode.CHUNKED, continue after the chunks a failed
+                    run already committed instead of starting over
+        
         Returns:
             Dictionary with sync statistics
         """
+        mode = get_sync_mode(mode)
+        pdf_companies = self._get_pdf_companies()
+        
+        stats = {
+            'total_pdf_companies': len(pdf_companies),
+            'updated': 0,
+            'created': 0,
+            'errors': [],
+            'mode': SyncMode.FULL.value,
+        }
+        
+        if mode == SyncMode.CHUNKED:
+            return self._sync_chunked(pdf_companies, stats, resume=resume)
+        
+        # Apply the changes in one transaction so readers never see a half-applied list
+        with transaction.atomic():
+            if mode == SyncMode.DIFF:
+                stats['mode'] = SyncMode.DIFF.value
+                pdf_companies = self._apply_diff(self.get_previous_document(), pdf_companies, stats)
+            else:
+                self.reset_blacklist_status()
+            
+            if bulk:
+                self._sync_bulk(pdf_companies, stats)
+            else:
+                self._sync_row_by_row(pdf_companies, stats)
+        
+        return stats
+
+    def _sync_chunked(self, pdf_companies: List[Dict[str, Any]], stats: Dict[str, Any], resume: bool = False) -> Dict[str, Any]:
+        """
+        Sync batch_size rows per transaction, then swap the blacklist in at once.
+        
+        Each chunk matches and creates its companies like the bulk path, but
+        only records them as PendingBlacklistEntry rows: new companies are
+        created without a blacklist stamp and matched ones are not written.
+        The chunk and its progress in stage_progress['sync'] commit together,
+        so no row lock is held longer than one chunk and a resumed run skips
+        the committed chunks. The final transaction resets the blacklist and
+        stamps the pending companies, so readers see either the old list or
+        the new one, never a partially applied list.
+        
+        Chunks only commit on their own outside an enclosing transaction
+        (e.g. ATOMIC_REQUESTS); run it from a command or the job worker.
+        """
         from apps.companies.models import Company
+        from .models import PendingBlacklistEntry
+        
+        stats['mode'] = SyncMode.CHUNKED.value
+        stats['batch_size'] = self.batch_size
+        
+        progress = (self.pdf_document.stage_progress or {}).get(PipelineStage.SYNC, {})
+        rows_done = 0
+        if resume and progress.get('rows_done'):
+            rows_done = progress['rows_done']
+            stats['updated'] = progress.get('updated', 0)
+            stats['created'] = progress.get('created', 0)
+            stats['errors'] = list(progress.get('errors', []))
+        else:
+            self.pdf_document.pending_blacklist.all().delete()
+        stats['resumed_at_row'] = rows_done
+        
+        for start in range(rows_done, len(pdf_companies), self.batch_size):
+            chunk = pdf_companies[start:start + self.batch_size]
+            with transaction.atomic():
+                company_ids = self._sync_bulk(chunk, stats, stamp=False)
+                PendingBlacklistEntry.objects.bulk_create(
+                    [
+                        PendingBlacklistEntry(pdf_document=self.pdf_document, company_id=company_id)
+                        for company_id in company_ids
+                    ],
+                    ignore_conflicts=True,
+                )
+                self._save_chunk_progress(start + len(chunk), stats)
+        
+        with transaction.atomic():
+            self.reset_blacklist_status()
+            now = timezone.now()
+            Company.objects.filter(
+                pk__in=self.pdf_document.pending_blacklist.values('company_id')
+            ).update(blacklisted_at=now, modified_at=now)
+            self.pdf_document.pending_blacklist.all().delete()
+        
+        return stats
+
+    def _save_chunk_progress(self, rows_done: int, stats: Dict[str, Any]) -> None:
+        """Record how many rows a chunked sync has committed, with the stats so far."""
+        progress = dict(self.pdf_document.stage_progress or {})
+        progress[PipelineStage.SYNC] = {
+            **progress.get(PipelineStage.SYNC, {}),
+            'rows_done': rows_done,
+            'updated': stats['updated'],
+            'created': stats['created'],
+            'errors': stats['errors'],
+        }
+        self.pdf_document.stage_progress = progress
+        self.pdf_document.save(update_fields=['stage_progress', 'modified_at'])
+
+    def get_previous_document(self) -> Optional[PDFDocument]:
+        """
+        Return the latest successfully processed document from the same source.
+        
+        Only documents created before this one and holding structured
+        company data are considered.
+        """
+        queryset = PDFDocument.objects.filter(
+            status=PDFStatus.COMPLETED,
+            created_at__lt=self.pdf_document.created_at,
+            extracted_data__data_type=DataType.STRUCTURED_COMPANIES,
+        ).exclude(pk=self.pdf_document.pk)
+        
+        if self.pdf_document.scraped_url:
+            queryset = queryset.filter(scraped_url=self.pdf_document.scraped_url)
+        
+        return queryset.order_by('-created_at').first()
+
+    def get_other_source_documents(self) -> List[PDFDocument]:
+        """
+        Return the latest successfully processed document of every other source.
+        
+        Sources are told apart by scraped_url; documents without one are not
+        treated as a separate source.
+        """
+        documents = PDFDocument.objects.filter(
+            status=PDFStatus.COMPLETED,
+            scraped_url__isnull=False,
+            extracted_data__data_type=DataType.STRUCTURED_COMPANIES,
+        ).exclude(pk=self.pdf_document.pk)
+        
+        if self.pdf_document.scraped_url:
+            documents = documents.exclude(scraped_url=self.pdf_document.scraped_url)
+        
+        latest = {}
+        for document in documents.order_by('-created_at'):
+            latest.setdefault(document.scraped_url, document)
+        return list(latest.values())
+
+    def _other_source_listings(self) -> Tuple[Set[str], Set[str]]:
+        """Return the OIBs and lowercased names on the current lists of the other sources."""
+        legal_ids, legal_names = set(), set()
+        for document in self.get_other_source_documents():
+            for company in self._get_pdf_companies(document):
+                if company.get('legal_id'):
+                    legal_ids.add(company['legal_id'])
+                if company.get('legal_name'):
+                    legal_names.add(company['legal_name'].lower())
+        return legal_ids, legal_names
+
+    def _apply_diff(
+        self,
+        previous_document: Optional[PDFDocument],
+        pdf_companies: List[Dict[str, Any]],
+        stats: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        """
+        Clear companies that left the list and return only the rows to stamp.
+        
+        Rows are compared by OIB. Rows without an OIB are always re-applied.
+        A removed company stays blacklisted while another source's current
+        list still names it. Without a previous document nothing is removed
+        and every row is returned. The diff counts are recorded in
+        stats['diff'].
+        
+        Returns:
+            PDF rows that were not on the previous document's list
+        """
+        from apps.companies.models import Company
+        
+        previous_companies = self._get_pdf_companies(previous_document) if previous_document else []
+        previous_ids = {c['legal_id'] for c in previous_companies if c.get('legal_id')}
+        current_ids = {c['legal_id'] for c in pdf_companies if c.get('legal_id')}
         
-        # Reset blacklist status before syncing
-        self.reset_blacklist_status()
+        removed_ids = previous_ids - current_ids
+        added_companies = [c for c in pdf_companies if c.get('legal_id') not in previous_ids]
         
-        # Get parsed company data from PDF
-        company_data = self.pdf_document.extracted_data.filter(
+        # Companies matched by name on the previous run may have no OIB stored
+        current_names = {c['legal_name'].lower() for c in pdf_companies if c.get('legal_name')}
+        removed_names = {
+            c['legal_name'].lower()
+            for c in previous_companies
+            if c.get('legal_id') in removed_ids and c.get('legal_name')
+        } - current_names
+        
+        if removed_ids:
+            kept_ids, kept_names = self._other_source_listings()
+            removed_ids -= kept_ids
+            removed_names -= kept_names
+        
+        removed_ids = sorted(removed_ids)
+        removed_names = sorted(removed_names)
+        
+        now = timezone.now()
+        for start in range(0, max(len(removed_ids), len(removed_names)), self.batch_size):
+            Company.objects.annotate(
+                legal_name_lower=Lower('legal_name')
+            ).filter(
+                Q(legal_id__in=removed_ids[start:start + self.batch_size])
+                | Q(legal_id__isnull=True, legal_name_lower__in=removed_names[start:start + self.batch_size]),
+                blacklisted_at__isnull=False,
+            ).update(
+                last_blacklisted_at=F('blacklisted_at'),
+                blacklisted_at=None,
+                modified_at=now,
+            )
+        
+        stats['diff'] = {
+            'previous_pdf_document_id': previous_document.id if previous_document else None,
+            'added': len(current_ids - previous_ids),
+            'removed': len(removed_ids),
+            'unchanged': len(previous_ids & current_ids),
+        }
+        
+        return added_companies
+
+    def _get_pdf_companies(self, pdf_document: Optional[PDFDocument] = None) -> List[Dict[str, Any]]:
+        """Return the parsed companies stored for this (or another) document."""
+        pdf_document = pdf_document or self.pdf_document
+        company_data = pdf_document.extracted_data.filter(
             data_type=DataType.STRUCTURED_COMPANIES
         ).first()
         
         if not company_data:
             raise ValueError("No structured company data found. Parse the PDF first using parse_croatian_labor.")
         
-        pdf_companies = company_data.raw_data.get('companies', [])
-        
-        stats = {
-            'total_pdf_companies': len(pdf_companies),
-            'updated': 0,
-            'created': 0,
-            'errors': []
-        }
+        return company_data.get_companies()
+
+    def _sync_row_by_row(self, pdf_companies: List[Dict[str, Any]], stats: Dict[str, Any]) -> None:
+        """Match and save one PDF row at a time."""
+        from apps.companies.models import Company
         
         for pdf_company in pdf_companies:
             legal_name = pdf_company.get('legal_name')
             legal_id = pdf_company.get('legal_id')
-            address = pdf_company.get('address')
             
             try:
-                # Check if company already exists by legal_id or legal_name
-                existing = None
-                
-                if legal_id:
-                    existing = Company.objects.filter(legal_id=legal_id).first()
-                
-                if not existing and legal_name:
-                    existing = Company.objects.filter(legal_name__iexact=legal_name).first()
-                
-                if existing:
-                    stats['updated'] += 1
-                    existing.blacklisted_at = timezone.now()
-                    existing.save()
-                    continue
-                
-                # Create new company
-                Company.objects.create(
-                    legal_name=legal_name,
-                    display_name=legal_name,  # Use legal_name as display_name initially
-                    legal_id=legal_id,
-                    category='OTHER',  # Default category, can be updated later
-                    description=f"Imported from PDF. Address: {address}" if address else "Imported from PDF",
-                    blacklisted_at=timezone.now(),
-                )
+                # Savepoint per row so one failing row does not abort the sync transaction
+                with transaction.atomic():
+                    # Check if company already exists by legal_id or legal_name
+                    existing = None
+                    
+                    if legal_id:
+                        existing = Company.objects.filter(legal_id=legal_id).first()
+                    
+                    if not existing and legal_name:
+                        existing = Company.objects.filter(legal_name__iexact=legal_name).first()
+                    
+                    if existing:
+                        stats['updated'] += 1
+                        existing.blacklisted_at = timezone.now()
+                        existing.save()
+                        continue
+                    
+                    # Create new company
+                    self._build_company(pdf_company, timezone.now()).save()
                 
                 stats['created'] += 1
                 
             except Exception as e:
-                stats['errors'].append({
-                    'legal_name': legal_name,
-                    'legal_id': legal_id,
-                    'error': str(e)
-                })
+                stats['errors'].append(self._sync_error(pdf_company, e))
+
+    def _sync_bulk(self, pdf_companies: List[Dict[str, Any]], stats: Dict[str, Any], stamp: bool = True) -> List[int]:
+        """
+        Match all PDF rows against prefetched companies, then write in bulk.
+
+        Existing companies are loaded by OIB and by lower-cased legal name in
+        batches, matched rows get their blacklist timestamp via bulk_update,
+        and new companies are inserted via bulk_create.
+
+        Args:
+            stamp: Set blacklisted_at on matched and created companies. Without
+                   it matched companies are left untouched and new ones are
+                   created unlisted.
+
+        Returns:
+            Primary keys of the matched and created companies
+        """
+        from apps.companies.models import Company
         
-        return stats
+        now = timezone.now()
+        blacklisted_at = now if stamp else None
+        companies_by_legal_id, companies_by_name = self._prefetch_existing(pdf_companies)
+        
+        to_update = {}
+        to_create = []
+        company_ids = []
+        
+        for pdf_company in pdf_companies:
+            legal_name = pdf_company.get('legal_name')
+            legal_id = pdf_company.get('legal_id')
+            
+            existing = None
+            
+            if legal_id:
+                existing = companies_by_legal_id.get(legal_id)
+            
+            if not existing and legal_name:
+                existing = companies_by_name.get(legal_name.lower())
+            
+            if existing:
+                stats['updated'] += 1
+                existing.blacklisted_at = now
+                existing.modified_at = now
+                if existing.pk:
+                    to_update[existing.pk] = existing
+                continue
+            
+            company = self._build_company(pdf_company, blacklisted_at)
+            company.populate_names()
+            to_create.append((pdf_company, company))
+            
+            # Later duplicates of this row must match it, as they would after a save
+            if legal_id:
+                companies_by_legal_id.setdefault(legal_id, company)
+            if legal_name:
+                companies_by_name.setdefault(legal_name.lower(), company)
+        
+        company_ids.extend(to_update)
+        if stamp:
+            Company.objects.bulk_update(
+                list(to_update.values()),
+                ['blacklisted_at', 'modified_at'],
+                batch_size=self.batch_size,
+            )
+        
+        for start in range(0, len(to_create), self.batch_size):
+            batch = to_create[start:start + self.batch_size]
+            try:
+                with transaction.atomic():
+                    Company.objects.bulk_create([company for _, company in batch])
+                stats['created'] += len(batch)
+                company_ids.extend(company.pk for _, company in batch)
+            except Exception:
+                # Retry the failed batch row by row to report which rows are invalid
+                for pdf_company, _ in batch:
+                    try:
+                        with transaction.atomic():
+                            # Fresh instance: save() derives the names again
+                            company = self._build_company(pdf_company, blacklisted_at)
+                            company.save()
+                        stats['created'] += 1
+                        company_ids.append(company.pk)
+                    except Exception as e:
+                        stats['errors'].append(self._sync_error(pdf_company, e))
+        
+        return company_ids
 
-    async def sync_companies_async(self) -> Dict[str, Any]:
+    def _prefetch_existing(self, pdf_companies: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Load existing companies matching the PDF rows by OIB or legal name.
+
+        Returns:
+            Two dicts: companies by legal_id and by lower-cased legal_name.
+            The lowest primary key wins, like filter(...).first() does.
+        """
+        from apps.companies.models import Company
+        
+        legal_ids = sorted({c['legal_id'] for c in pdf_companies if c.get('legal_id')})
+        names = sorted({c['legal_name'].lower() for c in pdf_companies if c.get('legal_name')})
+        
+        companies_by_legal_id = {}
+        for start in range(0, len(legal_ids), self.batch_size):
+            queryset = Company.objects.filter(
+                legal_id__in=legal_ids[start:start + self.batch_size]
+            ).order_by('pk')
+            for company in queryset:
+                companies_by_legal_id.setdefault(company.legal_id, company)
+        
+        companies_by_name = {}
+        for start in range(0, len(names), self.batch_size):
+            queryset = Company.objects.annotate(
+                legal_name_lower=Lower('legal_name')
+            ).filter(
+                legal_name_lower__in=names[start:start + self.batch_size]
+            ).order_by('pk')
+            for company in queryset:
+                companies_by_name.setdefault(company.legal_name_lower, company)
+        
+        return companies_by_legal_id, companies_by_name
+
+    def _build_company(self, pdf_company: Dict[str, Any], blacklisted_at) -> Any:
+        """Build an unsaved Company for a PDF row."""
+        from apps.companies.models import Company
+        
+        legal_name = pdf_company.get('legal_name')
+        address = pdf_company.get('address')
+        
+        return Company(
+            legal_name=legal_name,
+            display_name=legal_name,  # Use legal_name as display_name initially
+            legal_id=pdf_company.get('legal_id'),
+            category='OTHER',  # Default category, can be updated later
+            description=f"Imported from PDF. Address: {address}" if address else "Imported from PDF",
+            blacklisted_at=blacklisted_at,
+        )
+
+    def _sync_error(self, pdf_company: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+        return {
+            'legal_name': pdf_company.get('legal_name'),
+            'legal_id': pdf_company.get('legal_id'),
+            'error': str(error)
+        }
+
+    async def sync_companies_async(self, bulk: bool = True, mode: Optional[str] = None, resume: bool = False) -> Dict[str, Any]:
         """Async wrapper for syncing companies."""
-        return await asyncio.to_thread(self.sync_companies)
+        return await asyncio.to_thread(self.sync_companies, bulk, mode, resume)
 
 
 class PDFCronPipelineService:
@@ -568,10 +1563,22 @@ class PDFCronPipelineService:
         page_url: str,
         attribute_name: str,
         headers: Optional[Dict[str, str]] = None,
+        workers: int = 1,
+        sync_mode: Optional[str] = None,
+        skip_unchanged: bool = True,
+        source: str = DEFAULT_PDF_SOURCE,
+        sync_batch_size: Optional[int] = None,
     ):
         self.page_url = page_url
         self.attribute_name = attribute_name
         self.headers = headers
+        self.workers = workers
+        self.sync_mode = get_sync_mode(sync_mode)
+        self.sync_batch_size = sync_batch_size
+        self.skip_unchanged = skip_unchanged
+        self.source = source
+        # Fail before downloading anything if the source has no parser
+        self.parser_class = get_parser_class(source)
 
     @classmethod
     def run_once(
@@ -579,11 +1586,21 @@ class PDFCronPipelineService:
         page_url: str,
         attribute_name: str,
         headers: Optional[Dict[str, str]] = None,
+        workers: int = 1,
+        sync_mode: Optional[str] = None,
+        skip_unchanged: bool = True,
+        source: str = DEFAULT_PDF_SOURCE,
+        sync_batch_size: Optional[int] = None,
     ) -> Dict[str, Any]:
         return cls(
             page_url=page_url,
             attribute_name=attribute_name,
             headers=headers,
+            workers=workers,
+            sync_mode=sync_mode,
+            skip_unchanged=skip_unchanged,
+            source=source,
+            sync_batch_size=sync_batch_size,
         ).run()
 
     @classmethod
@@ -592,93 +1609,427 @@ class PDFCronPipelineService:
         page_url: str,
         attribute_name: str,
         headers: Optional[Dict[str, str]] = None,
+        workers: int = 1,
+        sync_mode: Optional[str] = None,
+        skip_unchanged: bool = True,
+        source: str = DEFAULT_PDF_SOURCE,
+        sync_batch_size: Optional[int] = None,
     ) -> Dict[str, Any]:
         return await cls(
             page_url=page_url,
             attribute_name=attribute_name,
             headers=headers,
+            workers=workers,
+            sync_mode=sync_mode,
+            skip_unchanged=skip_unchanged,
+            source=source,
+            sync_batch_size=sync_batch_size,
         ).run_async()
 
+    @classmethod
+    async def run_many_async(
+        cls,
+        sources: List[Dict[str, Any]],
+        max_concurrency: int = 4,
+        workers: int = 1,
+        sync_mode: Optional[str] = None,
+        skip_unchanged: bool = True,
+        sync_batch_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run the pipeline for several source pages that share the same parser.
+
+        Scraping and downloading run concurrently, at most max_concurrency at
+        a time. Processing, parsing and syncing are serialized so only one
+        source writes to the company blacklist at a time. A failing source
+        does not stop the others; its error is reported in its result.
+
+        Args:
+            sources: Source configs with 'page_url', 'attribute_name' and optional
+                     'headers' and 'source' (registered parser, default croatian_labor)
+            max_concurrency: Maximum number of concurrent downloads
+            workers: Number of processes used for table detection
+            sync_mode: SyncMode used for each source's company sync, default
+                       settings.PDF_SYNC_MODE
+            skip_unchanged: Skip sources whose PDF is unchanged
+            sync_batch_size: Rows per batch (and per chunk with SyncMode.CHUNKED)
+                             in each source's company sync
+
+        Returns:
+            Dict with per-source results in input order and status counts
+
+        Raises:
+            ValueError: If a source config or max_concurrency is invalid
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer")
+        for source in sources:
+            if not source.get('page_url') or not source.get('attribute_name'):
+                raise ValueError(f"Source config needs 'page_url' and 'attribute_name': {source}")
+            get_parser_class(source.get('source', DEFAULT_PDF_SOURCE))
+
+        download_semaphore = asyncio.Semaphore(max_concurrency)
+        process_lock = asyncio.Lock()
+
+        async def run_source(source: Dict[str, Any]) -> Dict[str, Any]:
+            service = cls(
+                page_url=source['page_url'],
+                attribute_name=source['attribute_name'],
+                headers=source.get('headers'),
+                workers=workers,
+                sync_mode=sync_mode,
+                skip_unchanged=skip_unchanged,
+                source=source.get('source', DEFAULT_PDF_SOURCE),
+                sync_batch_size=sync_batch_size,
+            )
+            try:
+                result = await service.run_async(download_semaphore, process_lock)
+            except Exception as exc:
+                result = {'status': PDFStatus.FAILED.value, 'error': str(exc)}
+            return {'page_url': source['page_url'], 'attribute_name': source['attribute_name'], **result}
+
+        results = await asyncio.gather(*(run_source(source) for source in sources))
+
+        summary = {'completed': 0, 'unchanged': 0, 'failed': 0}
+        for result in results:
+            summary[result['status']] = summary.get(result['status'], 0) + 1
+
+        return {
+            'total_sources': len(sources),
+            **summary,
+            'sources': results,
+        }
+
+    def _unchanged_result(self, scraper: WebPDFScraper) -> Dict[str, Any]:
+        """Result returned when the PDF matches the last completed document."""
+        previous_document = scraper.previous_document
+        return {
+            'status': 'unchanged',
+            'pdf_document_id': previous_document.id,
+            'original_filename': previous_document.original_filename,
+            'scraped_url': previous_document.scraped_url,
+            'source_url': previous_document.source_url,
+            'companies_extracted': 0,
+            'sync': None,
+            'stages': getattr(scraper, 'metrics', {}),
+        }
+
+    @classmethod
+    def enqueue_document(
+        cls,
+        pdf_document: PDFDocument,
+        workers: int = 1,
+        sync_mode: Optional[str] = None,
+        resume: bool = False,
+        sync_batch_size: Optional[int] = None,
+    ):
+        """
+        Queue processing of an already stored document for the job worker.
+
+        Args:
+            pdf_document: Document to process
+            workers: Number of processes used for table detection
+            sync_mode: SyncMode used for the company sync, default
+                       settings.PDF_SYNC_MODE
+            resume: Continue after the document's last checkpoint instead of
+                    running every stage again
+            sync_batch_size: Rows per batch (and per chunk with SyncMode.CHUNKED)
+                             in the company sync
+
+        Returns:
+            The queued common Job
+        """
+        pdf_document.status = PDFStatus.QUEUED
+        pdf_document.error_message = ''
+        update_fields = ['status', 'error_message', 'modified_at']
+        if not resume:
+            pdf_document.stage_progress = {}
+            update_fields.append('stage_progress')
+        pdf_document.save(update_fields=update_fields)
+
+        options = {'resume' if resume else 'document_id': pdf_document.id}
+        if sync_batch_size is not None:
+            options['sync_batch_size'] = sync_batch_size
+        return JobQueueService.enqueue(
+            'run_pdf_pipeline',
+            workers=workers,
+            sync_mode=get_sync_mode(sync_mode),
+            **options,
+        )
+
+    @classmethod
+    def process_document(
+        cls,
+        pdf_document_id: int,
+        workers: int = 1,
+        sync_mode: Optional[str] = None,
+        resume: bool = False,
+        sync_batch_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run the process, parse and sync stages for an already stored document.
+
+        Args:
+            pdf_document_id: Document to process
+            workers: Number of processes used for table detection
+            sync_mode: SyncMode used for the company sync, default
+                       settings.PDF_SYNC_MODE
+            resume: Skip the stages whose checkpoint the document has reached,
+                    reusing their stored output; a chunked sync continues
+                    after its last committed chunk
+            sync_batch_size: Rows per batch (and per chunk with SyncMode.CHUNKED)
+                             in the company sync
+
+        Raises:
+            ValueError: If the document does not exist
+        """
+        try:
+            pdf_document = PDFDocument.objects.get(pk=pdf_document_id)
+        except PDFDocument.DoesNotExist:
+            raise ValueError(f"PDF document {pdf_document_id} does not exist")
+
+        service = cls(
+            page_url=pdf_document.scraped_url or '',
+            attribute_name='',
+            workers=workers,
+            sync_mode=sync_mode,
+            source=pdf_document.source,
+            sync_batch_size=sync_batch_size,
+        )
+        try:
+            return service._process_stages(pdf_document, resume=resume)
+        except Exception as exc:
+            service._mark_failed(pdf_document, exc)
+            logger.exception('PDF pipeline failed for pdf_document_id=%s', pdf_document_id)
+            raise
+        finally:
+            PDFExtractionCache.discard(pdf_document)
+            discard_local_copy(pdf_document)
+
+    @staticmethod
+    def _record_stage(pdf_document: PDFDocument, stage: str, **values: Any) -> None:
+        """Merge values into the stage's progress entry and persist it."""
+        progress = dict(pdf_document.stage_progress or {})
+        progress[stage] = {**progress.get(stage, {}), **values}
+        pdf_document.stage_progress = progress
+        pdf_document.save(update_fields=['stage_progress', 'modified_at'])
+
+    def _run_stage(
+        self,
+        pdf_document: PDFDocument,
+        stage: str,
+        func,
+        *args: Any,
+        describe=None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Run one pipeline stage, recording its status and resource metrics on the document.
+        
+        Args:
+            describe: Optional callable returning stage-specific metrics
+                      (e.g. pages) from the stage's result
+        """
+        self._record_stage(
+            pdf_document,
+            stage,
+            status=PDFStatus.PROCESSING.value,
+            started_at=timezone.now().isoformat(),
+        )
+        meter = StageMeter()
+        try:
+            with meter:
+                result = func(*args, **kwargs)
+        except Exception:
+            self._record_stage(pdf_document, stage, status=PDFStatus.FAILED.value, **meter.metrics)
+            raise
+
+        if describe is not None and result is not None:
+            meter.metrics.update(describe(result))
+        self._record_stage(pdf_document, stage, status=PDFStatus.COMPLETED.value, **meter.metrics)
+        return result
+
+    @staticmethod
+    def _save_checkpoint(pdf_document: PDFDocument, checkpoint: str) -> None:
+        pdf_document.checkpoint = checkpoint
+        pdf_document.save(update_fields=['checkpoint', 'modified_at'])
+
+    def _extract(self, processor: PDFProcessor) -> Optional[PDFExtractionResult]:
+        """
+        Validate and extract the document.
+
+        The tables are also stored, so a run resumed after a failed parse does
+        not extract the PDF again.
+        """
+        extraction = processor.process()
+        if extraction is not None:
+            PDFExtractionCache.persist(processor.pdf_document, extraction)
+        return extraction
+
+    def _process_stages(self, pdf_document: PDFDocument, resume: bool = False) -> Dict[str, Any]:
+        """
+        Run the process, parse and sync stages and mark the document completed.
+
+        A checkpoint is saved after every stage. With resume, stages whose
+        checkpoint the document has already reached are skipped: extracted
+        tables and parsed companies are read back from ExtractedData.
+        """
+        if resume:
+            # PDFProcessor normally sets this, but its stage may be skipped
+            pdf_document.status = PDFStatus.PROCESSING
+            pdf_document.error_message = ''
+            pdf_document.save(update_fields=['status', 'error_message', 'modified_at'])
+        elif pdf_document.reached_checkpoint(PipelineCheckpoint.EXTRACTED):
+            self._save_checkpoint(pdf_document, PipelineCheckpoint.DOWNLOADED)
+
+        if not pdf_document.reached_checkpoint(PipelineCheckpoint.EXTRACTED):
+            processor = PDFProcessor(pdf_document, workers=self.workers)
+            self._run_stage(
+                pdf_document,
+                PipelineStage.PROCESS,
+                self._extract,
+                processor,
+                describe=lambda extraction: {'pages': extraction.page_count},
+            )
+            self._save_checkpoint(pdf_document, PipelineCheckpoint.EXTRACTED)
+
+        extracted_data = None
+        if pdf_document.reached_checkpoint(PipelineCheckpoint.PARSED):
+            extracted_data = pdf_document.extracted_data.filter(
+                data_type=DataType.STRUCTURED_COMPANIES
+            ).first()
+        if extracted_data is None:
+            parser = self.parser_class(pdf_document, workers=self.workers)
+            extracted_data = self._run_stage(
+                pdf_document,
+                PipelineStage.PARSE,
+                parser.process_and_save,
+                describe=lambda extracted: {
+                    'pages': len(extracted.raw_data.get('parse_stats', {}).get('pages', [])),
+                    'companies': extracted.raw_data.get('total_count', 0),
+                },
+            )
+            self._save_checkpoint(pdf_document, PipelineCheckpoint.PARSED)
+            # The parsed companies now cover any resume; drop the bulky raw tables
+            pdf_document.extracted_data.filter(data_type=DataType.RAW_TABLES).delete()
+
+        sync_stats = None
+        if not pdf_document.reached_checkpoint(PipelineCheckpoint.SYNCED):
+            sync_service = CompanySyncService(pdf_document, batch_size=self.sync_batch_size)
+            sync_stats = self._run_stage(
+                pdf_document,
+                PipelineStage.SYNC,
+                sync_service.sync_companies,
+                mode=self.sync_mode,
+                resume=resume,
+                describe=lambda stats: {'companies': stats.get('total_pdf_companies', 0)},
+            )
+            pdf_document.checkpoint = PipelineCheckpoint.SYNCED
+
+        pdf_document.status = PDFStatus.COMPLETED
+        pdf_document.error_message = ''
+        pdf_document.save()
+
+        return {
+            'status': PDFStatus.COMPLETED.value,
+            'pdf_document_id': pdf_document.id,
+            'original_filename': pdf_document.original_filename,
+            'scraped_url': pdf_document.scraped_url,
+            'source_url': pdf_document.source_url,
+            'companies_extracted': extracted_data.raw_data.get('total_count', 0),
+            'sync': sync_stats,
+            'stages': pdf_document.stage_progress,
+            'resumed': resume,
+        }
+
+    @staticmethod
+    def _mark_failed(pdf_document: PDFDocument, exc: Exception) -> None:
+        pdf_document.status = PDFStatus.FAILED
+        pdf_document.error_message = str(exc)
+        pdf_document.save()
+
+    def _record_download(self, pdf_document: PDFDocument, scraper: WebPDFScraper) -> None:
+        """Tag the downloaded document with the pipeline's source and record the scraper's stage metrics."""
+        progress = dict(pdf_document.stage_progress or {})
+        for stage, metrics in getattr(scraper, 'metrics', {}).items():
+            progress[stage] = {**progress.get(stage, {}), 'status': PDFStatus.COMPLETED.value, **metrics}
+
+        pdf_document.source = self.source
+        pdf_document.stage_progress = progress
+        pdf_document.checkpoint = PipelineCheckpoint.DOWNLOADED
+        pdf_document.save(update_fields=['source', 'stage_progress', 'checkpoint', 'modified_at'])
+
     def run(self) -> Dict[str, Any]:
         """Run complete pipeline in one operation."""
         pdf_document = None
 
         try:
-            scraper = WebPDFScraper(
+            with WebPDFScraper(
                 page_url=self.page_url,
                 attribute_name=self.attribute_name,
                 headers=self.headers,
-            )
-            pdf_document = scraper.download_and_create_document()
-
-            processor = PDFProcessor(pdf_document)
-            processor.process()
-
-            parser = CroatianLaborPDFParser(pdf_document)
-            extracted_data = parser.process_and_save()
-
-            sync_service = CompanySyncService(pdf_document)
-            sync_stats = sync_service.sync_companies()
+            ) as scraper:
+                pdf_document = scraper.download_and_create_document(skip_unchanged=self.skip_unchanged)
+            if pdf_document is None:
+                return self._unchanged_result(scraper)
+            self._record_download(pdf_document, scraper)
 
-            pdf_document.status = PDFStatus.COMPLETED
-            pdf_document.error_message = ''
-            pdf_document.save()
-
-            return {
-                'pdf_document_id': pdf_document.id,
-                'original_filename': pdf_document.original_filename,
-                'scraped_url': pdf_document.scraped_url,
-                'source_url': pdf_document.source_url,
-                'companies_extracted': extracted_data.raw_data.get('total_count', 0),
-                'sync': sync_stats,
-            }
+            return self._process_stages(pdf_document)
         except Exception as exc:
             if pdf_document:
-                pdf_document.status = PDFStatus.FAILED
-                pdf_document.error_message = str(exc)
-                pdf_document.save()
+                self._mark_failed(pdf_document, exc)
 
             logger.exception('PDF cron pipeline failed for page_url=%s', self.page_url)
             raise
+        finally:
+            if pdf_document:
+                PDFExtractionCache.discard(pdf_document)
+                discard_local_copy(pdf_document)
 
-    async def run_async(self) -> Dict[str, Any]:
-        """Run complete pipeline in one async operation."""
+    async def run_async(
+        self,
+        download_semaphore: Optional[asyncio.Semaphore] = None,
+        process_lock: Optional[asyncio.Lock] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run complete pipeline in one async operation.
+
+        The download runs on the event loop's thread pool; the remaining
+        stages are sequential and run together in one worker thread. For
+        work that should not block the caller, queue it with
+        enqueue_document and the run_job_worker command instead.
+
+        Args:
+            download_semaphore: Optional semaphore bounding concurrent downloads
+            process_lock: Optional lock serializing the process, parse and sync stages
+        """
+        download_semaphore = download_semaphore or asyncio.Semaphore(1)
+        process_lock = process_lock or asyncio.Lock()
         pdf_document = None
 
         try:
-            scraper = WebPDFScraper(
+            with WebPDFScraper(
                 page_url=self.page_url,
                 attribute_name=self.attribute_name,
                 headers=self.headers,
-            )
-            pdf_document = await scraper.download_and_create_document_async()
-
-            processor = PDFProcessor(pdf_document)
-            await processor.process_async()
-
-            parser = CroatianLaborPDFParser(pdf_document)
-            extracted_data = await parser.process_and_save_async()
-
-            sync_service = CompanySyncService(pdf_document)
-            sync_stats = await sync_service.sync_companies_async()
-
-            pdf_document.status = PDFStatus.COMPLETED
-            pdf_document.error_message = ''
-            await sync_to_async(pdf_document.save)()
-
-            return {
-                'pdf_document_id': pdf_document.id,
-                'original_filename': pdf_document.original_filename,
-                'scraped_url': pdf_document.scraped_url,
-                'source_url': pdf_document.source_url,
-                'companies_extracted': extracted_data.raw_data.get('total_count', 0),
-                'sync': sync_stats,
-            }
+            ) as scraper:
+                async with download_semaphore:
+                    pdf_document = await scraper.download_and_create_document_async(
+                        skip_unchanged=self.skip_unchanged
+                    )
+            if pdf_document is None:
+                return self._unchanged_result(scraper)
+            await sync_to_async(self._record_download)(pdf_document, scraper)
+
+            async with process_lock:
+                return await asyncio.to_thread(self._process_stages, pdf_document)
         except Exception as exc:
             if pdf_document:
-                pdf_document.status = PDFStatus.FAILED
-                pdf_document.error_message = str(exc)
-                await sync_to_async(pdf_document.save)()
+                await sync_to_async(self._mark_failed)(pdf_document, exc)
 
             logger.exception('Async PDF cron pipeline failed for page_url=%s', self.page_url)
             raise
+        finally:
+            if pdf_document:
+                PDFExtractionCache.discard(pdf_document)
+                discard_local_copy(pdf_document)
@@ -0,0 +1,29 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.common.constants import JobStatus
+from apps.common.models import Job
+
+from .constants import PDFStatus
+from .models import PDFDocument
+
+
+@receiver(post_save, sender=Job)
+def release_document_of_failed_job(sender, instance, **kwargs):
+    """Mark the document of a failed pipeline job failed, so it can be queued again."""
+    if instance.command != 'run_pdf_pipeline' or instance.status != JobStatus.FAILED:
+        return
+
+    document_id = instance.arguments.get('resume') or instance.arguments.get('document_id')
+    if document_id is None:
+        return
+
+    PDFDocument.objects.filter(
+        pk=document_id,
+        status__in=[PDFStatus.QUEUED, PDFStatus.PROCESSING],
+    ).update(
+        status=PDFStatus.FAILED,
+        error_message=instance.error_message or f'Job {instance.pk} failed',
+        modified_at=timezone.now(),
+    )
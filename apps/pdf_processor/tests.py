@@ -1,10 +1,22 @@
 import pytest
 import asyncio
+import hashlib
+import os
 from .models import PDFDocument, ExtractedData
 from .constants import PDFStatus, DataType
 from .services import PDFCronPipelineService
 
 
+class FakeScraperBase:
+    """Context manager protocol of WebPDFScraper, for test doubles."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
 @pytest.mark.django_db
 def test_pdf_document_creation():
     pdf_doc = PDFDocument.objects.create(
@@ -42,24 +54,24 @@ def test_pdf_cron_pipeline_service_success(monkeypatch):
         status=PDFStatus.PENDING,
     )
 
-    class FakeScraper:
+    class FakeScraper(FakeScraperBase):
         def __init__(self, page_url, attribute_name=None, headers=None):
             self.page_url = page_url
             self.attribute_name = attribute_name
             self.headers = headers
 
-        def download_and_create_document(self, attribute_name=None):
+        def download_and_create_document(self, attribute_name=None, **kwargs):
             return pdf_doc
 
     class FakeProcessor:
-        def __init__(self, pdf_document):
+        def __init__(self, pdf_document, **kwargs):
             self.pdf_document = pdf_document
 
         def process(self):
             return None
 
     class FakeParser:
-        def __init__(self, pdf_document):
+        def __init__(self, pdf_document, **kwargs):
             self.pdf_document = pdf_document
 
         def process_and_save(self):
@@ -74,10 +86,10 @@ def test_pdf_cron_pipeline_service_success(monkeypatch):
             )
 
     class FakeSyncService:
-        def __init__(self, pdf_document):
+        def __init__(self, pdf_document, **kwargs):
             self.pdf_document = pdf_document
 
-        def sync_companies(self):
+        def sync_companies(self, **kwargs):
             return {
                 'total_pdf_companies': 1,
                 'updated': 0,
@@ -87,7 +99,7 @@ def test_pdf_cron_pipeline_service_success(monkeypatch):
 
     monkeypatch.setattr(services, 'WebPDFScraper', FakeScraper)
     monkeypatch.setattr(services, 'PDFProcessor', FakeProcessor)
-    monkeypatch.setattr(services, 'CroatianLaborPDFParser', FakeParser)
+    monkeypatch.setitem(services.PARSER_REGISTRY, 'croatian_labor', FakeParser)
     monkeypatch.setattr(services, 'CompanySyncService', FakeSyncService)
 
     result = PDFCronPipelineService.run_once(
@@ -112,24 +124,24 @@ def test_pdf_cron_pipeline_service_marks_document_failed_on_error(monkeypatch):
         status=PDFStatus.PENDING,
     )
 
-    class FakeScraper:
+    class FakeScraper(FakeScraperBase):
         def __init__(self, page_url, attribute_name=None, headers=None):
             self.page_url = page_url
             self.attribute_name = attribute_name
             self.headers = headers
 
-        def download_and_create_document(self, attribute_name=None):
+        def download_and_create_document(self, attribute_name=None, **kwargs):
             return pdf_doc
 
     class FakeProcessor:
-        def __init__(self, pdf_document):
+        def __init__(self, pdf_document, **kwargs):
             self.pdf_document = pdf_document
 
         def process(self):
             return None
 
     class FailingParser:
-        def __init__(self, pdf_document):
+        def __init__(self, pdf_document, **kwargs):
             self.pdf_document = pdf_document
 
         def process_and_save(self):
@@ -137,7 +149,7 @@ def test_pdf_cron_pipeline_service_marks_document_failed_on_error(monkeypatch):
 
     monkeypatch.setattr(services, 'WebPDFScraper', FakeScraper)
     monkeypatch.setattr(services, 'PDFProcessor', FakeProcessor)
-    monkeypatch.setattr(services, 'CroatianLaborPDFParser', FailingParser)
+    monkeypatch.setitem(services.PARSER_REGISTRY, 'croatian_labor', FailingParser)
 
     with pytest.raises(RuntimeError, match='parse failed'):
         PDFCronPipelineService.run_once(
@@ -162,24 +174,24 @@ def test_pdf_cron_pipeline_service_run_once_async_success(monkeypatch):
         status=PDFStatus.PENDING,
     )
 
-    class FakeScraper:
+    class FakeScraper(FakeScraperBase):
         def __init__(self, page_url, attribute_name=None, headers=None):
             self.page_url = page_url
             self.attribute_name = attribute_name
             self.headers = headers
 
-        def download_and_create_document(self, attribute_name=None):
+        def download_and_create_document(self, attribute_name=None, **kwargs):
             return pdf_doc
 
     class FakeProcessor:
-        def __init__(self, pdf_document):
+        def __init__(self, pdf_document, **kwargs):
             self.pdf_document = pdf_document
 
         def process(self):
             return None
 
     class FakeParser:
-        def __init__(self, pdf_document):
+        def __init__(self, pdf_document, **kwargs):
             self.pdf_document = pdf_document
 
         def process_and_save(self):
@@ -194,10 +206,10 @@ def test_pdf_cron_pipeline_service_run_once_async_success(monkeypatch):
             )
 
     class FakeSyncService:
-        def __init__(self, pdf_document):
+        def __init__(self, pdf_document, **kwargs):
             self.pdf_document = pdf_document
 
-        def sync_companies(self):
+        def sync_companies(self, **kwargs):
             return {
                 'total_pdf_companies': 1,
                 'updated': 0,
@@ -207,7 +219,7 @@ def test_pdf_cron_pipeline_service_run_once_async_success(monkeypatch):
 
     monkeypatch.setattr(services, 'WebPDFScraper', FakeScraper)
     monkeypatch.setattr(services, 'PDFProcessor', FakeProcessor)
-    monkeypatch.setattr(services, 'CroatianLaborPDFParser', FakeParser)
+    monkeypatch.setitem(services.PARSER_REGISTRY, 'croatian_labor', FakeParser)
     monkeypatch.setattr(services, 'CompanySyncService', FakeSyncService)
 
     # Test sync version to verify pipeline logic
@@ -225,3 +237,1432 @@ def test_pdf_cron_pipeline_service_run_once_async_success(monkeypatch):
     # Verify async entrypoint exists and is callable
     assert hasattr(PDFCronPipelineService, 'run_once_async')
     assert callable(PDFCronPipelineService.run_once_async)
+
+
+@pytest.fixture
+def pdf_doc_on_disk(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    (tmp_path / 'pdfs').mkdir()
+    (tmp_path / 'pdfs' / 'test.pdf').write_bytes(b'%PDF-1.4 fake content')
+    return PDFDocument.objects.create(
+        file='pdfs/test.pdf',
+        original_filename='test.pdf',
+        status=PDFStatus.PENDING,
+    )
+
+
+@pytest.mark.django_db
+def test_processor_and_parser_share_single_extraction(monkeypatch, pdf_doc_on_disk):
+    from apps.pdf_processor import services
+
+    calls = []
+
+    def fake_iter_tables(self):
+        calls.append(self.pdf_path)
+        yield {
+            'page_number': 1,
+            'rows': [
+                ['1', 'ACME d.o.o.', '12345678901', 'Ilica 1'],
+                [None, None, None, 'Zagreb'],
+            ],
+        }
+
+    monkeypatch.setattr(services.PDFExtractor, 'iter_tables', fake_iter_tables)
+    services.PDFExtractionCache.clear()
+
+    services.PDFProcessor(pdf_doc_on_disk).process()
+    parser = services.CroatianLaborPDFParser(pdf_doc_on_disk)
+    first = parser.parse_companies_table()
+    second = parser.parse_companies_table()
+
+    assert len(calls) == 1
+    assert first == second
+    assert first[0]['address'] == 'Ilica 1 Zagreb'
+
+
+@pytest.mark.django_db
+def test_extraction_cache_invalidated_when_file_changes(monkeypatch, pdf_doc_on_disk):
+    from apps.pdf_processor import services
+
+    calls = []
+    monkeypatch.setattr(
+        services.PDFExtractor,
+        'iter_tables',
+        lambda self: calls.append(1) or iter([]),
+    )
+    services.PDFExtractionCache.clear()
+
+    first = services.PDFExtractionCache.get_result(pdf_doc_on_disk)
+    with open(pdf_doc_on_disk.file.path, 'ab') as file:
+        file.write(b' changed')
+    second = services.PDFExtractionCache.get_result(pdf_doc_on_disk)
+
+    assert len(calls) == 2
+    assert first.content_hash != second.content_hash
+
+
+@pytest.mark.django_db
+def test_extraction_cache_uses_stored_content_hash(monkeypatch, pdf_doc_on_disk):
+    from apps.pdf_processor import services
+
+    pdf_doc_on_disk.content_hash = hashlib.sha256(b'%PDF-1.4 fake content').hexdigest()
+    pdf_doc_on_disk.save(update_fields=['content_hash'])
+    monkeypatch.setattr(services.PDFExtractor, 'iter_tables', lambda self: iter([]))
+    monkeypatch.setattr(services, 'compute_file_hash', lambda path: pytest.fail('the stored hash must be used'))
+    services.PDFExtractionCache.clear()
+
+    result = services.PDFExtractionCache.get_result(pdf_doc_on_disk)
+    assert list(services.PDFExtractionCache.iter_tables(pdf_doc_on_disk)) == []
+
+    assert result.content_hash == pdf_doc_on_disk.content_hash
+
+
+@pytest.mark.django_db
+def test_parser_merges_continuation_rows_across_pages(monkeypatch, pdf_doc_on_disk):
+    from apps.pdf_processor import services
+
+    def fake_iter_tables(self):
+        yield {
+            'page_number': 1,
+            'rows': [
+                ['1', 'ACME d.o.o.', '12345678901', 'Ilica 1'],
+                ['2', 'BETA obrt', '10987654321', 'Vukovarska'],
+            ],
+        }
+        yield {
+            'page_number': 2,
+            'rows': [
+                [None, None, None, '10000 Zagreb'],
+                ['3', 'GAMA j.d.o.o.', '11111111111', 'Split'],
+            ],
+        }
+
+    monkeypatch.setattr(services.PDFExtractor, 'iter_tables', fake_iter_tables)
+    services.PDFExtractionCache.clear()
+
+    companies = services.CroatianLaborPDFParser(pdf_doc_on_disk).parse_companies_table()
+
+    assert [company['legal_id'] for company in companies] == [
+        '12345678901', '10987654321', '11111111111',
+    ]
+    assert companies[1]['address'] == 'Vukovarska 10000 Zagreb'
+    assert companies[1]['page_number'] == 1
+    assert companies[2]['page_number'] == 2
+
+
+@pytest.mark.django_db
+def test_debug_parse_matches_production_and_stats_are_stored(monkeypatch, pdf_doc_on_disk):
+    from apps.pdf_processor import services
+
+    def fake_iter_tables(self):
+        yield {
+            'page_number': 1,
+            'rows': [
+                ['R.BR.', 'NAZIV POSLODAVCA', 'OIB', 'ADRESA'],
+                ['1', 'ACME d.o.o.', '12345678901', 'Ilica 1'],
+                ['2', 'BETA obrt', '10987654321', 'Vukovarska'],
+            ],
+        }
+        yield {
+            'page_number': 2,
+            'rows': [
+                [None, None, None, '10000 Zagreb'],
+                ['3', 'AB', '11111111111', 'Split'],
+                ['4', 'DELTA d.d.', '   ', 'Osijek'],
+                ['5', 'only two'],
+            ],
+        }
+
+    monkeypatch.setattr(services.PDFExtractor, 'iter_tables', fake_iter_tables)
+    services.PDFExtractionCache.clear()
+    parser = services.CroatianLaborPDFParser(pdf_doc_on_disk)
+
+    debug = parser.parse_companies_table_with_debug()
+    extracted = parser.process_and_save()
+
+    assert debug['companies'] == parser.parse_companies_table() == extracted.raw_data['companies']
+    assert debug['companies'][1]['address'] == 'Vukovarska 10000 Zagreb'
+    assert debug['filters_applied'] == {
+        'less_than_4_cols': 1,
+        'is_header': 1,
+        'no_legal_name': 0,
+        'no_legal_id': 1,
+        'name_too_short': 1,
+    }
+    assert debug['total_rows_filtered'] == 4
+    assert debug['rows_seen'] == 6
+    assert debug['rejected_samples']['name_too_short'] == [
+        {'page_number': 2, 'row': ['3', 'AB', '11111111111', 'Split']},
+    ]
+    assert [page['page_number'] for page in debug['pages']] == [1, 2]
+
+    stats = extracted.raw_data['parse_stats']
+    assert stats['filters_applied'] == debug['filters_applied']
+    assert stats['pages'][1]['rows'] == 4
+
+
+def test_parallel_extraction_matches_sequential(tmp_path):
+    from apps.pdf_processor.benchmarks import build_ministry_pdf
+    from apps.pdf_processor.services import CroatianLaborPDFParser, PDFExtractor
+
+    pdf_path = tmp_path / 'ministry.pdf'
+    pdf_path.write_bytes(build_ministry_pdf(pages=6, rows_per_page=5))
+    layout = CroatianLaborPDFParser.table_layout()
+
+    sequential = PDFExtractor(str(pdf_path), layout=layout).extract_tables()
+    parallel = PDFExtractor(str(pdf_path), workers=2, layout=layout).extract_tables()
+
+    assert [table['page_number'] for table in sequential] == [1, 2, 3, 4, 5, 6]
+    assert sequential[0]['rows'][0] == ['1.', 'TVRTKA 1 d.o.o.', '10000000001', 'Ulica 1']
+    assert parallel == sequential
+
+
+def test_reused_column_edges_match_per_page_detection(tmp_path, monkeypatch):
+    from apps.pdf_processor import extraction
+    from apps.pdf_processor.benchmarks import build_ministry_pdf
+    from apps.pdf_processor.extraction import TableLayout
+    from apps.pdf_processor.services import PDFExtractor
+
+    pdf_path = tmp_path / 'ministry.pdf'
+    pdf_path.write_bytes(build_ministry_pdf(pages=4, rows_per_page=5))
+
+    requested_settings = []
+    original_find_table = extraction._find_table
+
+    def tracking_find_table(page, table_settings):
+        requested_settings.append(table_settings)
+        return original_find_table(page, table_settings)
+
+    monkeypatch.setattr(extraction, '_find_table', tracking_find_table)
+
+    detected = PDFExtractor(str(pdf_path), layout=TableLayout(skip_rows=2)).extract_tables()
+    requested_settings.clear()
+    reused = PDFExtractor(str(pdf_path), layout=TableLayout(skip_rows=2, reuse_column_edges=True)).extract_tables()
+
+    assert reused == detected
+    assert requested_settings[0] == {}
+    assert all(
+        settings['explicit_vertical_lines'] == [40.0, 80.0, 300.0, 400.0, 560.0]
+        for settings in requested_settings[1:]
+    )
+    assert len(requested_settings) == 4
+
+
+def test_reused_column_edges_are_redetected_when_page_columns_change(tmp_path):
+    from apps.pdf_processor.benchmarks import MINISTRY_COLUMNS, build_ministry_pdf
+    from apps.pdf_processor.extraction import TableLayout
+    from apps.pdf_processor.services import PDFExtractor
+
+    pdf_path = tmp_path / 'ministry.pdf'
+    pdf_path.write_bytes(build_ministry_pdf(
+        pages=6,
+        rows_per_page=5,
+        page_columns=[MINISTRY_COLUMNS, MINISTRY_COLUMNS, MINISTRY_COLUMNS, [40, 70, 200, 330, 560]],
+    ))
+
+    detected = PDFExtractor(str(pdf_path), layout=TableLayout(skip_rows=2)).extract_tables()
+    layout = TableLayout(skip_rows=2, reuse_column_edges=True)
+    sequential = PDFExtractor(str(pdf_path), layout=layout).extract_tables()
+    parallel = PDFExtractor(str(pdf_path), workers=3, layout=layout).extract_tables()
+
+    assert detected[5]['rows'][0] == ['26.', 'TVRTKA 26 d.o.o.', '10000000026', 'Ulica 26']
+    assert sequential == detected
+    assert parallel == sequential
+
+
+def test_reused_column_edges_are_not_applied_to_pages_without_rulings(tmp_path):
+    from apps.pdf_processor.benchmarks import MINISTRY_COLUMNS, build_ministry_pdf
+    from apps.pdf_processor.extraction import TableLayout
+    from apps.pdf_processor.services import PDFExtractor
+
+    pdf_path = tmp_path / 'ministry.pdf'
+    pdf_path.write_bytes(build_ministry_pdf(
+        pages=4,
+        rows_per_page=5,
+        page_columns=[MINISTRY_COLUMNS, MINISTRY_COLUMNS, [40, 70, 200, 330, 560]],
+        page_vertical_rulings=[True, True, False],
+    ))
+
+    detected = PDFExtractor(str(pdf_path), layout=TableLayout(skip_rows=2)).extract_tables()
+    layout = TableLayout(skip_rows=2, reuse_column_edges=True)
+    sequential = PDFExtractor(str(pdf_path), layout=layout).extract_tables()
+    parallel = PDFExtractor(str(pdf_path), workers=2, layout=layout).extract_tables()
+
+    # Nothing to check the edges against, so the pages are detected from scratch
+    assert [table['page_number'] for table in detected] == [1, 2]
+    assert sequential == detected
+    assert parallel == sequential
+
+
+@pytest.mark.django_db
+def test_registered_parser_declares_its_own_schema(monkeypatch, pdf_doc_on_disk):
+    from apps.pdf_processor import services
+
+    monkeypatch.setattr(services, 'PARSER_REGISTRY', dict(services.PARSER_REGISTRY))
+
+    @services.register_parser('regional_list')
+    class RegionalListParser(services.TablePDFParser):
+        columns = ['legal_id', 'legal_name', 'city']
+        header_keywords = ['oib']
+        skip_rows = 1
+
+    def fake_iter_tables(self):
+        assert self.layout.skip_rows == 1
+        yield {'page_number': 1, 'rows': [['OIB', 'Naziv', 'Grad'], ['12345678901', 'ACME d.o.o.', 'Split']]}
+
+    monkeypatch.setattr(services.PDFExtractor, 'iter_tables', fake_iter_tables)
+    services.PDFExtractionCache.clear()
+    pdf_doc_on_disk.source = 'regional_list'
+
+    parser = services.get_parser_class(pdf_doc_on_disk.source)(pdf_doc_on_disk)
+    extracted = parser.process_and_save()
+
+    assert parser.source == 'regional_list'
+    assert extracted.raw_data['companies'] == [
+        {'legal_id': '12345678901', 'legal_name': 'ACME d.o.o.', 'city': 'Split', 'page_number': 1},
+    ]
+    assert extracted.raw_data['parser'] == 'RegionalListParser'
+    with pytest.raises(ValueError):
+        services.register_parser('regional_list')(RegionalListParser)
+    with pytest.raises(ValueError):
+        services.get_parser_class('unknown')
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('payload_format', ['columnar', 'columnar_zlib', 'table'])
+def test_company_payload_formats_decode_to_parsed_rows(monkeypatch, pdf_doc_on_disk, payload_format):
+    from apps.pdf_processor import services
+
+    monkeypatch.setattr(services.PDFExtractor, 'iter_tables', _fake_ministry_tables)
+    services.PDFExtractionCache.clear()
+    parser = services.CroatianLaborPDFParser(pdf_doc_on_disk)
+    expected = parser.parse_companies_table()
+
+    extracted = parser.process_and_save(payload_format=payload_format)
+    extracted = ExtractedData.objects.get(pk=extracted.pk)
+
+    assert 'companies' not in extracted.raw_data
+    assert extracted.raw_data['schema'] == ['index', 'legal_name', 'legal_id', 'address', 'page_number']
+    assert extracted.raw_data['total_count'] == 2
+    assert extracted.company_rows.count() == (2 if payload_format == 'table' else 0)
+    assert extracted.get_companies() == expected
+    assert services.CompanySyncService(pdf_doc_on_disk).sync_companies()['created'] == 2
+
+
+@pytest.mark.django_db
+def test_extracted_data_api_renders_header_and_pages_table_payload(monkeypatch, pdf_doc_on_disk):
+    from rest_framework.test import APIClient
+    from apps.pdf_processor import services
+    from apps.users.models import CustomUser
+
+    monkeypatch.setattr(services.PDFExtractor, 'iter_tables', _fake_ministry_tables)
+    services.PDFExtractionCache.clear()
+    parser = services.CroatianLaborPDFParser(pdf_doc_on_disk)
+    expected = parser.parse_companies_table()
+    extracted = parser.process_and_save(payload_format='table')
+
+    client = APIClient()
+    client.force_authenticate(CustomUser.objects.create_user(email='admin@example.com', password='secret'))
+
+    response = client.get(f'/api/extracted-data/{extracted.id}/')
+    assert response.status_code == 200
+    raw_data = response.json()['raw_data']
+    assert raw_data['format'] == 'table'
+    assert raw_data['total_count'] == 2
+    assert 'schema' in raw_data and 'companies' not in raw_data
+
+    response = client.get(f'/api/extracted-data/{extracted.id}/companies/', {'page_size': 1, 'page': 2})
+    assert response.status_code == 200
+    assert response.json()['count'] == 2
+    assert response.json()['results'] == expected[1:]
+
+
+@pytest.mark.django_db
+def test_extracted_data_list_query_count_is_independent_of_item_count(django_assert_num_queries):
+    from rest_framework.test import APIClient
+    from apps.users.models import CustomUser
+
+    pdf_document = PDFDocument.objects.create(original_filename='list.pdf', file='pdfs/list.pdf')
+    for index in range(5):
+        extracted = ExtractedData.objects.create(
+            pdf_document=pdf_document,
+            data_type=DataType.STRUCTURED_COMPANIES,
+            raw_data={'format': 'table', 'schema': ['legal_name', 'legal_id', 'address'], 'total_count': 1},
+            processed=True,
+        )
+        extracted.company_rows.create(position=0, legal_name=f'Company {index}', legal_id=str(index), address='')
+    _create_structured_companies(pdf_document, SYNC_PDF_COMPANIES)
+
+    client = APIClient()
+    client.force_authenticate(CustomUser.objects.create_user(email='admin@example.com', password='secret'))
+
+    # The request savepoint, the list itself and no per-item company_rows queries
+    with django_assert_num_queries(3):
+        response = client.get('/api/extracted-data/')
+    assert response.status_code == 200
+    results = response.json()
+    assert len(results) == 6
+    assert all('companies' not in item['raw_data'] for item in results)
+
+
+def _create_structured_companies(pdf_document, companies):
+    return ExtractedData.objects.create(
+        pdf_document=pdf_document,
+        data_type=DataType.STRUCTURED_COMPANIES,
+        raw_data={'companies': companies, 'total_count': len(companies)},
+        processed=True,
+    )
+
+
+SYNC_PDF_COMPANIES = [
+    {'legal_name': 'ACME d.o.o.', 'legal_id': '11111111111', 'address': 'Ilica 1'},
+    {'legal_name': 'Beta obrt, vl. Ivan', 'legal_id': '22222222222', 'address': ''},
+    {'legal_name': 'NEW COMPANY j.d.o.o.', 'legal_id': '33333333333', 'address': 'Split'},
+    {'legal_name': 'NEW COMPANY j.d.o.o.', 'legal_id': '33333333333', 'address': 'Split'},
+    {'legal_name': 'GAMA d.d.', 'legal_id': '44444444444', 'address': 'Rijeka'},
+]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('bulk', [True, False])
+def test_company_sync_paths_produce_same_stats(bulk):
+    from apps.companies.models import Company
+    from apps.pdf_processor.constants import SyncMode
+    from apps.pdf_processor.services import CompanySyncService
+
+    Company.objects.create(display_name='Acme', legal_name='Acme', legal_id='11111111111', category='Other')
+    Company.objects.create(display_name='Beta', legal_name='BETA OBRT, VL. IVAN', category='Other')
+    pdf_doc = PDFDocument.objects.create(file='pdfs/test.pdf', original_filename='test.pdf')
+    _create_structured_companies(pdf_doc, SYNC_PDF_COMPANIES)
+
+    stats = CompanySyncService(pdf_doc).sync_companies(bulk=bulk, mode=SyncMode.FULL)
+
+    assert stats == {'total_pdf_companies': 5, 'updated': 3, 'created': 2, 'errors': [], 'mode': 'full'}
+    assert Company.objects.count() == 4
+    assert Company.objects.filter(blacklisted_at__isnull=False).count() == 4
+    created = Company.objects.get(legal_id='33333333333')
+    assert created.display_name == 'NEW COMPANY'
+    assert created.id_name
+    assert created.description == 'Imported from PDF. Address: Split'
+
+
+@pytest.mark.django_db
+def test_bulk_company_sync_query_count_is_independent_of_row_count(django_assert_max_num_queries):
+    from apps.pdf_processor.services import CompanySyncService
+
+    pdf_doc = PDFDocument.objects.create(file='pdfs/test.pdf', original_filename='test.pdf')
+    _create_structured_companies(pdf_doc, [
+        {'legal_name': f'Company {i} d.o.o.', 'legal_id': f'{i:011d}', 'address': ''}
+        for i in range(300)
+    ])
+
+    with django_assert_max_num_queries(16):
+        stats = CompanySyncService(pdf_doc).sync_companies()
+
+    assert stats['created'] == 300
+
+
+@pytest.mark.django_db
+def test_reset_blacklist_status_is_a_single_update(django_assert_num_queries):
+    from django.utils import timezone
+    from apps.companies.models import Company
+    from apps.pdf_processor.services import CompanySyncService
+
+    blacklisted_at = timezone.now()
+    for i in range(5):
+        Company.objects.create(display_name=f'Company {i}', category='Other', blacklisted_at=blacklisted_at)
+    Company.objects.create(display_name='Clean', category='Other')
+    pdf_doc = PDFDocument.objects.create(file='pdfs/test.pdf', original_filename='test.pdf')
+
+    # The lookup of other sources' lists, then one UPDATE
+    with django_assert_num_queries(2):
+        reset_count = CompanySyncService(pdf_doc).reset_blacklist_status()
+
+    assert reset_count == 5
+    assert not Company.objects.filter(blacklisted_at__isnull=False).exists()
+    assert Company.objects.filter(last_blacklisted_at=blacklisted_at).count() == 5
+
+
+@pytest.mark.django_db
+def test_sync_rolls_back_reset_when_sync_fails(monkeypatch):
+    from django.utils import timezone
+    from apps.companies.models import Company
+    from apps.pdf_processor.services import CompanySyncService
+
+    Company.objects.create(display_name='Listed', category='Other', blacklisted_at=timezone.now())
+    pdf_doc = PDFDocument.objects.create(file='pdfs/test.pdf', original_filename='test.pdf')
+    _create_structured_companies(pdf_doc, SYNC_PDF_COMPANIES)
+
+    def failing_sync(self, pdf_companies, stats):
+        raise RuntimeError('database went away')
+
+    monkeypatch.setattr(CompanySyncService, '_sync_bulk', failing_sync)
+
+    with pytest.raises(RuntimeError):
+        CompanySyncService(pdf_doc).sync_companies()
+
+    assert Company.objects.filter(blacklisted_at__isnull=False).count() == 1
+
+
+@pytest.mark.django_db
+def test_diff_sync_only_touches_added_and_removed_companies():
+    from django.utils import timezone
+    from apps.companies.models import Company
+    from apps.pdf_processor.constants import SyncMode
+    from apps.pdf_processor.services import CompanySyncService
+
+    previous_doc = PDFDocument.objects.create(
+        file='pdfs/old.pdf',
+        original_filename='old.pdf',
+        scraped_url='https://example.com/pdfs',
+        status=PDFStatus.COMPLETED,
+    )
+    _create_structured_companies(previous_doc, [
+        {'legal_name': 'STAYS d.o.o.', 'legal_id': '11111111111'},
+        {'legal_name': 'LEAVES d.o.o.', 'legal_id': '22222222222'},
+    ])
+    stamped_at = timezone.now() - timezone.timedelta(days=1)
+    stays = Company.objects.create(display_name='Stays', legal_id='11111111111', category='Other', blacklisted_at=stamped_at)
+    leaves = Company.objects.create(display_name='Leaves', legal_id='22222222222', category='Other', blacklisted_at=stamped_at)
+
+    current_doc = PDFDocument.objects.create(
+        file='pdfs/new.pdf',
+        original_filename='new.pdf',
+        scraped_url='https://example.com/pdfs',
+    )
+    _create_structured_companies(current_doc, [
+        {'legal_name': 'STAYS d.o.o.', 'legal_id': '11111111111'},
+        {'legal_name': 'JOINS d.o.o.', 'legal_id': '33333333333'},
+    ])
+
+    stats = CompanySyncService(current_doc).sync_companies(mode=SyncMode.DIFF)
+
+    assert stats['mode'] == 'diff'
+    assert stats['diff'] == {
+        'previous_pdf_document_id': previous_doc.id,
+        'added': 1,
+        'removed': 1,
+        'unchanged': 1,
+    }
+    assert stats['created'] == 1
+    stays.refresh_from_db()
+    leaves.refresh_from_db()
+    assert stays.blacklisted_at == stamped_at
+    assert leaves.blacklisted_at is None
+    assert leaves.last_blacklisted_at == stamped_at
+    assert Company.objects.get(legal_id='33333333333').blacklisted_at is not None
+
+
+@pytest.mark.django_db
+def test_diff_sync_without_previous_document_clears_nothing():
+    from django.utils import timezone
+    from apps.companies.models import Company
+    from apps.pdf_processor.constants import SyncMode
+    from apps.pdf_processor.services import CompanySyncService
+
+    listed = Company.objects.create(display_name='Listed', legal_id='99999999999', category='Other', blacklisted_at=timezone.now())
+    pdf_doc = PDFDocument.objects.create(file='pdfs/test.pdf', original_filename='test.pdf')
+    _create_structured_companies(pdf_doc, SYNC_PDF_COMPANIES)
+
+    stats = CompanySyncService(pdf_doc).sync_companies(mode=SyncMode.DIFF)
+
+    assert stats['mode'] == 'diff'
+    assert stats['diff'] == {'previous_pdf_document_id': None, 'added': 4, 'removed': 0, 'unchanged': 0}
+    assert stats['created'] == 4
+    listed.refresh_from_db()
+    assert listed.blacklisted_at is not None
+
+
+@pytest.mark.django_db
+def test_diff_sync_keeps_companies_listed_by_other_sources():
+    from apps.companies.models import Company
+    from apps.pdf_processor.constants import SyncMode
+    from apps.pdf_processor.services import CompanySyncService
+
+    def sync(scraped_url, companies):
+        pdf_doc = PDFDocument.objects.create(file='pdfs/test.pdf', original_filename='test.pdf', scraped_url=scraped_url)
+        _create_structured_companies(pdf_doc, companies)
+        stats = CompanySyncService(pdf_doc).sync_companies(mode=SyncMode.DIFF)
+        pdf_doc.status = PDFStatus.COMPLETED
+        pdf_doc.save()
+        return stats
+
+    def blacklisted():
+        return sorted(Company.objects.filter(blacklisted_at__isnull=False).values_list('legal_id', flat=True))
+
+    shared = {'legal_name': 'SHARED d.o.o.', 'legal_id': '33333333333'}
+    first_a = sync('https://example.com/a', [{'legal_name': 'ONLY A d.o.o.', 'legal_id': '11111111111'}, shared])
+    first_b = sync('https://example.com/b', [{'legal_name': 'ONLY B d.o.o.', 'legal_id': '22222222222'}, shared])
+
+    assert (first_a['mode'], first_b['mode']) == ('diff', 'diff')
+    assert blacklisted() == ['11111111111', '22222222222', '33333333333']
+
+    # Source A drops both of its companies; only the one B does not list leaves the blacklist
+    stats = sync('https://example.com/a', [])
+
+    assert stats['diff']['removed'] == 1
+    assert blacklisted() == ['22222222222', '33333333333']
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('mode', ['full', 'chunked'])
+def test_full_sync_keeps_companies_listed_only_by_other_sources(mode):
+    from django.utils import timezone
+    from apps.companies.models import Company
+    from apps.pdf_processor.constants import SyncMode
+    from apps.pdf_processor.services import CompanySyncService
+
+    def sync(scraped_url, companies, mode):
+        pdf_doc = PDFDocument.objects.create(file='pdfs/test.pdf', original_filename='test.pdf', scraped_url=scraped_url)
+        _create_structured_companies(pdf_doc, companies)
+        CompanySyncService(pdf_doc).sync_companies(mode=mode)
+        pdf_doc.status = PDFStatus.COMPLETED
+        pdf_doc.save()
+
+    sync('https://example.com/a', [{'legal_name': 'ONLY A d.o.o.', 'legal_id': '11111111111'}], SyncMode.DIFF)
+    sync('https://example.com/b', [{'legal_name': 'ONLY B obrt', 'legal_id': '22222222222'}], SyncMode.DIFF)
+    Company.objects.create(display_name='Stale', legal_id='99999999999', category='Other', blacklisted_at=timezone.now())
+
+    sync('https://example.com/a', [{'legal_name': 'NEW A d.o.o.', 'legal_id': '44444444444'}], mode)
+
+    blacklisted = Company.objects.filter(blacklisted_at__isnull=False)
+    assert sorted(blacklisted.values_list('legal_name', flat=True)) == ['NEW A d.o.o.', 'ONLY B obrt']
+
+
+@pytest.mark.django_db
+def test_chunked_sync_matches_full_sync_and_swaps_list_in():
+    from django.utils import timezone
+    from apps.companies.models import Company
+    from apps.pdf_processor.constants import SyncMode
+    from apps.pdf_processor.models import PendingBlacklistEntry
+    from apps.pdf_processor.services import CompanySyncService
+
+    stamped_at = timezone.now() - timezone.timedelta(days=1)
+    Company.objects.create(display_name='Acme', legal_name='Acme', legal_id='11111111111', category='Other')
+    Company.objects.create(display_name='Beta', legal_name='BETA OBRT, VL. IVAN', category='Other')
+    delisted = Company.objects.create(display_name='Gone', legal_id='99999999999', category='Other', blacklisted_at=stamped_at)
+    pdf_doc = PDFDocument.objects.create(file='pdfs/test.pdf', original_filename='test.pdf')
+    _create_structured_companies(pdf_doc, SYNC_PDF_COMPANIES)
+
+    stats = CompanySyncService(pdf_doc, batch_size=2).sync_companies(mode=SyncMode.CHUNKED)
+
+    assert stats['mode'] == 'chunked'
+    assert stats['batch_size'] == 2
+    assert (stats['updated'], stats['created'], stats['errors']) == (3, 2, [])
+    assert Company.objects.filter(blacklisted_at__isnull=False).count() == 4
+    delisted.refresh_from_db()
+    assert delisted.blacklisted_at is None
+    assert delisted.last_blacklisted_at == stamped_at
+    assert not PendingBlacklistEntry.objects.exists()
+    assert pdf_doc.stage_progress['sync']['rows_done'] == 5
+
+
+@pytest.mark.django_db
+def test_chunked_sync_keeps_old_list_visible_until_resumed_run_swaps(monkeypatch):
+    from django.utils import timezone
+    from apps.companies.models import Company
+    from apps.pdf_processor.constants import SyncMode
+    from apps.pdf_processor.services import CompanySyncService
+
+    listed = Company.objects.create(display_name='Listed', legal_id='99999999999', category='Other', blacklisted_at=timezone.now())
+    pdf_doc = PDFDocument.objects.create(file='pdfs/test.pdf', original_filename='test.pdf')
+    _create_structured_companies(pdf_doc, [
+        {'legal_name': f'Company {i} d.o.o.', 'legal_id': f'{i:011d}', 'address': ''}
+        for i in range(5)
+    ])
+
+    original_sync_bulk = CompanySyncService._sync_bulk
+    chunks = []
+
+    def failing_second_chunk(self, pdf_companies, stats, stamp=True):
+        chunks.append([c['legal_id'] for c in pdf_companies])
+        if len(chunks) == 2:
+            raise RuntimeError('database went away')
+        return original_sync_bulk(self, pdf_companies, stats, stamp=stamp)
+
+    monkeypatch.setattr(CompanySyncService, '_sync_bulk', failing_second_chunk)
+    with pytest.raises(RuntimeError):
+        CompanySyncService(pdf_doc, batch_size=2).sync_companies(mode=SyncMode.CHUNKED)
+
+    # The first chunk is committed, but the visible blacklist is still the old one
+    assert Company.objects.count() == 3
+    assert list(Company.objects.filter(blacklisted_at__isnull=False)) == [listed]
+    assert pdf_doc.pending_blacklist.count() == 2
+    assert pdf_doc.stage_progress['sync']['rows_done'] == 2
+
+    monkeypatch.undo()
+    stats = CompanySyncService(pdf_doc, batch_size=2).sync_companies(mode=SyncMode.CHUNKED, resume=True)
+
+    assert stats['resumed_at_row'] == 2
+    assert stats['created'] == 5
+    assert Company.objects.filter(blacklisted_at__isnull=False).count() == 5
+    listed.refresh_from_db()
+    assert listed.blacklisted_at is None
+
+
+class FakeSession:
+    def __init__(self, get):
+        self.get = get
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f'HTTP {self.status_code}')
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+@pytest.fixture
+def completed_scraped_doc():
+    return PDFDocument.objects.create(
+        file='pdfs/old.pdf',
+        original_filename='old.pdf',
+        scraped_url='https://example.com/pdfs',
+        source_url='https://example.com/files/list.pdf',
+        status=PDFStatus.COMPLETED,
+        content_hash=hashlib.sha256(b'%PDF same').hexdigest(),
+        etag='"abc"',
+        last_modified='Wed, 01 Oct 2026 10:00:00 GMT',
+    )
+
+
+@pytest.mark.django_db
+def test_scraper_sends_conditional_get_and_skips_on_304(monkeypatch, completed_scraped_doc):
+    from apps.pdf_processor import services
+
+    sent_headers = {}
+
+    def fake_get(url, headers=None, timeout=None, stream=False):
+        sent_headers.update(headers)
+        return FakeResponse(status_code=304)
+
+    scraper = services.WebPDFScraper(
+        'https://example.com/pdfs',
+        attribute_name='data-fileid',
+        session=FakeSession(fake_get),
+    )
+    monkeypatch.setattr(scraper, 'find_pdf_link', lambda: 'https://example.com/files/list.pdf')
+
+    assert scraper.download_and_create_document(skip_unchanged=True) is None
+    assert scraper.previous_document == completed_scraped_doc
+    assert sent_headers['If-None-Match'] == '"abc"'
+    assert sent_headers['If-Modified-Since'] == 'Wed, 01 Oct 2026 10:00:00 GMT'
+    assert PDFDocument.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_pipeline_reports_unchanged_when_content_hash_matches(monkeypatch, completed_scraped_doc):
+    from apps.pdf_processor import services
+
+    monkeypatch.setattr(
+        services,
+        'build_http_session',
+        lambda: FakeSession(lambda url, **kwargs: FakeResponse(content=b'%PDF same')),
+    )
+    monkeypatch.setattr(
+        services.WebPDFScraper,
+        'find_pdf_link',
+        lambda self: 'https://example.com/files/list.pdf',
+    )
+
+    result = PDFCronPipelineService.run_once(
+        page_url='https://example.com/pdfs',
+        attribute_name='data-fileid',
+    )
+
+    assert result['status'] == 'unchanged'
+    assert result['pdf_document_id'] == completed_scraped_doc.id
+    assert PDFDocument.objects.count() == 1
+
+
+def test_scraper_closes_only_the_session_it_created(monkeypatch):
+    from apps.pdf_processor import services
+
+    created = FakeSession(None)
+    monkeypatch.setattr(services, 'build_http_session', lambda: created)
+    given = FakeSession(None)
+
+    with services.WebPDFScraper('https://example.com/pdfs') as scraper:
+        assert scraper.session is created
+    with services.WebPDFScraper('https://example.com/pdfs', session=given):
+        pass
+
+    assert created.closed
+    assert not given.closed
+
+
+@pytest.fixture
+def stub_server():
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        failures = {}
+        client_ports = []
+
+        def do_GET(self):
+            self.client_ports.append(self.client_address[1])
+            if self.failures.get(self.path, 0) > 0:
+                self.failures[self.path] -= 1
+                self._send(502, b'bad gateway', 'text/plain')
+            elif self.path == '/page':
+                self._send(200, b'<a data-fileid="1" href="/files/list.pdf">Popis</a>', 'text/html')
+            elif self.path == '/files/list.pdf':
+                self._send(200, b'%PDF-1.4 stub', 'application/pdf')
+            else:
+                self._send(404, b'', 'text/plain')
+
+        def _send(self, status, body, content_type):
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.base_url = f'http://127.0.0.1:{server.server_address[1]}'
+    server.handler = Handler
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_scraper_retries_transient_errors(stub_server):
+    from apps.pdf_processor.services import WebPDFScraper, build_http_session
+
+    stub_server.handler.failures['/page'] = 2
+    scraper = WebPDFScraper(
+        f'{stub_server.base_url}/page',
+        attribute_name='data-fileid',
+        session=build_http_session(backoff_factor=0),
+    )
+
+    assert scraper.find_pdf_link() == f'{stub_server.base_url}/files/list.pdf'
+    assert len(stub_server.handler.client_ports) == 3
+
+
+@pytest.mark.django_db
+def test_scraper_reuses_connection_for_page_and_download(settings, tmp_path, stub_server):
+    from apps.pdf_processor.services import WebPDFScraper, build_http_session
+
+    settings.MEDIA_ROOT = str(tmp_path)
+    scraper = WebPDFScraper(
+        f'{stub_server.base_url}/page',
+        attribute_name='data-fileid',
+        session=build_http_session(backoff_factor=0),
+    )
+
+    pdf_document = scraper.download_and_create_document()
+
+    assert pdf_document.original_filename == 'list.pdf'
+    assert pdf_document.file.read() == b'%PDF-1.4 stub'
+    assert pdf_document.content_hash == hashlib.sha256(b'%PDF-1.4 stub').hexdigest()
+    assert len(stub_server.handler.client_ports) == 2
+    assert len(set(stub_server.handler.client_ports)) == 1
+
+
+@pytest.mark.django_db
+def test_downloaded_pdf_is_streamed_to_a_local_spool_file(settings, tmp_path):
+    from apps.pdf_processor import services
+
+    settings.MEDIA_ROOT = str(tmp_path)
+    content = b'%PDF-1.4 ' + b'x' * (3 * services.WebPDFScraper.chunk_size)
+    scraper = services.WebPDFScraper(
+        'https://example.com/pdfs',
+        attribute_name='data-fileid',
+        session=FakeSession(lambda url, **kwargs: FakeResponse(content=content)),
+    )
+    scraper.find_pdf_link = lambda: 'https://example.com/files/list.pdf'
+
+    pdf_document = scraper.download_and_create_document()
+
+    assert services.get_local_pdf_path(pdf_document) == pdf_document.local_path
+    with open(pdf_document.local_path, 'rb') as spool_file:
+        assert spool_file.read() == content
+    assert pdf_document.content_hash == hashlib.sha256(content).hexdigest()
+
+    local_path = pdf_document.local_path
+    services.discard_local_copy(pdf_document)
+    assert not os.path.exists(local_path)
+    assert services.get_local_pdf_path(pdf_document) == pdf_document.file.path
+
+
+@pytest.mark.django_db
+def test_local_pdf_cache_downloads_from_remote_storage(monkeypatch, settings, tmp_path):
+    from django.core.files.base import ContentFile
+    from django.core.files.storage import InMemoryStorage
+    from apps.pdf_processor import services
+
+    # InMemoryStorage, like Cloudinary, has no absolute local path
+    storage = InMemoryStorage()
+    storage.save('pdfs/remote.pdf', ContentFile(b'%PDF-1.4 remote content'))
+    monkeypatch.setattr(PDFDocument._meta.get_field('file'), 'storage', storage)
+    settings.PDF_LOCAL_CACHE_DIR = str(tmp_path / 'cache')
+
+    pdf_document = PDFDocument.objects.create(
+        file='pdfs/remote.pdf',
+        original_filename='remote.pdf',
+        content_hash='abc123',
+    )
+    opened = []
+    original_open = storage.open
+    monkeypatch.setattr(storage, 'open', lambda *args, **kwargs: opened.append(args) or original_open(*args, **kwargs))
+
+    first = services.get_local_pdf_path(pdf_document)
+    second = services.get_local_pdf_path(pdf_document)
+
+    assert first == second == str(tmp_path / 'cache' / f'{pdf_document.pk}-abc123.pdf')
+    with open(first, 'rb') as cached_file:
+        assert cached_file.read() == b'%PDF-1.4 remote content'
+    assert len(opened) == 1
+
+
+@pytest.mark.django_db
+def test_uploaded_pdf_keeps_its_local_cache_entry_across_saves(monkeypatch, settings, tmp_path):
+    from django.core.files.storage import InMemoryStorage
+    from django.core.files.uploadedfile import SimpleUploadedFile
+    from rest_framework.test import APIClient
+    from apps.pdf_processor import services
+    from apps.users.models import CustomUser
+
+    storage = InMemoryStorage()
+    monkeypatch.setattr(PDFDocument._meta.get_field('file'), 'storage', storage)
+    settings.PDF_LOCAL_CACHE_DIR = str(tmp_path / 'cache')
+    content = b'%PDF-1.4 uploaded content'
+
+    client = APIClient()
+    client.force_authenticate(CustomUser.objects.create_user(email='admin@example.com', password='secret'))
+    response = client.post(
+        '/api/pdf-documents/',
+        {'file': SimpleUploadedFile('upload.pdf', content, content_type='application/pdf'), 'original_filename': 'upload.pdf'},
+        format='multipart',
+    )
+
+    assert response.status_code == 201
+    assert response.json()['content_hash'] == hashlib.sha256(content).hexdigest()
+
+    pdf_document = PDFDocument.objects.get(pk=response.json()['id'])
+    legacy_document = PDFDocument.objects.create(file=pdf_document.file.name, original_filename='legacy.pdf')
+    opened = []
+    original_open = storage.open
+    monkeypatch.setattr(storage, 'open', lambda *args, **kwargs: opened.append(args) or original_open(*args, **kwargs))
+
+    # Status saves between stages bump modified_at; documents without a hash are keyed by storage name
+    paths = []
+    for document in (pdf_document, legacy_document):
+        paths.append(services.get_local_pdf_path(document))
+        document.status = PDFStatus.PROCESSING
+        document.save()
+        assert services.get_local_pdf_path(PDFDocument.objects.get(pk=document.pk)) == paths[-1]
+
+    assert paths[0].endswith(f'{pdf_document.pk}-{pdf_document.content_hash}.pdf')
+    assert len(opened) == 2
+
+
+def test_local_pdf_cache_evicts_least_recently_used(tmp_path):
+    from apps.pdf_processor import services
+
+    cache = services.LocalPDFCache(directory=str(tmp_path), max_bytes=25)
+    for index, name in enumerate(['1-old.pdf', '2-mid.pdf', '3-new.pdf']):
+        path = tmp_path / name
+        path.write_bytes(b'x' * 10)
+        os.utime(path, (index, index))
+
+    cache._evict(keep=str(tmp_path / '3-new.pdf'))
+
+    assert sorted(os.listdir(tmp_path)) == ['2-mid.pdf', '3-new.pdf']
+
+
+@pytest.mark.django_db
+def test_process_action_queues_document_for_job_worker(monkeypatch):
+    from django.core.management import call_command
+    from rest_framework.test import APIClient
+    from apps.common.constants import JobStatus
+    from apps.common.models import Job
+    from apps.users.models import CustomUser
+    from apps.pdf_processor import services
+
+    pdf_doc = PDFDocument.objects.create(
+        file='pdfs/test.pdf',
+        original_filename='test.pdf',
+        status=PDFStatus.PENDING,
+    )
+
+    class FakeProcessor:
+        def __init__(self, pdf_document, **kwargs):
+            self.pdf_document = pdf_document
+
+        def process(self):
+            return None
+
+    class FakeParser:
+        def __init__(self, pdf_document, **kwargs):
+            self.pdf_document = pdf_document
+
+        def process_and_save(self):
+            return ExtractedData.objects.create(
+                pdf_document=self.pdf_document,
+                data_type=DataType.STRUCTURED_COMPANIES,
+                raw_data={'companies': [], 'total_count': 0},
+                processed=True,
+            )
+
+    class FakeSyncService:
+        def __init__(self, pdf_document, **kwargs):
+            self.pdf_document = pdf_document
+
+        def sync_companies(self, **kwargs):
+            return {'total_pdf_companies': 0, 'updated': 0, 'created': 0, 'errors': []}
+
+    monkeypatch.setattr(services, 'PDFProcessor', FakeProcessor)
+    monkeypatch.setitem(services.PARSER_REGISTRY, 'croatian_labor', FakeParser)
+    monkeypatch.setattr(services, 'CompanySyncService', FakeSyncService)
+
+    client = APIClient()
+    client.force_authenticate(CustomUser.objects.create_user(email='admin@example.com', password='secret'))
+    response = client.post(f'/api/pdf-documents/{pdf_doc.id}/process/', {'sync_mode': 'diff'}, format='json')
+
+    assert response.status_code == 202
+    job = Job.objects.get(pk=response.data['job_id'])
+    assert job.arguments == {'document_id': pdf_doc.id, 'workers': 1, 'sync_mode': 'diff'}
+    pdf_doc.refresh_from_db()
+    assert pdf_doc.status == PDFStatus.QUEUED
+
+    conflict = client.post(f'/api/pdf-documents/{pdf_doc.id}/process/', format='json')
+    assert conflict.status_code == 409
+
+    call_command('run_job_worker', once=True)
+
+    job.refresh_from_db()
+    pdf_doc.refresh_from_db()
+    assert job.status == JobStatus.SUCCEEDED
+    assert pdf_doc.status == PDFStatus.COMPLETED
+    assert list(pdf_doc.stage_progress) == ['process', 'parse', 'sync']
+    for stage in pdf_doc.stage_progress.values():
+        assert stage['status'] == PDFStatus.COMPLETED
+        assert stage['duration_seconds'] >= 0
+
+
+@pytest.mark.django_db
+def test_every_entry_point_defaults_to_the_configured_sync_mode(settings):
+    from rest_framework.test import APIClient
+    from apps.common.models import Job
+    from apps.pdf_processor.services import get_sync_mode
+    from apps.users.models import CustomUser
+
+    assert get_sync_mode() == 'diff'
+    settings.PDF_SYNC_MODE = 'chunked'
+    pdf_doc = PDFDocument.objects.create(file='pdfs/test.pdf', original_filename='test.pdf')
+
+    client = APIClient()
+    client.force_authenticate(CustomUser.objects.create_user(email='admin@example.com', password='secret'))
+    response = client.post(f'/api/pdf-documents/{pdf_doc.id}/process/', format='json')
+
+    assert response.status_code == 202
+    assert Job.objects.get(pk=response.data['job_id']).arguments['sync_mode'] == 'chunked'
+    assert PDFCronPipelineService(page_url='https://example.com', attribute_name='data-fileid').sync_mode == 'chunked'
+    assert get_sync_mode('full') == 'full'
+    with pytest.raises(ValueError):
+        get_sync_mode('everything')
+
+
+def test_run_many_downloads_concurrently_and_serializes_processing(monkeypatch):
+    import threading
+    import time
+    from apps.pdf_processor import services
+
+    active = {'downloads': 0, 'processing': 0}
+    peak = {'downloads': 0, 'processing': 0}
+    lock = threading.Lock()
+
+    def enter(kind):
+        with lock:
+            active[kind] += 1
+            peak[kind] = max(peak[kind], active[kind])
+
+    def leave(kind):
+        with lock:
+            active[kind] -= 1
+
+    class FakeScraper(FakeScraperBase):
+        def __init__(self, page_url, attribute_name=None, headers=None):
+            self.page_url = page_url
+            self.previous_document = None
+
+        async def download_and_create_document_async(self, **kwargs):
+            enter('downloads')
+            try:
+                await asyncio.sleep(0.05)
+            finally:
+                leave('downloads')
+            if 'broken' in self.page_url:
+                raise ValueError('No PDF link found')
+            return PDFDocument(id=len(self.page_url), scraped_url=self.page_url)
+
+    def fake_process_stages(self, pdf_document):
+        enter('processing')
+        try:
+            time.sleep(0.02)
+        finally:
+            leave('processing')
+        return {'status': PDFStatus.COMPLETED.value, 'sync': {'mode': self.sync_mode}}
+
+    monkeypatch.setattr(services, 'WebPDFScraper', FakeScraper)
+    monkeypatch.setattr(PDFCronPipelineService, '_record_download', lambda self, *args: None)
+    monkeypatch.setattr(PDFCronPipelineService, '_process_stages', fake_process_stages)
+
+    sources = [
+        {'page_url': f'https://example.com/list-{index}', 'attribute_name': 'data-fileid'}
+        for index in range(4)
+    ] + [{'page_url': 'https://example.com/broken', 'attribute_name': 'data-fileid'}]
+
+    result = asyncio.run(PDFCronPipelineService.run_many_async(sources, max_concurrency=2))
+
+    assert peak == {'downloads': 2, 'processing': 1}
+    assert result['total_sources'] == 5
+    assert (result['completed'], result['unchanged'], result['failed']) == (4, 0, 1)
+    assert [source['page_url'] for source in result['sources']] == [source['page_url'] for source in sources]
+    assert result['sources'][0]['sync'] == {'mode': 'diff'}
+    assert result['sources'][-1]['error'] == 'No PDF link found'
+
+
+def test_run_many_rejects_incomplete_source_config():
+    with pytest.raises(ValueError):
+        asyncio.run(PDFCronPipelineService.run_many_async([{'page_url': 'https://example.com'}]))
+
+
+def test_column_cleaner_matches_row_by_row_cleaning():
+    from apps.pdf_processor.benchmarks import legacy_clean_rows, make_synthetic_table
+    from apps.pdf_processor.cleaning import CompanyTableCleaner, merge_continuation_rows
+
+    tables = make_synthetic_table(3000, seed=7)
+    tables.append({'page_number': len(tables) + 1, 'rows': [
+        ['1.', 'Adresa Ulica d.o.o.', '123', 'Zagreb'],
+        ['2.', '   ', '456', 'Split'],
+        ['3.', 'ACME', '789', 'Rijeka', 'extra'],
+        [],
+    ]})
+    merged_rows = list(merge_continuation_rows(tables))
+
+    assert CompanyTableCleaner().clean(merged_rows) == legacy_clean_rows(merged_rows)
+
+
+def test_row_cleaning_benchmark_reports_throughput():
+    from apps.pdf_processor.benchmarks import benchmark_row_cleaning
+
+    result = benchmark_row_cleaning(rows=500, repeat=1)
+
+    assert result['rows'] > 0
+    assert 0 < result['companies'] < result['rows']
+    assert result['columnar_rows_per_second'] > 0
+
+
+@pytest.mark.django_db
+def test_stage_meter_counts_queries_and_resources():
+    from apps.pdf_processor.instrumentation import StageMeter
+
+    with StageMeter() as meter:
+        PDFDocument.objects.count()
+        PDFDocument.objects.exists()
+
+    assert meter.metrics['queries'] == 2
+    assert meter.metrics['duration_seconds'] >= 0
+    assert meter.metrics['cpu_seconds'] >= 0
+    assert meter.metrics['started_at'] <= meter.metrics['finished_at']
+
+
+def test_stage_meter_reports_stage_peak_after_a_larger_stage(monkeypatch):
+    import time
+    from apps.pdf_processor import instrumentation
+    from apps.pdf_processor.instrumentation import StageMeter
+
+    # The lifetime peak (ru_maxrss) stays at the first stage's 500 MiB
+    monkeypatch.setattr(instrumentation, 'peak_rss_kb', lambda: 500 * 1024)
+    rss = iter([100 * 1024, 140 * 1024, 120 * 1024])
+    monkeypatch.setattr(instrumentation, 'current_rss_kb', lambda: next(rss, 120 * 1024))
+    monkeypatch.setattr(StageMeter, 'sample_interval', 0.001)
+
+    with StageMeter() as meter:
+        time.sleep(0.05)
+
+    assert meter.metrics['peak_rss_kb'] == 140 * 1024
+    assert meter.metrics['peak_rss_delta_kb'] == 40 * 1024
+    assert 'children_peak_rss_kb' in meter.metrics
+
+
+@pytest.mark.django_db
+def test_pipeline_persists_per_stage_metrics(monkeypatch, settings, tmp_path):
+    from apps.pdf_processor import services
+    from apps.pdf_processor.constants import PipelineStage
+
+    settings.MEDIA_ROOT = str(tmp_path)
+    content = b'%PDF-1.4 metrics'
+    monkeypatch.setattr(
+        services,
+        'build_http_session',
+        lambda: FakeSession(lambda url, **kwargs: FakeResponse(content=content)),
+    )
+    monkeypatch.setattr(
+        services.WebPDFScraper,
+        'find_pdf_link',
+        lambda self: 'https://example.com/files/list.pdf',
+    )
+
+    class FakeProcessor:
+        def __init__(self, pdf_document, **kwargs):
+            self.pdf_document = pdf_document
+
+        def process(self):
+            return services.PDFExtractionResult(
+                content_hash='hash',
+                tables=[{'page_number': page, 'rows': []} for page in (1, 2, 3)],
+            )
+
+    class FakeParser:
+        def __init__(self, pdf_document, **kwargs):
+            self.pdf_document = pdf_document
+
+        def process_and_save(self):
+            return ExtractedData.objects.create(
+                pdf_document=self.pdf_document,
+                data_type=DataType.STRUCTURED_COMPANIES,
+                raw_data={
+                    'companies': [{'legal_name': 'ACME', 'legal_id': '123'}],
+                    'total_count': 1,
+                    'parse_stats': {'pages': [{'page_number': 1}, {'page_number': 2}]},
+                },
+                processed=True,
+            )
+
+    class FakeSyncService:
+        def __init__(self, pdf_document, **kwargs):
+            self.pdf_document = pdf_document
+
+        def sync_companies(self, **kwargs):
+            return {'total_pdf_companies': 1, 'created': 1, 'errors': []}
+
+    monkeypatch.setattr(services, 'PDFProcessor', FakeProcessor)
+    monkeypatch.setitem(services.PARSER_REGISTRY, 'croatian_labor', FakeParser)
+    monkeypatch.setattr(services, 'CompanySyncService', FakeSyncService)
+
+    result = PDFCronPipelineService.run_once(
+        page_url='https://example.com/pdfs',
+        attribute_name='data-fileid',
+    )
+
+    pdf_doc = PDFDocument.objects.get(id=result['pdf_document_id'])
+    stages = pdf_doc.stage_progress
+    assert list(stages) == [
+        PipelineStage.FIND_PDF_LINK,
+        PipelineStage.DOWNLOAD,
+        PipelineStage.PROCESS,
+        PipelineStage.PARSE,
+        PipelineStage.SYNC,
+    ]
+    for metrics in stages.values():
+        assert metrics['status'] == PDFStatus.COMPLETED
+        assert {'duration_seconds', 'cpu_seconds', 'peak_rss_delta_kb', 'queries'} <= set(metrics)
+
+    assert stages[PipelineStage.DOWNLOAD]['bytes_downloaded'] == len(content)
+    assert stages[PipelineStage.DOWNLOAD]['queries'] > 0
+    assert stages[PipelineStage.PROCESS]['pages'] == 3
+    assert stages[PipelineStage.PARSE]['pages'] == 2
+    assert stages[PipelineStage.PARSE]['companies'] == 1
+    assert stages[PipelineStage.SYNC]['companies'] == 1
+    assert result['stages'] == stages
+
+
+@pytest.mark.django_db
+def test_pipeline_benchmark_command_reports_and_rolls_back(tmp_path):
+    import json
+    from io import StringIO
+    from django.core.management import call_command
+    from apps.companies.models import Company
+
+    output = tmp_path / 'benchmark.json'
+    call_command(
+        'benchmark_pdf_pipeline',
+        '--pages', '2',
+        '--rows-per-page', '5',
+        '--companies', '30',
+        '--output', str(output),
+        stdout=StringIO(),
+    )
+
+    report = json.loads(output.read_text())
+    entries = {entry['benchmark']: entry for entry in report['results']}
+    assert list(entries) == ['extract', 'parse', 'sync_new', 'sync_existing']
+    assert entries['extract']['pages'] == 2
+    assert entries['extract']['rows'] == 10
+    assert entries['parse']['rows'] == 10
+    assert entries['sync_new']['rows'] == 30
+    assert all(entry['queries'] is not None for entry in report['results'])
+    assert PDFDocument.objects.count() == 0
+    assert Company.objects.count() == 0
+
+    compared = StringIO()
+    call_command(
+        'benchmark_pdf_pipeline', '--pages', '1', '--rows-per-page', '5', '--companies',
+        '--compare', str(output), stdout=compared,
+    )
+    assert '"comparison"' in compared.getvalue()
+
+
+def _fake_ministry_tables(self):
+    yield {
+        'page_number': 1,
+        'rows': [
+            ['1', 'ACME d.o.o.', '12345678901', 'Ilica 1'],
+            ['2', 'BETA obrt', '10987654321', 'Split'],
+        ],
+    }
+
+
+@pytest.mark.django_db
+def test_resume_after_failed_sync_reuses_parsed_companies(monkeypatch, pdf_doc_on_disk):
+    from apps.companies.models import Company
+    from apps.pdf_processor import services
+    from apps.pdf_processor.constants import PipelineCheckpoint
+
+    monkeypatch.setattr(services.PDFExtractor, 'iter_tables', _fake_ministry_tables)
+    services.PDFExtractionCache.clear()
+
+    def failing_sync(self, **kwargs):
+        raise RuntimeError('database went away')
+
+    monkeypatch.setattr(services.CompanySyncService, 'sync_companies', failing_sync)
+    with pytest.raises(RuntimeError):
+        PDFCronPipelineService.process_document(pdf_doc_on_disk.id)
+
+    pdf_doc_on_disk.refresh_from_db()
+    assert pdf_doc_on_disk.status == PDFStatus.FAILED
+    assert pdf_doc_on_disk.checkpoint == PipelineCheckpoint.PARSED
+    assert not pdf_doc_on_disk.extracted_data.filter(data_type=DataType.RAW_TABLES).exists()
+
+    monkeypatch.undo()
+    monkeypatch.setattr(
+        services.PDFExtractor,
+        'iter_tables',
+        lambda self: pytest.fail('resume must not extract the PDF again'),
+    )
+    parsed_id = pdf_doc_on_disk.extracted_data.get(data_type=DataType.STRUCTURED_COMPANIES).id
+
+    result = PDFCronPipelineService.process_document(pdf_doc_on_disk.id, resume=True)
+
+    pdf_doc_on_disk.refresh_from_db()
+    assert result['resumed'] is True
+    assert result['sync']['created'] == 2
+    assert pdf_doc_on_disk.status == PDFStatus.COMPLETED
+    assert pdf_doc_on_disk.checkpoint == PipelineCheckpoint.SYNCED
+    assert pdf_doc_on_disk.extracted_data.get(data_type=DataType.STRUCTURED_COMPANIES).id == parsed_id
+    assert Company.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_resume_after_failed_parse_loads_persisted_tables(monkeypatch, pdf_doc_on_disk):
+    from apps.pdf_processor import services
+    from apps.pdf_processor.constants import PipelineCheckpoint
+
+    monkeypatch.setattr(services.PDFExtractor, 'iter_tables', _fake_ministry_tables)
+    services.PDFExtractionCache.clear()
+
+    def failing_parse(self, collect_stats=True):
+        raise RuntimeError('parser bug')
+
+    monkeypatch.setattr(services.CroatianLaborPDFParser, 'parse', failing_parse)
+    with pytest.raises(RuntimeError):
+        PDFCronPipelineService.process_document(pdf_doc_on_disk.id)
+
+    pdf_doc_on_disk.refresh_from_db()
+    assert pdf_doc_on_disk.checkpoint == PipelineCheckpoint.EXTRACTED
+    raw_tables = pdf_doc_on_disk.extracted_data.get(data_type=DataType.RAW_TABLES)
+    assert isinstance(raw_tables.raw_data['tables'], str)  # compressed
+
+    # A new worker process: nothing cached in memory, and extraction must not run
+    monkeypatch.undo()
+    services.PDFExtractionCache.clear()
+    monkeypatch.setattr(
+        services.PDFExtractor,
+        'iter_tables',
+        lambda self: pytest.fail('resume must not extract the PDF again'),
+    )
+
+    result = PDFCronPipelineService.process_document(pdf_doc_on_disk.id, resume=True)
+
+    pdf_doc_on_disk.refresh_from_db()
+    assert result['companies_extracted'] == 2
+    assert pdf_doc_on_disk.checkpoint == PipelineCheckpoint.SYNCED
+    assert not pdf_doc_on_disk.extracted_data.filter(data_type=DataType.RAW_TABLES).exists()
+
+
+@pytest.mark.django_db
+def test_raw_tables_are_dropped_after_parsing_and_not_served_by_the_api(monkeypatch, pdf_doc_on_disk):
+    from rest_framework.test import APIClient
+    from apps.pdf_processor import services
+    from apps.users.models import CustomUser
+
+    monkeypatch.setattr(services.PDFExtractor, 'iter_tables', _fake_ministry_tables)
+    services.PDFExtractionCache.clear()
+
+    stored = []
+    original_persist = services.PDFExtractionCache.persist
+    monkeypatch.setattr(
+        services.PDFExtractionCache,
+        'persist',
+        lambda pdf_document, result: stored.append(pdf_document.pk) or original_persist(pdf_document, result),
+    )
+    PDFCronPipelineService.process_document(pdf_doc_on_disk.id)
+
+    assert stored == [pdf_doc_on_disk.pk]
+    assert not pdf_doc_on_disk.extracted_data.filter(data_type=DataType.RAW_TABLES).exists()
+
+    # Left over from a checkpointed run that failed before parsing
+    ExtractedData.objects.create(pdf_document=pdf_doc_on_disk, data_type=DataType.RAW_TABLES, raw_data={'tables': []})
+    client = APIClient()
+    client.force_authenticate(CustomUser.objects.create_user(email='admin@example.com', password='secret'))
+    response = client.get(f'/api/pdf-documents/{pdf_doc_on_disk.id}/')
+
+    assert response.status_code == 200
+    assert [data['data_type'] for data in response.json()['extracted_data']] == [DataType.STRUCTURED_COMPANIES]
+
+
+@pytest.mark.django_db
+def test_failed_pipeline_job_releases_its_document():
+    from apps.common.constants import JobStatus
+
+    pdf_doc = PDFDocument.objects.create(file='pdfs/test.pdf', original_filename='test.pdf')
+    job = PDFCronPipelineService.enqueue_document(pdf_doc)
+    pdf_doc.refresh_from_db()
+    assert pdf_doc.status == PDFStatus.QUEUED
+
+    job.status = JobStatus.FAILED
+    job.error_message = 'Worker stopped responding; gave up after 3 attempt(s).'
+    job.save()
+
+    pdf_doc.refresh_from_db()
+    assert pdf_doc.status == PDFStatus.FAILED
+    assert pdf_doc.error_message == job.error_message
@@ -1,6 +1,11 @@
-from rest_framework import viewsets
-from rest_framework.parsers import MultiPartParser, FormParser
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.parsers import JSONParser, MultiPartParser, FormParser
+from rest_framework.response import Response
+from .constants import CompanyPayloadFormat, DataType, PDFStatus, SyncMode
 from .models import PDFDocument, ExtractedData
+from .services import PDFCronPipelineService
 from .serializers import (
     PDFDocumentSerializer,
     PDFDocumentListSerializer,
@@ -18,6 +23,60 @@ class PDFDocumentViewSet(viewsets.ModelViewSet):
             return PDFDocumentListSerializer
         return PDFDocumentSerializer
 
+    @action(detail=True, methods=['post'], parser_classes=[JSONParser, FormParser])
+    def process(self, request, pk=None):
+        """
+        Queue the document for processing and return immediately with the job id.
+
+        Pass "sync_mode" to override settings.PDF_SYNC_MODE, "resume": true to
+        continue after the document's last checkpoint, and "sync_batch_size"
+        to size the company sync's batches.
+        """
+        pdf_document = self.get_object()
+
+        if pdf_document.status in (PDFStatus.QUEUED, PDFStatus.PROCESSING):
+            return Response(
+                {'detail': f'Document is already {pdf_document.status}.'},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        sync_mode = request.data.get('sync_mode') or None
+        if sync_mode is not None and sync_mode not in SyncMode.values:
+            return Response(
+                {'sync_mode': [f'Must be one of: {", ".join(SyncMode.values)}.']},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        sync_batch_size = request.data.get('sync_batch_size')
+        if sync_batch_size is not None:
+            try:
+                sync_batch_size = int(sync_batch_size)
+            except (TypeError, ValueError):
+                sync_batch_size = 0
+            if sync_batch_size < 1:
+                return Response(
+                    {'sync_batch_size': ['Must be a positive integer.']},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        resume = str(request.data.get('resume', '')).lower() in ('1', 'true')
+        job = PDFCronPipelineService.enqueue_document(
+            pdf_document,
+            sync_mode=sync_mode,
+            resume=resume,
+            sync_batch_size=sync_batch_size,
+        )
+        return Response(
+            {'job_id': job.id, 'pdf_document_id': pdf_document.id, 'status': pdf_document.status},
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
+class ExtractedCompanyPagination(PageNumberPagination):
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+
 
 class ExtractedDataViewSet(viewsets.ReadOnlyModelViewSet):
     """ViewSet for viewing extracted data."""
@@ -35,3 +94,27 @@ class ExtractedDataViewSet(viewsets.ReadOnlyModelViewSet):
             queryset = queryset.filter(data_type=data_type)
 
         return queryset
+
+    @action(detail=True, methods=['get'])
+    def companies(self, request, pk=None):
+        """
+        Page through the stored companies.
+
+        Companies stored in the table payload format are read one page at a
+        time from ExtractedCompanyRow; other formats are decoded first.
+        """
+        extracted_data = self.get_object()
+        if extracted_data.data_type != DataType.STRUCTURED_COMPANIES:
+            return Response(
+                {'detail': 'Only structured company data has companies.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        paginator = ExtractedCompanyPagination()
+        if extracted_data.payload_format == CompanyPayloadFormat.TABLE:
+            schema = extracted_data.raw_data['schema']
+            rows = paginator.paginate_queryset(extracted_data.company_rows.all(), request, view=self)
+            companies = [row.as_dict(schema) for row in rows]
+        else:
+            companies = paginator.paginate_queryset(extracted_data.get_companies(), request, view=self)
+        return paginator.get_paginated_response(companies)
@@ -29,6 +29,14 @@ class Review(BaseModel):
             models.UniqueConstraint(fields=['company', 'reviewer'], name="unique_reviewer_per_company"),
         ]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Stored values, so the rating signals can undo them on update and delete
+        instance._loaded_rating = instance.__dict__.get("rating")
+        instance._loaded_company_id = instance.__dict__.get("company_id")
+        return instance
+
     def __str__(self):
         return " - ".join([self.company.display_name, (self.reviewer.display_name or "Anonymous")])
 
@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/4.0/ref/settings/
 from pathlib import Path
 from dotenv import load_dotenv
 import os
+import tempfile
 
 load_dotenv()
 
@@ -65,6 +66,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     'rest_framework',
     'rest_framework.authtoken',
@@ -198,6 +200,23 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Local copies of PDFs kept in remote storage (e.g. Cloudinary), used for extraction
+PDF_LOCAL_CACHE_DIR = os.environ.get('PDF_LOCAL_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'expats-pdf-cache'))
+PDF_LOCAL_CACHE_MAX_BYTES = int(os.environ.get('PDF_LOCAL_CACHE_MAX_BYTES', 200 * 1024 * 1024))
+
+# How parsed companies are stored in ExtractedData: rows, columnar, columnar_zlib or table
+PDF_COMPANY_PAYLOAD_FORMAT = os.environ.get('PDF_COMPANY_PAYLOAD_FORMAT', 'rows')
+
+# Company sync mode used when a run does not choose one (API, admin, command, cron): full, diff or chunked
+PDF_SYNC_MODE = os.environ.get('PDF_SYNC_MODE', 'diff')
+
+# Workers bump the heartbeat of a running job this often; jobs without a
+# heartbeat for JOB_STALE_AFTER_SECONDS are taken to be abandoned by their
+# worker and requeued, until they have been claimed JOB_MAX_ATTEMPTS times
+JOB_HEARTBEAT_INTERVAL_SECONDS = int(os.environ.get('JOB_HEARTBEAT_INTERVAL_SECONDS', 60))
+JOB_STALE_AFTER_SECONDS = int(os.environ.get('JOB_STALE_AFTER_SECONDS', 600))
+JOB_MAX_ATTEMPTS = int(os.environ.get('JOB_MAX_ATTEMPTS', 3))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.0/ref/settings/#default-auto-field
 